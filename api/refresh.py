@@ -16,12 +16,10 @@ import requests
 import base64
 import json
 import urllib.parse
-from flask import Flask, request
 import webbrowser
 import dotenv
 import os
 from pathlib import Path
-from werkzeug.serving import run_simple
 import time
 import threading
 import signal
@@ -36,7 +34,6 @@ sys.path.append(str(base_dir))
 from logger import logger
 
 env_file = base_dir / ".env"    
-app = Flask(__name__)
 
 def load_credentials(env_path: Path):
     """Load credentials from the given .env file."""
@@ -167,11 +164,28 @@ class SpotifyAuth:
         return creds["REFRESH_TOKEN"]
    
    
+def create_app():
+    """Creates the server that handles the redirect from the authorization url.
+        Flask is only imported here, since it's only needed for the first authorization.
+    """
+    from flask import Flask, request
+
+    app = Flask(__name__)
+
+    @app.route('/callback')
+    def callback():
+        """The website that handles the redirect from the authorization url."""
+        save_refresh_token(request.args.get('code'))
+        return "Authorization complete. You can close this window."
+
+    return app
+
 def run_server():
-    run_simple("127.0.0.1", 5000, app, threaded=True)  
+    from werkzeug.serving import run_simple
+
+    run_simple("127.0.0.1", 5000, create_app(), threaded=True)  
          
-def save_refresh_token():
-    code = request.args.get('code')
+def save_refresh_token(code: str):
     creds = load_credentials(env_file)
     CLIENT_ID = creds["CLIENT_ID"]
     CLIENT_SECRET = creds["CLIENT_SECRET"]
@@ -184,18 +198,11 @@ def save_refresh_token():
         save_to_env("REFRESH_TOKEN", refresh_token)
     
     if access_token:
-        logger.info(f"refresh.callback: Access Token: {access_token}")
-        logger.info(f"refresh.callback: Refresh Token: {refresh_token}")
+        logger.info("refresh.callback: Got the access and refresh tokens.")
 
         new_access_token = spotify_auth.refresh(refresh_token)
         if new_access_token:
-            logger.info(f"refresh.callback: New Access Token: {new_access_token}")
-            
-@app.route('/callback')
-def callback():
-    """The website that handles the redirect from the authorization url."""
-    save_refresh_token()
-    return "Authorization complete. You can close this window."
+            logger.info("refresh.callback: Refreshed the access token.")
 
 def save_to_env(name: str, value: str) -> None:
     """Saves the given name with the given value to the .env file.
@@ -240,11 +247,11 @@ if __name__ == "__main__":
     if not REFRESH_TOKEN:
         auth_url = spotify_auth.get_authorization_url()
         webbrowser.open(auth_url)
-        app.run("127.0.0.1", 5000)
+        create_app().run("127.0.0.1", 5000)
     else:
         new_access_token = spotify_auth.refresh(REFRESH_TOKEN)
         if new_access_token:
-            logger.info(f"refresh: {new_access_token=}")
+            logger.info("refresh: Refreshed the access token.")
         else:
             logger.error("refresh: Failed to refresh access token.")
     
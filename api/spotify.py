@@ -19,8 +19,17 @@ from api.spotify_client import SpotifyClient
 import threading
 import webbrowser
 from logger import logger
+import tracing
+from media import select_cover_url
 from typing import Union, Any
 from multiprocessing import Process
+
+# A failed token request is retried after RETRY_DELAY seconds, doubling up to MAX_RETRY_DELAY.
+RETRY_DELAY = 5
+MAX_RETRY_DELAY = 300
+REFRESH_INTERVAL = 3500
+# How long `wait_until_ready` waits by default, the first authorization happens in the browser.
+READY_TIMEOUT = 60
     
 class Spotify():
     _instance = None
@@ -34,17 +43,28 @@ class Spotify():
         return cls._instance
     
     def __init__(self) -> None:
-        """A class that controls Spotify."""
-        if not hasattr(self, "initialized"):
-            self.initialized = True
-            token = self.refresh()
-            self.spotify_client = SpotifyClient(token)
-            threading.Thread(target=self.refresh_client, daemon=True).start()
-            
-        self.__volume = self.get_volume()
-        if not self.__volume:
-            self.__volume = 50
+        """A class that controls Spotify.
+            The access token is fetched in the background, so creating it never blocks. 
+            Every request waits until the client is ready, see `wait_until_ready`.
+        """
+        if hasattr(self, "initialized"):
+            return
+        self.initialized = True
+        self.__ready = threading.Event()
+        self.__spotify_client: Union[SpotifyClient, None] = None
+        self.__volume = 50
+        threading.Thread(target=self.refresh_client, daemon=True).start()
         
+    @property
+    def spotify_client(self) -> SpotifyClient:
+        self.__ready.wait()
+        return self.__spotify_client
+    
+    def wait_until_ready(self, timeout: Union[float, None] = READY_TIMEOUT) -> bool:
+        """Waits until the access token was fetched, at most `timeout` seconds. Returns whether the client is ready."""
+        return self.__ready.wait(timeout)
+        
+    @tracing.traced("token refresh", "spotify")
     def refresh(self) -> str:
         """Refreshes the clients' access token."""
         creds = load_credentials(env_file)
@@ -57,13 +77,37 @@ class Spotify():
         return spotify_auth.refresh(REFRESH_TOKEN)
         
     def refresh_client(self) -> None:
-        """Refreshes the SpotifyClient access token."""
+        """Creates the SpotifyClient, and refreshes its' access token every hour.
+            A failure of any kind is retried with backoff, so the thread never ends.
+        """
+        self.__spotify_client = SpotifyClient(self.__refresh_with_retries())
+        self.__ready.set()
+        try:
+            self.__volume = self.get_volume() or 50
+        except Exception as e:
+            logger.error(f"Spotify.refresh_client: Failed to get the volume: {e}")
+        logger.info("Spotify.refresh_client: Client ready.")
+        
         while True:
-            time.sleep(3500)
+            time.sleep(REFRESH_INTERVAL)
             
-            token = self.refresh()
-            self.spotify_client = SpotifyClient(token)
+            # The client is a singleton, so the new token is set on it rather than passed to a new one.
+            self.__spotify_client.access_token = self.__refresh_with_retries()
             logger.info("Spotify.refresh_client: Client refreshed.")
+            
+    def __refresh_with_retries(self) -> str:
+        """Returns a new access token, retrying until one is fetched."""
+        delay = RETRY_DELAY
+        while True:
+            try:
+                token = self.refresh()
+                if not token:
+                    raise ValueError("No access token in the response")
+                return token
+            except Exception as e:
+                logger.error(f"Spotify.refresh_client: Failed to get an access token, retrying in {delay}s: {e}")
+                time.sleep(delay)
+                delay = min(delay * 2, MAX_RETRY_DELAY)
         
     def open_spotify_app(self) -> bool:
         """Opens the spotify app.
@@ -194,6 +238,12 @@ class Spotify():
         
         return None
 
+    def take_snapshot(self) -> Union[dict[str, Any], None]:
+        """Fetches the whole player state in a single request. The player reads in the next few seconds
+            are answered from it, instead of a request each.
+        """
+        return self.spotify_client.take_snapshot()
+
     def get_current_playing_track(self) -> Union[dict[str, Any], None]:
         """Gets the current playing tracks data.
 
@@ -224,9 +274,21 @@ class Spotify():
         self.__volume = self.spotify_client.set_volume(volume)
         return self.__volume
         
-    def get_cover_url(self) -> str:
-        """Gets the cover_url of the current playing track"""
-        return self.spotify_client.get_cover_url()
+    def get_cover_url(self, target_size: Union[int, None] = None) -> Union[str, None]:
+        """Gets the cover_url of the current playing track. 
+            If target_size is given, picks the smallest variant that is at least that size.
+        """
+        if target_size is None:
+            return self.spotify_client.get_cover_url()
+        return select_cover_url(self.get_cover_images(), target_size)
+    
+    def get_album(self) -> Union[dict[str, Any], None]:
+        """Gets the album of the current playing track"""
+        return self.spotify_client.get_album()
+    
+    def get_cover_images(self) -> Union[list[dict[str, Any]], None]:
+        """Gets every size variant of the current playing tracks' cover"""
+        return self.spotify_client.get_cover_images()
     
     def get_queue(self) -> list:
         """Gets the queue of the current playing device"""
@@ -14,7 +14,9 @@
 
 import requests
 import threading
+import time
 from logger import logger
+import tracing
 from typing import Any, Union
 import os
 
@@ -22,6 +24,9 @@ REPEAT_OFF = "off"
 REPEAT_CONTEXT = "context"
 REPEAT_TRACK = "track"
 
+# How long the player reads are answered from a snapshot, see `SpotifyClient.take_snapshot`.
+SNAPSHOT_TTL = 3
+
 
 class SpotifyClient():
     """The backend client of spotify."""
@@ -41,6 +46,7 @@ class SpotifyClient():
     def __init__(self, access_token: str):
         if not hasattr(self, "_initialized"):
             self.access_token = access_token
+            self.__snapshot: Union[tuple[float, dict[str, Any]], None] = None
             self._initialized = True
         
     def _increment_request_count(self, function):
@@ -52,6 +58,65 @@ class SpotifyClient():
             if SpotifyClient._request_count % 100 == 0:
                 logger.info(f"SpotifyClient._increment_request_count: Total requests made: {SpotifyClient._request_count}")
         
+    def take_snapshot(self) -> Union[dict[str, Any], None]:
+        """Gets the whole player state in a single request, and answers the player reads of the next
+            `SNAPSHOT_TTL` seconds from it. Used at startup, where every view reads the player once.
+
+        returns
+        -------
+        dict : The player state, or None if there is no active device.
+        """
+        self.__snapshot = None
+        state = self._get_player(self.take_snapshot)
+        if state is not None:
+            self.__snapshot = (time.monotonic(), state)
+        return state
+
+    def _after_write(self, response: requests.Response) -> bool:
+        """Drops the snapshot after a successful write to the player, its' state is stale from then on.
+
+        returns
+        -------
+        bool : Returns whether or not the write succeeded.
+        """
+        if response.ok:
+            self.__snapshot = None
+        return response.ok
+
+    def _get_player(self, function) -> Union[dict[str, Any], None]:
+        """Gets the player state, from the snapshot while it's fresh.
+
+        returns
+        -------
+        dict : The player state, or None if there is no active device.
+        """
+        snapshot = self.__snapshot
+        if snapshot is not None:
+            taken, state = snapshot
+            elapsed = time.monotonic() - taken
+            if elapsed < SNAPSHOT_TTL:
+                state = dict(state)
+                if state.get("is_playing") and state.get("progress_ms") is not None:
+                    state["progress_ms"] += int(elapsed * 1000)
+                return state
+            self.__snapshot = None
+        
+        self._increment_request_count(function)
+        
+        url = "https://api.spotify.com/v1/me/player"
+        with tracing.span("GET /me/player", "spotify", caller=function.__name__):
+            response = requests.get(
+                url,
+                headers={
+                    "Authorization": f"Bearer {self.access_token}"
+                }
+            )
+
+        if not response.text.strip():
+            return None
+        return response.json()
+        
+    @tracing.traced(category="spotify")
     def play(self) -> bool:
         """Lets you start/resume playback.
 
@@ -89,8 +154,9 @@ class SpotifyClient():
                 "Authorization": f"Bearer {self.access_token}"
             }
         )
-        return response.ok
+        return self._after_write(response)
         
+    @tracing.traced(category="spotify")
     def pause(self) -> bool:
         """Lets you pause playback.
 
@@ -110,44 +176,24 @@ class SpotifyClient():
             }
         )
         
-        return response.ok
+        return self._after_write(response)
     
     def is_player_active(self) -> bool:
         """Checks whether or not the player is active."""
-        self._increment_request_count(self.is_player_active)
-        
-        url = "https://api.spotify.com/v1/me/player"
-        response = requests.get(
-            url,
-            headers={
-                "Authorization": f"Bearer {self.access_token}"
-            }
-        )
-
-        if not response.text.strip():
+        data = self._get_player(self.is_player_active)
+        if data is None:
             return None
             
-        data = response.json()
         if data and 'is_playing' in data:
             return True if data['is_playing'] else False
         return False
     
     def is_shuffle_active(self) -> Union[bool, None]:
         """Checks whether or not the shuffle is active"""
-        self._increment_request_count(self.is_shuffle_active)
-        
-        url = "https://api.spotify.com/v1/me/player"
-        response = requests.get(
-            url,
-            headers={
-                "Authorization": f"Bearer {self.access_token}"
-            }
-        )
-
-        if not response.text.strip():
+        data = self._get_player(self.is_shuffle_active)
+        if data is None:
             return None
         
-        data = response.json()
         if data and 'shuffle_state' in data:
             return True if data['shuffle_state'] else False
         return None
@@ -159,20 +205,10 @@ class SpotifyClient():
             -------
             str | None : `off`, `context`, `track`. None if no active device found.
         """
-        self._increment_request_count(self.get_repeat_mode)
-        
-        url = "https://api.spotify.com/v1/me/player"
-        response = requests.get(
-            url,
-            headers={
-                "Authorization": f"Bearer {self.access_token}"
-            }
-        )
-        
-        if not response.text.strip():
+        data = self._get_player(self.get_repeat_mode)
+        if data is None:
             return None
 
-        data = response.json()
         if data and 'repeat_state' in data:
             repeat_mode = data['repeat_state']
             if repeat_mode == "off":
@@ -183,6 +219,7 @@ class SpotifyClient():
                 return "track"
         return None
     
+    @tracing.traced(category="spotify")
     def skip_to_next(self) -> bool:
         """Lets you skip to the next song in queue.
 
@@ -203,8 +240,9 @@ class SpotifyClient():
             }
         )
     
-        return response.ok
+        return self._after_write(response)
     
+    @tracing.traced(category="spotify")
     def skip_to_previous(self) -> bool:
         """Lets you skip to the previous song played (queue exculded).
 
@@ -224,8 +262,9 @@ class SpotifyClient():
             }
         )
     
-        return response.ok
+        return self._after_write(response)
     
+    @tracing.traced(category="spotify")
     def set_repeat_mode(self, repeat: str) -> bool:
         """Sets the repeat mode for playback.
         
@@ -253,8 +292,9 @@ class SpotifyClient():
             params={"state": repeat}
         )
         
-        return response.ok
+        return self._after_write(response)
     
+    @tracing.traced(category="spotify")
     def set_shuffle_mode(self, shuffle: bool) -> bool:
         """Sets the shuffle mode for playback.
 
@@ -278,7 +318,7 @@ class SpotifyClient():
             params={"state": str(shuffle).lower()}  # Spotify API expects 'true' or 'false' as string
         )
         
-        return response.ok
+        return self._after_write(response)
 
     def get_playback_state_ms(self) -> Union[int, None]:
         """Gets the playback state in ms.
@@ -287,23 +327,10 @@ class SpotifyClient():
         -------
         int : Returns the playback state in miliseconds.
         """
-        self._increment_request_count(self.get_playback_state_ms)
-        
-        url = "https://api.spotify.com/v1/me/player"
-        
-        response = requests.get(
-            url,
-            headers={
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {self.access_token}"
-            }
-        )
-    
-        if not response.text.strip():
+        response_json = self._get_player(self.get_playback_state_ms)
+        if response_json is None:
             return None
         
-        response_json = response.json()
-        
         return response_json.get("progress_ms", 0)
     
     def get_song_length_ms(self) -> Union[int, None]:
@@ -313,28 +340,16 @@ class SpotifyClient():
         -------
         int : Returns the song length in milliseconds, or None if unavailable.
         """
-        self._increment_request_count(self.get_song_length_ms)
-        
-        url = "https://api.spotify.com/v1/me/player"
-        
-        response = requests.get(
-            url,
-            headers={
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {self.access_token}"
-            }
-        )
-
-        if not response.text.strip():
+        response_json = self._get_player(self.get_song_length_ms)
+        if response_json is None:
             return None
         
-        response_json = response.json()
-        
         if "item" in response_json and response_json["item"] is not None:
             return response_json["item"]["duration_ms"]
         
         return None
     
+    @tracing.traced(category="spotify")
     def set_playback_state_ms(self, ms: int) -> bool:
         """Sets the playback state with miliseconds.
         
@@ -355,8 +370,9 @@ class SpotifyClient():
             params={"position_ms": ms}
         )
         
-        return response.ok
+        return self._after_write(response)
         
+    @tracing.traced(category="spotify")
     def get_current_playing_track(self) -> Union[dict[str, Any], None]:
         """Gets the current playing tracks data.
 
@@ -364,6 +380,11 @@ class SpotifyClient():
         -------
         dict : The json with all of the tracks data.
         """
+        # The player state is a superset of the currently playing track.
+        snapshot = self.__snapshot
+        if snapshot is not None and time.monotonic() - snapshot[0] < SNAPSHOT_TTL:
+            return self._get_player(self.get_current_playing_track)
+        
         self._increment_request_count(self.get_current_playing_track)
         
         url = "https://api.spotify.com/v1/me/player/currently-playing"
@@ -445,27 +466,16 @@ class SpotifyClient():
         -------
         int : Returns the current volume level in percentage, or None if unavailable.
         """
-        self._increment_request_count(self.get_volume)
-       
-        url = "https://api.spotify.com/v1/me/player"
-        
-        response = requests.get(
-            url,
-            headers={
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {self.access_token}"
-            }
-        )
-        
-        if not response.text.strip():
+        response_json = self._get_player(self.get_volume)
+        if response_json is None:
             return None
-        response_json = response.json()
         
         if "device" in response_json and response_json["device"] is not None:
             return response_json["device"].get("volume_percent")
         
         return None
     
+    @tracing.traced(category="spotify")
     def set_volume(self, volume: int) -> bool:
         """Sets the volume level for playback.
 
@@ -511,7 +521,7 @@ class SpotifyClient():
             params={"volume_percent": volume}
         )
         
-        return response.ok
+        return self._after_write(response)
     
     def transfer_volume(self, volume: int, device_id: str) -> bool:
         """Sets the playback volume on the specified device.
@@ -540,7 +550,7 @@ class SpotifyClient():
             params=params,
             json=json_data
         )
-        return response.ok
+        return self._after_write(response)
 
     
     def get_active_device_id(self) -> Union[str, None]:
@@ -602,7 +612,34 @@ class SpotifyClient():
             },
             json={"device_ids": [device_id], "play": False}
         )
-        return response.ok
+        return self._after_write(response)
+
+    def get_album(self) -> Union[dict[str, Any], None]:
+        """Gets the album of the currently playing track.
+
+        returns
+        -------
+        dict : The album object (`id`, `name`, `images`, ...), or None if unavailable.
+        """
+        track = self.get_current_playing_track()
+        if not track:
+            return None
+        
+        return (track.get("item") or {}).get("album") or None
+
+    def get_cover_images(self) -> Union[list[dict[str, Any]], None]:
+        """Gets all of the album image variants of the currently playing track.
+
+        returns
+        -------
+        list : The album images (`url`, `width` and `height`), usually largest first, or None if unavailable.
+        """
+        self._increment_request_count(self.get_cover_images)
+        
+        album = self.get_album()
+        if not album:
+            return None
+        return album.get("images") or None
 
     def get_cover_url(self) -> Union[str, None]:
         """Gets the album image URL of the currently playing track.
@@ -611,20 +648,13 @@ class SpotifyClient():
         
             str: URL of the album image, or None if unavailable.
         """
-        self._increment_request_count(self.get_cover_url)
-        
-        track = self.get_current_playing_track()
-        if not track:
-            return None
-        
-        # Check if the 'album' field and 'images' are available.
-        album = track.get("item", {}).get("album", {})
-        images = album.get("images", [])
+        images = self.get_cover_images()
         if images:
-            # Return the last image (usually the lowest resolution).
+            # Return the first image (usually the highest resolution).
             return images[0].get("url")
         return None
 
+    @tracing.traced(category="spotify")
     def get_queue(self) -> list:
         """Gets the current playback queue.
 
@@ -651,6 +681,7 @@ class SpotifyClient():
         # The 'queue' field contains the list of tracks in the playback queue.
         return queue_data.get("queue", [])
     
+    @tracing.traced(category="spotify")
     def get_recently_played(self, limit=20) -> Union[list, None]:
         """Gets a list of recently played tracks.
 
@@ -0,0 +1,79 @@
+# Copyright 2026 Sagi Tsafrir
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Times loading the config from the cache against reading and parsing the file, and checks the watcher picks up edits.
+
+Run from the base folder of the app: `python -m benchmarks.config_reload`
+Exits with a non zero status if a check fails.
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+import timeit
+from pathlib import Path
+
+import config
+from config import Config, DEFAULT_LINES, changed_fields, load_config, parse_config, reload_config, watch_config
+
+RUNS = 2000
+
+def main() -> int:
+    config.logger.disabled = True
+    ok = True
+
+    def check(name: str, passed: bool) -> None:
+        nonlocal ok
+        ok &= passed
+        print(f"  {name:<48} {'ok' if passed else 'FAILED'}")
+
+    with tempfile.TemporaryDirectory() as temp:
+        path = Path(temp) / "config.ini"
+
+        default = load_config(path)
+        check("a new file has every key", all(line.split("=")[0] in path.read_text() for line in DEFAULT_LINES))
+        check("an empty buttons_color is None", default.buttons_color is None)
+        check("the new file's values", default == Config(background_mode="song"))
+
+        text = path.read_text()
+        parse = timeit.timeit(lambda: parse_config(path.read_text()), number=RUNS) / RUNS
+        stat = timeit.timeit(lambda: reload_config(path), number=RUNS) / RUNS
+        cached = timeit.timeit(lambda: load_config(path), number=RUNS) / RUNS
+        print(f"  read and parse {parse * 1e6:.1f}us, unchanged reload {stat * 1e6:.1f}us, cached load {cached * 1e6:.2f}us")
+
+        invalid = parse_config("opacity=2\nposition=middle\nframe_rate=fast\nmarquee=maybe\n")
+        check("invalid values get their defaults", invalid == Config())
+
+        changes = []
+        changed = threading.Event()
+        def on_change(old: Config, new: Config) -> None:
+            changes.append(changed_fields(old, new))
+            changed.set()
+        watch_config(on_change, path, interval=0.05)
+        time.sleep(0.1)
+
+        path.write_text(text.replace("opacity=", "opacity=0.5").replace("position=", "position=bottom_start"))
+        # Some file systems only keep the modification time to the second, the size changed too.
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        check("the watcher sees an edit", changed.wait(2) and changes[-1] == ["position", "opacity"])
+        check("the cached config is the edited one", load_config(path).opacity == 0.5)
+
+    return 0 if ok else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,145 @@
+# Copyright 2026 Sagi Tsafrir
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+
+"""Counts how often the frame loop wakes while idle, and checks posts from other threads still wake it.
+
+Run from the base folder of the app: `python -m benchmarks.frame_scheduler_idle`
+Runs the scheduler on a stand-in for the Tk event loop, so it doesn't need a display.
+Exits with a non zero status if a check fails.
+"""
+
+import heapq
+import itertools
+import sys
+import threading
+import time
+
+import views.frame_scheduler
+from views.frame_scheduler import FrameScheduler
+
+IDLE_SECONDS = 1.0
+
+class FakeWindow():
+    """The `after` part of a Tk window. Calls from other threads are queued for the loop thread, like tkinter does."""
+    def __init__(self) -> None:
+        self.__calls: list[tuple[float, int, object]] = []
+        self.__cancelled: set[str] = set()
+        self.__ids = itertools.count()
+        self.__condition = threading.Condition()
+        self.wakeups = 0
+
+    def after(self, delay_ms: int, func) -> str:
+        with self.__condition:
+            call_id = next(self.__ids)
+            heapq.heappush(self.__calls, (time.perf_counter() + delay_ms / 1000, call_id, func))
+            self.__condition.notify()
+        return f"after#{call_id}"
+
+    def after_cancel(self, after_id: str) -> None:
+        with self.__condition:
+            self.__cancelled.add(after_id)
+
+    def run(self, seconds: float) -> None:
+        end = time.perf_counter() + seconds
+        while True:
+            with self.__condition:
+                now = time.perf_counter()
+                if now >= end:
+                    return
+                if not self.__calls or self.__calls[0][0] > now:
+                    self.__condition.wait(min(end, self.__calls[0][0] if self.__calls else end) - now)
+                    continue
+                _, call_id, func = heapq.heappop(self.__calls)
+                if f"after#{call_id}" in self.__cancelled:
+                    continue
+            self.wakeups += 1
+            func()
+
+def main() -> int:
+    views.frame_scheduler.logger.disabled = True
+    ok = True
+
+    def check(name: str, passed: bool) -> None:
+        nonlocal ok
+        ok &= passed
+        print(f"  {name:<48} {'ok' if passed else 'FAILED'}")
+
+    window = FakeWindow()
+    scheduler = FrameScheduler(window, frame_rate=30)
+    scheduler.start()
+    window.run(IDLE_SECONDS)
+    print(f"Wakeups in {IDLE_SECONDS:.0f}s: idle {window.wakeups}", end="")
+    check_idle = window.wakeups
+
+    window.wakeups = 0
+    fired = []
+    scheduler.call_later(400, lambda: fired.append(time.perf_counter()))
+    window.run(IDLE_SECONDS)
+    print(f", one timer {window.wakeups}", end="")
+    check_timer = window.wakeups
+
+    window.wakeups = 0
+    scheduler.add_animation("test", lambda now: True)
+    window.run(IDLE_SECONDS)
+    scheduler.remove_animation("test")
+    print(f", animating at 30fps {window.wakeups}")
+    print("Checks")
+    check("no wakeups while idle", check_idle <= 1)
+    check("one wakeup for a timer", check_timer <= 2 and len(fired) == 1)
+
+    # Sleeping until a timer far away, a post from a thread and an earlier timer still run right away.
+    window.run(0.1)
+    scheduler.call_later(10_000, lambda: None)
+    posted = []
+    posted_at = time.perf_counter()
+    threading.Thread(target=lambda: scheduler.post(lambda: posted.append(time.perf_counter()))).start()
+    window.run(0.2)
+    check("a post from a thread wakes a sleeping loop", len(posted) == 1 and posted[0] - posted_at < 0.05)
+
+    early = []
+    scheduled_at = time.perf_counter()
+    scheduler.call_later(20, lambda: early.append(time.perf_counter()))
+    window.run(0.2)
+    check("an earlier timer reschedules a sleeping loop", len(early) == 1 and early[0] - scheduled_at < 0.07)
+
+    # Changes from other threads are applied on the loop thread, and never start a second loop.
+    loop_thread = threading.get_ident()
+    threads = set()
+    def from_worker() -> None:
+        for _ in range(50):
+            scheduler.start()
+            scheduler.add_animation("worker", lambda now: threads.add(threading.get_ident()) or True)
+            scheduler.call_later(10, lambda: threads.add(threading.get_ident()))
+    window.run(0.1)
+    window.wakeups = 0
+    worker = threading.Thread(target=from_worker)
+    worker.start()
+    window.run(IDLE_SECONDS)
+    worker.join()
+    scheduler.remove_animation("worker")
+    check("changes from a thread run on the loop thread", threads == {loop_thread})
+    check("changes from a thread keep a single loop", window.wakeups <= 40)
+
+    scheduler.stop()
+    stopped = []
+    threading.Thread(target=lambda: scheduler.post(lambda: stopped.append(1))).start()
+    window.run(0.1)
+    check("a stopped loop stays stopped", not stopped)
+
+    return 0 if ok else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,86 @@
+# Copyright 2026 Sagi Tsafrir
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Profiles the imports of the app at startup and checks them against a budget.
+
+Run from the base folder of the app: `python -m benchmarks.import_time [budget_ms]`
+Exits with a non zero status if importing `main` takes longer than the budget, or if one of the
+modules that should only be imported on first use is imported at startup.
+"""
+
+import re
+import subprocess
+import sys
+
+# The total import time of `main`, the best of RUNS runs.
+BUDGET_MS = 400
+RUNS = 5
+
+# Modules that are only needed after the bar is up, or not at all on most launches.
+DEFERRED = (
+    "flask",       # Only for the first authorization, see `api.refresh.create_app`.
+    "werkzeug",
+    "pystray",     # Only when the tray starts, see `SystemTray.run`.
+    "numpy",       # Only when the first cover palette is extracted.
+    "sklearn",     # Only for the `kmeans` palette mode.
+    "screeninfo",  # Only when the window is dragged.
+)
+
+LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+def profile() -> tuple[int, dict[str, int]]:
+    """Imports `main` in a fresh interpreter.
+
+    Returns:
+        tuple[int, dict[str, int]]: The total import time in microseconds, and the cumulative time of every module.
+    """
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", "import main"],
+                            capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing main failed:\n{result.stderr}")
+
+    modules: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        match = LINE.match(line)
+        if match:
+            modules[match.group(4)] = int(match.group(2))
+    return modules["main"], modules
+
+def main() -> int:
+    budget_ms = float(sys.argv[1]) if len(sys.argv) > 1 else BUDGET_MS
+
+    runs = [profile() for _ in range(RUNS)]
+    total, modules = min(runs, key=lambda run: run[0])
+
+    print("slowest imports:")
+    top_level = {name: micros for name, micros in modules.items() if "." not in name}
+    for name, micros in sorted(top_level.items(), key=lambda item: item[1], reverse=True)[:10]:
+        print(f"  {name:20} {micros / 1000:8.1f} ms")
+
+    failures = 0
+    imported = sorted(name for name in modules if name.split(".")[0] in DEFERRED)
+    if imported:
+        failures += 1
+        print(f"imported at startup, but should be deferred: {', '.join(imported)}")
+
+    print(f"import main: {total / 1000:.1f} ms (budget {budget_ms:.0f} ms)")
+    if total / 1000 > budget_ms:
+        failures += 1
+        print("over the import time budget")
+
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
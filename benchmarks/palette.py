@@ -0,0 +1,87 @@
+# Copyright 2026 Sagi Tsafrir
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Per cover cost of the dominant color, before and after the NumPy palette engine.
+
+Run from the base folder of the app: `python -m benchmarks.palette`
+"""
+
+import random
+import timeit
+from collections import defaultdict
+
+from PIL import Image, ImageDraw, ImageFilter
+
+from media.palette import histogram_palette, kmeans_palette, soften_color
+
+def legacy_dominant_color(image: Image.Image, soft: bool = True) -> str:
+    """The original per pixel implementation of `App._get_dominant_color`."""
+    image = image.convert("RGB").resize((150, 150))
+    counts: dict = defaultdict(int)
+    for r, g, b in image.getdata():
+        counts[(r // 16, g // 16, b // 16)] += 1
+
+    top = sorted(counts.items(), key=lambda x: x[1], reverse=True)[:5][::-1]
+    chosen_bucket, chosen_count = None, 0
+
+    for bucket, count in top:
+        r, g, b = (x* 16 + 8 for x in bucket)
+        brightness = 0.299*r + 0.586*g + 0.114*b
+        if brightness < 40 and count < chosen_count * 2.5:
+            continue
+        chosen_bucket, chosen_count = bucket, count
+
+    if chosen_bucket is None:
+        chosen_bucket = top[0][0]
+
+    r, g, b = (x * 16 + 8 for x in chosen_bucket)
+    color = (soften_color((r, g, b)) if soft else (r, g, b))
+    return "#%02x%02x%02x" % color
+
+def make_cover(seed: int, size: int = 640) -> Image.Image:
+    """A synthetic cover: a few colored shapes on a background, slightly blurred like a photo."""
+    rng = random.Random(seed)
+    image = Image.new("RGB", (size, size), tuple(rng.randrange(256) for _ in range(3)))
+    draw = ImageDraw.Draw(image)
+    for _ in range(12):
+        x0, y0 = rng.randrange(size), rng.randrange(size)
+        x1, y1 = x0 + rng.randrange(size // 2), y0 + rng.randrange(size // 2)
+        draw.ellipse((x0, y0, x1, y1), fill=tuple(rng.randrange(256) for _ in range(3)))
+    return image.filter(ImageFilter.GaussianBlur(4))
+
+def main() -> None:
+    covers = [make_cover(seed) for seed in range(20)]
+    small_covers = [cover.resize((64, 64)) for cover in covers]
+
+    mismatches = sum(legacy_dominant_color(cover) != histogram_palette(cover).primary for cover in covers)
+    print(f"primary color mismatches against the legacy implementation: {mismatches}/{len(covers)}")
+
+    runs = 5
+    cases = [
+        ("legacy, 640px cover", lambda: [legacy_dominant_color(cover) for cover in covers]),
+        ("numpy histogram, 640px cover", lambda: [histogram_palette(cover) for cover in covers]),
+        ("numpy histogram, 64px cover", lambda: [histogram_palette(cover) for cover in small_covers]),
+    ]
+    try:
+        import sklearn  # noqa: F401
+        cases.append(("k-means, 64px cover", lambda: [kmeans_palette(cover) for cover in small_covers]))
+    except ImportError:
+        print("scikit-learn is not installed, skipping k-means.")
+
+    for name, run in cases:
+        seconds = min(timeit.repeat(run, number=1, repeat=runs))
+        print(f"{name:32} {seconds / len(covers) * 1000:8.3f} ms per cover")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+# Copyright 2026 Sagi Tsafrir
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Checks the resumable download against a local server that supports ranges and drops connections.
+
+Run from the base folder of the app: `python -m benchmarks.range_download`
+Each connection of the server is throttled, like a CDN that limits each connection, so the parallel ranges pay off.
+Prints the time of the old 1KB chunk download and of the new one, with one and with several ranges, then checks
+that dropped connections and an interrupted download are resumed rather than started over.
+Exits with a non zero status if a downloaded file doesn't match, or a resume downloaded more than it should have.
+"""
+
+import hashlib
+import random
+import re
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import requests
+
+import download
+from download import download_file
+
+PAYLOAD_SIZE = 24 * 1024 * 1024
+# Bytes per second of each connection.
+CONNECTION_RATE = 40 * 1024 * 1024
+SEGMENTS = 4
+# When dropping connections, each response is cut after this many bytes.
+DROP_AFTER = 3 * 1024 * 1024
+
+class RangeHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    payload = b""
+    drop_after = 0
+    sent = 0
+    requests = 0
+    lock = threading.Lock()
+
+    def do_HEAD(self) -> None:
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(self.payload)))
+        self.send_header("Accept-Ranges", "bytes")
+        self.end_headers()
+
+    def do_GET(self) -> None:
+        start, end = 0, len(self.payload) - 1
+        match = re.fullmatch(r"bytes=(\d+)-(\d*)", self.headers.get("Range", ""))
+        if match:
+            start = int(match.group(1))
+            end = int(match.group(2)) if match.group(2) else end
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{end}/{len(self.payload)}")
+        else:
+            self.send_response(200)
+        self.send_header("Content-Length", str(end - start + 1))
+        self.send_header("Accept-Ranges", "bytes")
+        self.end_headers()
+        with RangeHandler.lock:
+            RangeHandler.requests += 1
+
+        limit = end + 1
+        if self.drop_after:
+            limit = min(limit, start + self.drop_after)
+        block = 64 * 1024
+        for offset in range(start, limit, block):
+            data = self.payload[offset:min(offset + block, limit)]
+            try:
+                self.wfile.write(data)
+            except OSError:
+                return
+            with RangeHandler.lock:
+                RangeHandler.sent += len(data)
+            time.sleep(len(data) / CONNECTION_RATE)
+        if limit <= end:
+            # Cut the response short, the client sees a dropped connection.
+            self.close_connection = True
+            self.wfile.flush()
+            self.connection.shutdown(2)
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+def reset(drop_after: int = 0) -> None:
+    RangeHandler.drop_after = drop_after
+    RangeHandler.sent = 0
+    RangeHandler.requests = 0
+
+def old_download(url: str, path: Path) -> None:
+    """The download before the resumable one, for comparison."""
+    response = requests.get(url, stream=True)
+    response.raise_for_status()
+    with open(path, "wb") as file:
+        for chunk in response.iter_content(1024):
+            file.write(chunk)
+
+class Interrupted(Exception):
+    pass
+
+def main() -> int:
+    download.logger.disabled = True
+    download.RETRY_DELAY = 0.01
+    RangeHandler.payload = random.Random(0).randbytes(PAYLOAD_SIZE)
+    expected = hashlib.sha256(RangeHandler.payload).hexdigest()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), RangeHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/release.zip"
+
+    ok = True
+    def check(name: str, path: Path, elapsed: float, extra: str = "") -> None:
+        nonlocal ok
+        correct = hashlib.sha256(path.read_bytes()).hexdigest() == expected
+        ok &= correct
+        print(f"  {name:<28} {elapsed * 1000:8.1f}ms {RangeHandler.requests:4} requests  "
+              f"{'ok' if correct else 'MISMATCH'}{extra}")
+        path.unlink()
+
+    print(f"{PAYLOAD_SIZE // 1024 // 1024}MB at {CONNECTION_RATE // 1024 // 1024}MB/s per connection")
+    with tempfile.TemporaryDirectory() as temp:
+        path = Path(temp) / "release.zip"
+
+        for name, run in (("1KB chunks (old)", lambda: old_download(url, path)),
+                          ("1MB chunks, 1 range", lambda: download_file(url, path)),
+                          (f"1MB chunks, {SEGMENTS} ranges", lambda: download_file(url, path, segments=SEGMENTS))):
+            reset()
+            start = time.perf_counter()
+            run()
+            check(name, path, time.perf_counter() - start)
+
+        for segments in (1, SEGMENTS):
+            reset(DROP_AFTER)
+            start = time.perf_counter()
+            download_file(url, path, segments=segments)
+            extra = f", {RangeHandler.sent - PAYLOAD_SIZE} bytes sent twice"
+            ok &= RangeHandler.sent == PAYLOAD_SIZE
+            check(f"dropped every 3MB, {segments} range{'s' if segments > 1 else ''}", path, time.perf_counter() - start, extra)
+
+        # The app is closed half way, the next launch continues from the `.part` file.
+        def stop_half_way(downloaded: int, total: int) -> None:
+            if downloaded >= total // 2:
+                raise Interrupted()
+
+        reset()
+        try:
+            download_file(url, path, stop_half_way, segments=SEGMENTS)
+        except Interrupted:
+            pass
+        first = RangeHandler.sent
+        reset()
+        start = time.perf_counter()
+        download_file(url, path, segments=SEGMENTS)
+        resumed = RangeHandler.sent
+        ok &= first + resumed <= PAYLOAD_SIZE + SEGMENTS * download.CHUNK_SIZE
+        check("interrupted and resumed", path, time.perf_counter() - start,
+              f", {first // 1024} + {resumed // 1024}KB of {PAYLOAD_SIZE // 1024}KB")
+
+    server.shutdown()
+    return 0 if ok else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
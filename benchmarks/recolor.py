@@ -0,0 +1,71 @@
+# Copyright 2026 Sagi Tsafrir
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Checks that the lookup table recoloring matches the original per pixel one, and times both.
+
+Run from the base folder of the app: `python -m benchmarks.recolor`
+Exits with a non zero status if any pixel differs.
+"""
+
+import os
+import sys
+import timeit
+
+from PIL import Image, ImageOps
+
+from media.recolor import recolor_image
+
+BUTTONS_DIR = "resources/buttons"
+THEMES = [(255, 255, 255), (105, 107, 107), (207, 60, 60), (0, 0, 0), (18, 200, 97)]
+
+def legacy_recolor_image(image: Image.Image, inversed: tuple[int, int, int], dim: tuple[int]) -> Image.Image:
+    """The original per pixel implementation of `App._recolor_image`."""
+    gray = ImageOps.grayscale(image)
+    result = Image.new("RGBA", image.size)
+
+    pixels = [
+        (
+            int(dim[0] * (1 - t) + inversed[0] * t),
+            int(dim[1] * (1 - t) + inversed[1] * t),
+            int(dim[2] * (1 - t) + inversed[2] * t),
+            a
+        )
+        for g, a in zip(gray.getdata(), image.getchannel("A").getdata())
+        for t in (g / 255,)
+    ]
+
+    result.putdata(pixels)
+    return result
+
+def main() -> int:
+    icons = [Image.open(os.path.join(BUTTONS_DIR, name)).convert("RGBA")
+             for name in sorted(os.listdir(BUTTONS_DIR)) if name.endswith(".png")]
+
+    failures = 0
+    for color in THEMES:
+        dim = tuple(int(c * 0.8) for c in color)
+        for icon in icons:
+            if legacy_recolor_image(icon, color, dim).tobytes() != recolor_image(icon, color, dim).tobytes():
+                failures += 1
+    print(f"icons differing from the legacy implementation: {failures}/{len(icons) * len(THEMES)}")
+
+    color, dim = THEMES[2], tuple(int(c * 0.8) for c in THEMES[2])
+    for name, recolor in (("legacy", legacy_recolor_image), ("lookup tables", recolor_image)):
+        seconds = min(timeit.repeat(lambda: [recolor(icon, color, dim) for icon in icons], number=1, repeat=5))
+        print(f"{name:14} {seconds / len(icons) * 1000:8.3f} ms per icon")
+
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
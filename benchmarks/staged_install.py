@@ -0,0 +1,192 @@
+# Copyright 2026 Sagi Tsafrir
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Times the staged install of an update and checks that it switches, survives a failure and rolls back.
+
+Run from the base folder of the app: `python -m benchmarks.staged_install`
+For installs of a growing number of files, compares copying every file over the install (how updates used to be
+applied) with `Updater.install` of a whole release and of a delta.
+Exits with a non zero status if a check fails.
+"""
+
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import updater
+from updater import (KEEP_FILES, POINTER_NAME, VERSIONS_DIR, Updater, build_manifest, current_install, hash_file,
+                     read_pointer, rollback)
+
+FILE_COUNTS = (100, 400, 1600)
+FILE_SIZE = 64 * 1024
+CHANGED_COUNT = 5
+
+def make_install(root: Path, count: int, rng: random.Random) -> None:
+    for index in range(count):
+        path = root / f"lib/module_{index:04}.bin"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(rng.randbytes(FILE_SIZE))
+    for rel_path in KEEP_FILES:
+        (root / rel_path).parent.mkdir(parents=True, exist_ok=True)
+        (root / rel_path).write_text(f"user's {rel_path}")
+
+def make_release(install: Path, release: Path, version: str, rng: random.Random) -> dict:
+    shutil.copytree(install, release)
+    for rel_path in KEEP_FILES:
+        (release / rel_path).unlink()
+    files = sorted(release.rglob("*.bin"))
+    for path in rng.sample(files, CHANGED_COUNT):
+        path.write_bytes(rng.randbytes(FILE_SIZE))
+    return build_manifest(release, version, "")
+
+def make_delta(release: Path, delta: Path, manifest: dict, install: Path) -> None:
+    """Copies the changed files, and records the unchanged ones in the manifest like `download_update` does."""
+    unchanged = []
+    for rel_path, entry in manifest["files"].items():
+        if not (install / rel_path).is_file() or hash_file(install / rel_path) != entry["sha256"]:
+            (delta / rel_path).parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(release / rel_path, delta / rel_path)
+        else:
+            unchanged.append(rel_path)
+    manifest["unchanged"] = unchanged
+
+def copy_over(new_dir: Path, app_dir: Path) -> None:
+    """Copies every file of the release over the install, one by one."""
+    for src_path in new_dir.rglob("*"):
+        dest_path = app_dir / src_path.relative_to(new_dir)
+        if src_path.is_dir():
+            dest_path.mkdir(exist_ok=True)
+        else:
+            shutil.copy2(src_path, dest_path)
+
+def installed_correctly(version_dir: Path, root: Path, manifest: dict) -> bool:
+    files_match = all(hash_file(version_dir / rel_path) == entry["sha256"] for rel_path, entry in manifest["files"].items())
+    kept = all((version_dir / rel_path).read_text() == f"user's {rel_path}" for rel_path in KEEP_FILES)
+    switched = current_install(root) == version_dir and current_install(version_dir) == version_dir
+    return files_match and kept and switched
+
+def main() -> int:
+    updater.logger.disabled = True
+    rng = random.Random(0)
+    ok = True
+
+    def check(name: str, passed: bool) -> None:
+        nonlocal ok
+        ok &= passed
+        print(f"  {name:<52} {'ok' if passed else 'FAILED'}")
+
+    with tempfile.TemporaryDirectory() as temp:
+        temp = Path(temp)
+        print(f"Applying an update with {CHANGED_COUNT} changed files of {FILE_SIZE // 1024}KB")
+        print(f"  {'files':>6} {'copy over':>10} {'install':>10} {'delta':>10}")
+        for count in FILE_COUNTS:
+            base = temp / str(count)
+            make_install(base / "original", count, rng)
+            manifest = make_release(base / "original", base / "release", "0.4", rng)
+
+            timings = []
+            for name in ("copy", "full", "delta"):
+                root = base / name
+                shutil.copytree(base / "original", root)
+                new_dir = base / f"{name}-new"
+                if name == "delta":
+                    make_delta(base / "release", new_dir, manifest, root)
+                else:
+                    shutil.copytree(base / "release", new_dir)
+
+                manager = Updater("0.3")
+                manager.manifest = manifest
+                start = time.perf_counter()
+                if name == "copy":
+                    copy_over(new_dir, root)
+                    timings.append(time.perf_counter() - start)
+                else:
+                    version_dir = manager.install(new_dir, root)
+                    timings.append(time.perf_counter() - start)
+                    ok &= version_dir is not None and installed_correctly(version_dir, root.resolve(), manifest)
+            print(f"  {count:>6} " + " ".join(f"{seconds * 1000:8.1f}ms" for seconds in timings))
+
+        print("Checks")
+        base = temp / "checks"
+        make_install(base / "root", 50, rng)
+        root = (base / "root").resolve()
+
+        # A failure while staging leaves the running version, and nothing of the new one.
+        manifest = make_release(root, base / "release", "0.4", rng)
+        make_delta(base / "release", base / "delta", manifest, root)
+        link, calls = updater._link, 0
+        def failing_link(src: Path, dest: Path) -> None:
+            nonlocal calls
+            calls += 1
+            if calls == 3:
+                raise OSError("Injected failure")
+            link(src, dest)
+        updater._link = failing_link
+        manager = Updater("0.3")
+        manager.manifest = manifest
+        failed = manager.install(base / "delta", root) is None
+        updater._link = link
+        check("failed install keeps the running version", failed and current_install(root) == root
+              and not (root / POINTER_NAME).exists() and not any((root / VERSIONS_DIR).iterdir()))
+
+        # A changed file missing from the download isn't taken from the running version.
+        shutil.rmtree(base / "delta", ignore_errors=True)
+        make_delta(base / "release", base / "delta", manifest, root)
+        truncated = next(path for path in (base / "delta").rglob("*.bin"))
+        truncated_data = truncated.read_bytes()
+        truncated.unlink()
+        check("install fails on a missing changed file", manager.install(base / "delta", root) is None
+              and current_install(root) == root)
+        release_dir = base / "release"
+        truncated = release_dir / truncated.relative_to(base / "delta")
+        truncated.unlink()
+        check("verify fails on a missing file", not manager.verify(release_dir, manifest)
+              and manager.verify(release_dir, manifest, [truncated.relative_to(release_dir).as_posix()]))
+        truncated.write_bytes(truncated_data)
+        check("verify passes a complete release", manager.verify(release_dir, manifest))
+
+        shutil.rmtree(base / "delta", ignore_errors=True)
+        make_delta(base / "release", base / "delta", manifest, root)
+        first = manager.install(base / "delta", root)
+        check("install switches to the new version", first is not None and installed_correctly(first, root, manifest))
+        config = "config.ini"
+        check("kept files are hard linked", os.path.samefile(root / config, first / config))
+
+        # The next update runs from the installed version, the first install stays as the previous version.
+        manifest = make_release(first, base / "release-2", "0.5", rng)
+        make_delta(base / "release-2", base / "delta-2", manifest, first)
+        manager = Updater("0.4")
+        manager.manifest = manifest
+        second = manager.install(base / "delta-2", first)
+        check("second install switches from the first", second is not None and installed_correctly(second, root, manifest))
+        check("pointer keeps the previous version", read_pointer(root) == {"current": "versions/0.5", "previous": "versions/0.4"})
+
+        check("rollback switches back", rollback(second) == first and current_install(root) == first)
+
+        manifest = make_release(first, base / "release-3", "0.6", rng)
+        make_delta(base / "release-3", base / "delta-3", manifest, first)
+        manager.manifest = manifest
+        third = manager.install(base / "delta-3", first)
+        check("only the current and previous versions are kept",
+              third is not None and sorted(path.name for path in (root / VERSIONS_DIR).iterdir()) == ["0.4", "0.6"])
+
+    return 0 if ok else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,119 @@
+# Copyright 2026 Sagi Tsafrir
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+
+"""Runs the startup path of `main` after the bar is built, so a call to something the app doesn't have fails here.
+
+Run from the base folder of the app: `python -m benchmarks.startup_smoke`
+Without a display the bar is an `App` without a window, scheduling on a stand-in for the Tk event loop.
+With one, the real bar is built as `main` builds it and closed after a moment. Spotify isn't contacted.
+Exits with a non zero status if a check fails.
+"""
+
+import os
+import sys
+import threading
+import tkinter
+import traceback
+from pathlib import Path
+
+from api import Spotify
+from benchmarks.frame_scheduler_idle import FakeWindow
+from config import Config
+from gui import App
+from logger import logger
+from main import start_background_work
+from startup import Startup, CONFIG, SNAPSHOT
+from system_tray import SystemTray
+from views.frame_scheduler import FrameScheduler
+
+# Longest the real bar may take to build and close, it's killed after it.
+WATCHDOG_SECONDS = 30
+OPEN_MS = 1500
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+def make_startup(config: Config) -> Startup:
+    """The startup steps, with a snapshot that failed like it does without a token."""
+    def failed_snapshot() -> None:
+        raise RuntimeError("No token in the smoke check")
+
+    startup = Startup()
+    startup.add(CONFIG, lambda: config)
+    startup.add(SNAPSHOT, failed_snapshot)
+    return startup
+
+def has_display() -> bool:
+    try:
+        tkinter.Tk().destroy()
+        return True
+    except tkinter.TclError:
+        return False
+
+def start_without_window(config: Config) -> bool:
+    """Runs the startup path on an `App` without a window. Only the scheduling is stood in for."""
+    app = App.__new__(App)
+    app._scheduler = FrameScheduler(FakeWindow())
+    start_background_work(app, SystemTray(), make_startup(config), config, BASE_DIR, BASE_DIR / "updater.py")
+    return True
+
+def start_with_window(config: Config) -> bool:
+    """Builds the bar like `main` does, runs the startup path and closes it."""
+    startup = make_startup(config)
+    app = App(config.title, "icon.ico", position=config.position, padding=config.padding, opacity=config.opacity,
+              background_color=config.background_color, buttons_color=config.buttons_color,
+              background_mode=config.background_mode, soft_color_mode=config.soft_color_mode,
+              frame_rate=config.frame_rate, palette_mode=config.palette_mode, marquee=config.marquee,
+              renderer=config.renderer, startup=startup)
+    start_background_work(app, SystemTray(), startup, config, BASE_DIR, BASE_DIR / "updater.py")
+    app.call_later(OPEN_MS, app.on_close)
+    app.run()
+    return True
+
+def main() -> int:
+    logger.disabled = True
+    # The config watcher creates 'config.ini' if there's none, it's removed after the checks.
+    config_existed = (BASE_DIR / "config.ini").exists()
+    # The token is never fetched, every request the views make waits on a daemon thread instead.
+    Spotify.refresh_client = lambda self: None
+    watchdog = threading.Timer(WATCHDOG_SECONDS, lambda: (print("  timed out"), os._exit(1)))
+    watchdog.daemon = True
+    watchdog.start()
+    ok = True
+
+    def check(name: str, run) -> None:
+        nonlocal ok
+        try:
+            passed = run()
+        except Exception:
+            traceback.print_exc()
+            passed = False
+        ok &= passed
+        print(f"  {name:<48} {'ok' if passed else 'FAILED'}")
+
+    print("Checks")
+    for mode in ("default", "background_only"):
+        config = Config(background_mode=mode)
+        check(f"startup path, {mode} background", lambda: start_without_window(config))
+        if has_display():
+            check(f"bar builds and closes, {mode} background", lambda: start_with_window(config))
+        else:
+            print(f"  {'bar builds and closes, ' + mode + ' background':<48} skipped, no display")
+
+    if not config_existed:
+        (BASE_DIR / "config.ini").unlink(missing_ok=True)
+    return 0 if ok else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
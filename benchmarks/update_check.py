@@ -0,0 +1,116 @@
+# Copyright 2026 Sagi Tsafrir
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Checks the cached, conditional version check against a local stand-in for the releases API.
+
+Run from the base folder of the app: `python -m benchmarks.update_check`
+Counts the requests and bytes of a first check, a check within the interval, a check after it (a 304), and times a
+check against a server that never answers, which must give up after the timeout and fall back to the cache.
+Exits with a non zero status if a check fails.
+"""
+
+import json
+import socket
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import updater
+from updater import Updater
+
+RELEASE = {"tag_name": "v0.4", "assets": [{"name": f"asset_{index}", "browser_download_url": "x" * 200}
+                                          for index in range(20)], "body": "Release notes. " * 200}
+ETAG = '"release-0.4"'
+
+class ReleasesHandler(BaseHTTPRequestHandler):
+    requests = 0
+    sent = 0
+
+    def do_GET(self) -> None:
+        ReleasesHandler.requests += 1
+        if self.headers.get("If-None-Match") == ETAG:
+            self.send_response(304)
+            self.send_header("ETag", ETAG)
+            self.end_headers()
+            return
+        body = json.dumps(RELEASE).encode()
+        self.send_response(200)
+        self.send_header("ETag", ETAG)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        ReleasesHandler.sent += len(body)
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+def main() -> int:
+    updater.logger.disabled = True
+    updater.CHECK_TIMEOUT = (1, 1)
+    ok = True
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ReleasesHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/releases/latest"
+
+    # Accepts connections and never answers, like a network that drops the packets.
+    stalled = socket.socket()
+    stalled.bind(("127.0.0.1", 0))
+    stalled.listen()
+    stalled_url = f"http://127.0.0.1:{stalled.getsockname()[1]}/releases/latest"
+
+    with tempfile.TemporaryDirectory() as temp:
+        cache_path = Path(temp) / "update_check.json"
+
+        def check(name: str, releases_url: str, interval: float, expected_requests: int) -> None:
+            nonlocal ok
+            ReleasesHandler.requests = ReleasesHandler.sent = 0
+            manager = Updater("0.3", releases_url)
+            start = time.perf_counter()
+            new_version = manager.check_new_version(cache_path, interval)
+            elapsed = time.perf_counter() - start
+            passed = new_version and manager.latest_version == "0.4" and ReleasesHandler.requests == expected_requests
+            ok &= passed
+            print(f"  {name:<28} {elapsed * 1000:8.1f}ms {ReleasesHandler.requests:3} requests "
+                  f"{ReleasesHandler.sent:7} bytes  {'ok' if passed else 'FAILED'}")
+
+        check("first check", url, 3600, 1)
+        check("within the interval", url, 3600, 0)
+        check("after the interval (304)", url, 0, 1)
+
+        # The same cache, as if the server stalled: it's read as the same releases URL.
+        cache = json.loads(cache_path.read_text())
+        cache["url"] = stalled_url
+        cache_path.write_text(json.dumps(cache))
+        check("stalled server, cached", stalled_url, 0, 0)
+
+        cache_path.unlink()
+        manager = Updater("0.3", stalled_url)
+        start = time.perf_counter()
+        new_version = manager.check_new_version(cache_path, 0)
+        elapsed = time.perf_counter() - start
+        passed = not new_version and elapsed < 3
+        ok &= passed
+        print(f"  {'stalled server, no cache':<28} {elapsed * 1000:8.1f}ms  {'ok' if passed else 'FAILED'}")
+
+    server.shutdown()
+    stalled.close()
+    return 0 if ok else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,141 @@
+# Copyright 2026 Sagi Tsafrir
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Compares a delta update against a full update, served by a local stand-in for the release server.
+
+Run from the base folder of the app: `python -m benchmarks.updater_delta`
+Builds a synthetic install and a patch release that changes a few of its' files, updates a copy of the
+install both ways and prints the bytes downloaded and the time taken by each.
+Exits with a non zero status if an updated install doesn't match the release.
+"""
+
+import json
+import random
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from zipfile import ZIP_DEFLATED, ZipFile
+
+import updater
+from updater import MANIFEST_NAME, Updater, build_manifest, hash_file
+
+FILE_COUNT = 200
+FILE_SIZE = 256 * 1024
+CHANGED_COUNT = 5
+
+class CountingHandler(SimpleHTTPRequestHandler):
+    """Serves the release folder and counts the bytes it sends."""
+    sent = 0
+    lock = threading.Lock()
+
+    def copyfile(self, source, outputfile) -> None:
+        start = source.tell()
+        super().copyfile(source, outputfile)
+        with CountingHandler.lock:
+            CountingHandler.sent += source.tell() - start
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+def make_install(root: Path, rng: random.Random) -> None:
+    for index in range(FILE_COUNT):
+        path = root / f"lib/module_{index:03}.bin"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Random bytes, so the zip doesn't shrink them and the comparison is fair.
+        path.write_bytes(rng.randbytes(FILE_SIZE))
+    (root / "config.ini").write_text("[Settings]\n")
+
+def make_release(install: Path, serve_dir: Path, rng: random.Random, base_url: str) -> dict:
+    """Copies the install with CHANGED_COUNT files changed, and serves it as files, a zip and a manifest."""
+    files_dir = serve_dir / "files"
+    shutil.copytree(install, files_dir)
+    (files_dir / "config.ini").unlink()
+    for index in rng.sample(range(FILE_COUNT), CHANGED_COUNT):
+        (files_dir / f"lib/module_{index:03}.bin").write_bytes(rng.randbytes(FILE_SIZE))
+    (files_dir / "lib/new_module.bin").write_bytes(rng.randbytes(FILE_SIZE))
+
+    manifest = build_manifest(files_dir, "9.9", f"{base_url}/files")
+    (serve_dir / MANIFEST_NAME).write_text(json.dumps(manifest))
+    with ZipFile(serve_dir / "SpotifyBar.zip", "w", ZIP_DEFLATED) as zip_file:
+        for path in files_dir.rglob("*"):
+            zip_file.write(path, path.relative_to(files_dir))
+
+    release = {"tag_name": "v9.9", "assets": [
+        {"name": "SpotifyBar.zip", "browser_download_url": f"{base_url}/SpotifyBar.zip"},
+        {"name": MANIFEST_NAME, "browser_download_url": f"{base_url}/{MANIFEST_NAME}"},
+    ]}
+    (serve_dir / "release.json").write_text(json.dumps(release))
+    return manifest
+
+def matches(app_dir: Path, manifest: dict) -> bool:
+    return all((app_dir / rel_path).is_file() and hash_file(app_dir / rel_path) == entry["sha256"]
+               for rel_path, entry in manifest["files"].items())
+
+def update(install: Path, work_dir: Path, base_url: str, manifest: dict, delta: bool) -> tuple[int, float, bool]:
+    app_dir = work_dir / "app"
+    shutil.copytree(install, app_dir)
+    manager = Updater("0.0", f"{base_url}/release.json")
+    if not delta:
+        manager.fetch_manifest = lambda release: None
+
+    CountingHandler.sent = 0
+    start = time.perf_counter()
+    new_dir = manager.download_update(app_dir, work_dir)
+    if new_dir is None:
+        return CountingHandler.sent, time.perf_counter() - start, False
+    installed_dir = manager.install(new_dir, app_dir)
+    elapsed = time.perf_counter() - start
+    return CountingHandler.sent, elapsed, installed_dir is not None and matches(installed_dir, manifest)
+
+def main() -> int:
+    updater.logger.disabled = True
+    rng = random.Random(0)
+
+    with tempfile.TemporaryDirectory() as temp:
+        temp = Path(temp)
+        install, serve_dir = temp / "install", temp / "serve"
+        serve_dir.mkdir()
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), partial(CountingHandler, directory=str(serve_dir)))
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        base_url = f"http://127.0.0.1:{server.server_port}"
+
+        make_install(install, rng)
+        manifest = make_release(install, serve_dir, rng, base_url)
+
+        results = {}
+        for name, delta in (("full", False), ("delta", True)):
+            work_dir = temp / name
+            work_dir.mkdir()
+            results[name] = update(install, work_dir, base_url, manifest, delta)
+        server.shutdown()
+
+    ok = True
+    print(f"{FILE_COUNT} files of {FILE_SIZE // 1024}KB, {CHANGED_COUNT} changed and 1 added")
+    for name, (sent, elapsed, correct) in results.items():
+        print(f"  {name:<6} {sent / 1024 / 1024:8.2f}MB {elapsed * 1000:8.1f}ms  {'ok' if correct else 'MISMATCH'}")
+        ok &= correct
+
+    full, delta = results["full"], results["delta"]
+    print(f"  saved  {(full[0] - delta[0]) / 1024 / 1024:8.2f}MB {(full[1] - delta[1]) * 1000:8.1f}ms")
+    return 0 if ok else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
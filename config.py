@@ -0,0 +1,206 @@
+# Copyright 2026 Sagi Tsafrir
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, NamedTuple, Union
+
+from logger import logger
+from media.palette import HISTOGRAM, PALETTE_MODES
+
+if getattr(sys, "frozen", False):
+    base_dir = Path(sys.executable).resolve().parent
+else:
+    base_dir = Path(__file__).resolve().parent
+
+CONFIG_PATH = base_dir / "config.ini"
+# How often `watch_config` checks if the file changed, in seconds.
+WATCH_INTERVAL = 1
+
+POSITIONS = ("top_start", "top_end", "bottom_start", "bottom_end")
+BACKGROUND_MODES = ("default", "song", "background_only")
+RENDERERS = ("widgets", "canvas")
+TRUE_VALUES = ("1", "true", "yes", "on")
+FALSE_VALUES = ("0", "false", "no", "off")
+
+DEFAULT_LINES = ["program_title=\n",
+                 "opacity=\n",
+                 "background_color=\n",
+                 "buttons_color=\n",
+                 "position=\n",
+                 "padding=\n",
+                 "background_mode=song\n",
+                 "soft_color_mode=\n",
+                 "frame_rate=\n",
+                 "palette_mode=\n",
+                 "marquee=\n",
+                 "renderer=\n",
+                 "update_check_hours=\n"
+                 ]
+
+class Config(NamedTuple):
+    """The settings in 'config.ini', validated. A key that's empty, missing or invalid has its' default."""
+    title: str = "Spotify Bar"
+    position: str = "top_end"
+    padding: int = 10
+    opacity: float = 1
+    background_color: str = "lightgray"
+    buttons_color: Union[str, None] = None
+    background_mode: str = "default"
+    soft_color_mode: bool = True
+    frame_rate: int = 30
+    palette_mode: str = HISTOGRAM
+    marquee: bool = False
+    renderer: str = "widgets"
+    update_check_hours: float = 24
+
+# The settings that can't change while the app runs, a change to them is applied on the next launch.
+RESTART_FIELDS = ("title", "frame_rate", "marquee", "renderer")
+
+# The key of each field in the file, where it isn't the fields' name.
+_KEYS = {"title": "program_title"}
+
+def _parse_bool(value: str) -> bool:
+    if value.lower() in TRUE_VALUES:
+        return True
+    if value.lower() in FALSE_VALUES:
+        return False
+    raise ValueError("Not a boolean.")
+
+def _parse_choice(choices: tuple[str, ...]) -> Callable[[str], str]:
+    def parse(value: str) -> str:
+        if value not in choices:
+            raise ValueError(f"Not one of {', '.join(choices)}.")
+        return value
+    return parse
+
+def _parse_range(cast: Callable[[str], Any], minimum: float, maximum: float = float("inf")) -> Callable[[str], Any]:
+    def parse(value: str) -> Any:
+        number = cast(value)
+        if not minimum <= number <= maximum:
+            raise ValueError(f"Not between {minimum} and {maximum}.")
+        return number
+    return parse
+
+_PARSERS: dict[str, Callable[[str], Any]] = {
+    "title": str,
+    "position": _parse_choice(POSITIONS),
+    "padding": _parse_range(int, 0),
+    "opacity": _parse_range(float, 0, 1),
+    "background_color": str,
+    "buttons_color": str,
+    "background_mode": _parse_choice(BACKGROUND_MODES),
+    "soft_color_mode": _parse_bool,
+    "frame_rate": _parse_range(int, 1, 240),
+    "palette_mode": _parse_choice(PALETTE_MODES),
+    "marquee": _parse_bool,
+    "renderer": _parse_choice(RENDERERS),
+    "update_check_hours": _parse_range(float, 0),
+}
+
+def parse_config(text: str) -> Config:
+    """Parses and validates the contents of a config file. Invalid values are logged and replaced by their default."""
+    values = {}
+    for line in text.splitlines():
+        if "=" in line:
+            key, value = line.split("=", 1)
+            values[key.strip()] = value.strip()
+
+    fields = {}
+    for field, parse in _PARSERS.items():
+        key = _KEYS.get(field, field)
+        value = values.get(key)
+        if not value:
+            continue
+        try:
+            fields[field] = parse(value)
+        except ValueError as e:
+            logger.error(f"config.parse_config: Invalid {key} '{value}', using '{Config._field_defaults[field]}'. {e}")
+    return Config(**fields)
+
+_cache: dict[Path, tuple[tuple[int, int], Config]] = {}
+_cache_lock = threading.Lock()
+
+def _stamp(path: Path) -> tuple[int, int]:
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+def load_config(path: Path = CONFIG_PATH) -> Config:
+    """Returns the config in the file, creating it with the default keys if it's missing.
+        It's parsed and validated once, and cached. `watch_config` keeps the cached config up to date.
+    """
+    path = Path(path)
+    cached = _cache.get(path)
+    if cached is not None:
+        return cached[1]
+    return reload_config(path)
+
+def reload_config(path: Path = CONFIG_PATH) -> Config:
+    """Parses the file again if its' modification time or size changed since it was last parsed."""
+    path = Path(path)
+    with _cache_lock:
+        try:
+            stamp = _stamp(path)
+        except FileNotFoundError:
+            logger.warning(f"config.reload_config: '{path.name}' was not found. Creating a new file.")
+            try:
+                with open(path, "x") as file:
+                    file.writelines(DEFAULT_LINES)
+            except FileExistsError:
+                pass
+            stamp = _stamp(path)
+
+        cached = _cache.get(path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+        logger.info(f"config.reload_config: Reading the contents of '{path.name}'")
+        config = parse_config(path.read_text())
+        _cache[path] = (stamp, config)
+        return config
+
+def changed_fields(old: Config, new: Config) -> list[str]:
+    return [field for field in Config._fields if getattr(old, field) != getattr(new, field)]
+
+def watch_config(on_change: Callable[[Config, Config], None], path: Path = CONFIG_PATH,
+                 interval: float = WATCH_INTERVAL) -> threading.Thread:
+    """Calls `on_change` with the old and the new config whenever the file changes, from a background thread.
+
+    Args:
+        on_change (Callable): Called with the old and the new config. Post to the Tk thread from it if needed.
+        path (Path, optional): The config file. Defaults to 'config.ini'.
+        interval (float, optional): How often to check the files' modification time, in seconds.
+    """
+    def watch() -> None:
+        config = load_config(path)
+        while True:
+            time.sleep(interval)
+            try:
+                new_config = reload_config(path)
+            except OSError as e:
+                logger.error(f"config.watch_config: Failed to read '{path.name}': {e}")
+                continue
+            if new_config == config:
+                continue
+            logger.info(f"config.watch_config: Changed {', '.join(changed_fields(config, new_config))}.")
+            on_change(config, new_config)
+            config = new_config
+
+    thread = threading.Thread(target=watch, name="config_watcher", daemon=True)
+    thread.start()
+    return thread
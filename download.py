@@ -0,0 +1,188 @@
+# Copyright 2026 Sagi Tsafrir
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Union
+
+import requests
+
+from logger import logger
+
+CHUNK_SIZE = 1024 * 1024
+RETRIES = 5
+RETRY_DELAY = 0.5
+TIMEOUT = (10, 30)
+# Files smaller than this are downloaded in a single segment, a parallel download isn't worth its' extra requests.
+MIN_SEGMENT_SIZE = 4 * 1024 * 1024
+
+# Called with the bytes downloaded so far and the total size (0 if the server didn't say), from the download threads.
+ProgressCallback = Callable[[int, int], None]
+
+class _Download():
+    def __init__(self, url: str, path: Path, progress: Union[ProgressCallback, None], chunk_size: int, retries: int) -> None:
+        """The state of a download. The data is written to `<path>.part`, and how much of each segment is done
+            to `<path>.part.json`, so a later attempt continues where this one stopped.
+        """
+        self.url = url
+        self.path = path
+        self.part_path = path.with_name(path.name + ".part")
+        self.state_path = path.with_name(path.name + ".part.json")
+        self.progress = progress
+        self.chunk_size = chunk_size
+        self.retries = retries
+
+        self.total = 0
+        # [start, end, done] of each segment, the end is exclusive and None until the size is known.
+        self.segments: list[list] = []
+        self.__lock = threading.Lock()
+
+    @property
+    def downloaded(self) -> int:
+        return sum(done for _, _, done in self.segments)
+
+    def plan(self, segment_count: int) -> None:
+        """Splits the file into segments, or loads the segments of an earlier attempt at the same file."""
+        response = requests.head(self.url, allow_redirects=True, timeout=TIMEOUT)
+        if response.ok:
+            self.total = int(response.headers.get("Content-Length") or 0)
+        # Without a size there's nothing to split, the file is downloaded in one go.
+        accepts_ranges = response.ok and response.headers.get("Accept-Ranges") == "bytes" and self.total > 0
+
+        if accepts_ranges and self.__load_state():
+            logger.info("_Download.plan: Resuming '%s' from %d of %d bytes.", self.path.name, self.downloaded, self.total)
+            return
+
+        if not accepts_ranges:
+            self.segments = [[0, None, 0]]
+            return
+
+        segment_count = max(1, min(segment_count, self.total // MIN_SEGMENT_SIZE))
+        size = -(-self.total // segment_count)
+        self.segments = [[start, min(start + size, self.total), 0] for start in range(0, self.total, size)]
+        with open(self.part_path, "wb") as file:
+            file.truncate(self.total)
+        self.__save_state()
+
+    def run(self) -> None:
+        if len(self.segments) == 1:
+            self.__download_segment(0)
+        else:
+            with ThreadPoolExecutor(max_workers=len(self.segments), thread_name_prefix="download") as executor:
+                for future in [executor.submit(self.__download_segment, index) for index in range(len(self.segments))]:
+                    future.result()
+
+        if self.total and self.downloaded != self.total:
+            raise requests.RequestException(f"Downloaded {self.downloaded} of {self.total} bytes.")
+        os.replace(self.part_path, self.path)
+        self.state_path.unlink(missing_ok=True)
+
+    def __download_segment(self, index: int) -> None:
+        """Downloads the rest of the segment, reconnecting from where the connection dropped.
+            Only attempts in a row that got nothing count towards the retries.
+        """
+        failures = 0
+        while True:
+            start, end, done = self.segments[index]
+            if end is not None and start + done >= end:
+                return
+            try:
+                self.__request_segment(index)
+                if end is None:
+                    return
+            except (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError) as e:
+                failures = 1 if self.segments[index][2] > done else failures + 1
+                if failures > self.retries:
+                    raise
+                logger.warning("_Download.download_segment: Connection to '%s' dropped (%s), retrying.", self.path.name, e)
+                time.sleep(RETRY_DELAY * failures)
+
+    def __request_segment(self, index: int) -> None:
+        start, end, done = self.segments[index]
+        headers = {}
+        if end is not None:
+            headers["Range"] = f"bytes={start + done}-{end - 1}"
+
+        with requests.get(self.url, headers=headers, stream=True, timeout=TIMEOUT) as response:
+            response.raise_for_status()
+            if end is not None and response.status_code != 206:
+                raise requests.RequestException(f"The server ignored the range request for '{self.path.name}'.")
+
+            if end is None:
+                # No ranges, so a dropped connection starts over.
+                self.segments[index][2] = done = 0
+            mode = "wb" if end is None else "r+b"
+            with open(self.part_path, mode) as file:
+                file.seek(start + done)
+                for chunk in response.iter_content(self.chunk_size):
+                    file.write(chunk)
+                    file.flush()
+                    with self.__lock:
+                        self.segments[index][2] += len(chunk)
+                        if end is not None:
+                            self.__save_state()
+                        downloaded = self.downloaded
+                    if self.progress is not None:
+                        self.progress(downloaded, self.total)
+
+    def __load_state(self) -> bool:
+        try:
+            state = json.loads(self.state_path.read_text())
+        except (FileNotFoundError, ValueError):
+            return False
+        if state.get("url") != self.url or state.get("total") != self.total \
+                or not self.part_path.exists() or self.part_path.stat().st_size != self.total:
+            return False
+        self.segments = state["segments"]
+        return True
+
+    def __save_state(self) -> None:
+        # Saved after the data is written, so it never claims more than is in the `.part` file.
+        self.state_path.write_text(json.dumps({"url": self.url, "total": self.total, "segments": self.segments}))
+
+def download_file(url: str,
+                  path: Path,
+                  progress: Union[ProgressCallback, None] = None,
+                  segments: int = 1,
+                  chunk_size: int = CHUNK_SIZE,
+                  retries: int = RETRIES) -> Path:
+    """Downloads the URL to `path` through a `.part` file, resuming an earlier attempt at the same URL.
+
+    Args:
+        url (str): The file URL.
+        path (Path): Where to save the file.
+        progress (Callable, optional): Called with the bytes downloaded so far and the total, from the download threads.
+        segments (int, optional): How many ranges to download in parallel, if the server supports ranges. Defaults to 1.
+        chunk_size (int, optional): The size of each read and write. Defaults to 1MB.
+        retries (int, optional): How many times in a row each segment reconnects after a dropped connection.
+
+    Raises:
+        requests.RequestException: If the download failed. The `.part` file is kept for the next attempt.
+        OSError: If the file couldn't be written.
+
+    Returns:
+        Path: The downloaded file.
+    """
+    download = _Download(url, Path(path), progress, chunk_size, retries)
+    download.plan(segments)
+    if download.progress is not None:
+        download.progress(download.downloaded, download.total)
+    download.run()
+    logger.info("download.download_file: Downloaded '%s', %d bytes.", download.path.name, download.downloaded)
+    return download.path
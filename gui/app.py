@@ -12,24 +12,41 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from tkinter import Tk, Event, Label, TclError, PhotoImage, Frame, Button
-import os
-from PIL import Image, ImageTk, ImageFilter, ImageFile, ImageOps, ImageColor
-from screeninfo import get_monitors
+from tkinter import Tk, Event, Label, TclError, Frame
+from PIL import Image, ImageTk, ImageFile
+import threading
 from system_tray import SystemTray
-import requests
-from io import BytesIO
-from collections import defaultdict
-import colorsys
+from startup import Startup, SNAPSHOT
 from typing import Union
 
 from api import Spotify
+from config import Config, RESTART_FIELDS
 from logger import logger
+import tracing
+from media import CoverCache, ImagePipeline, SpriteCache, Theme, ThemeIndex, select_cover_url, smallest_cover_url
+from media.palette import HISTOGRAM, PALETTE_MODES, Palette, extract_palette
 from gui.gui_manager import GuiManager
+from gui.last_state import LastState, encode_cover, load_last_state, save_last_state
 from gui.base import Base
-from views.scales import PlaybackScale, VolumeScale, Scale
-from views.buttons import ExitButton, NextButton, PreviousButton, PauseButton, RepeatButton, ShuffleButton, CustomButton
-from views.label import SongLabel, BackgroundImage
+from views.scales import PlaybackScale, VolumeScale
+from views.buttons import ExitButton, NextButton, PreviousButton, PauseButton, RepeatButton, ShuffleButton
+from views.canvas import CanvasBar
+from views.label import SongLabel, MarqueeLabel, BackgroundImage
+from views.layout import WINDOW_SIZE, COVER_POSITION, SONG_POSITION, ARTIST_POSITION, TITLE_MAX_WIDTH, ALBUM_MAX_WIDTH
+from views.theme_registry import ThemeRegistry, BACKGROUND
+
+# The dominant color is computed from a histogram, it doesn't need more than a small variant.
+PALETTE_SIZE = 64
+TRAY_ICON_SIZE = 64
+
+# How often the last state is saved, it's only written when it changed.
+LAST_STATE_INTERVAL_MS = 15000
+
+WIDGETS_RENDERER = "widgets"
+CANVAS_RENDERER = "canvas"
+
+# The settings the background depends on, see `App.apply_config`.
+BACKGROUND_FIELDS = ("background_mode", "background_color", "buttons_color", "soft_color_mode", "palette_mode")
 
 class App(Base):
     def __init__(self,
@@ -41,35 +58,71 @@ class App(Base):
                  background_color = "lightgray",
                  buttons_color: Union[str, None] = None,
                  background_mode = "default",
-                 soft_color_mode = True) -> None:
+                 soft_color_mode = True,
+                 frame_rate: int = 30,
+                 palette_mode = HISTOGRAM,
+                 marquee: bool = False,
+                 renderer = WIDGETS_RENDERER,
+                 startup: Union[Startup, None] = None) -> None:
+        """The bar. With a `startup`, the bar is shown right away as a skeleton, 
+            and its' views are loaded once the player snapshot step is done.
+        """
         logger.debug(f"App.__init__: Initializing application with {title=}, {icon_path=}, {position=}, {padding=}, {opacity=}, {background_color=}")
         self.__position: str = position
         self.__padding: int = padding
         self.__background_mode: str = background_mode
         self.__buttons_color: Union[str, None] = buttons_color
         self.__soft_color_mode: bool = soft_color_mode
+        self.__bg_label: Union[BackgroundImage, None] = None
+        self.palette: Union[Palette, None] = None
+        
+        if palette_mode not in PALETTE_MODES:
+            logger.error(f"App.__init__: Invalid palette mode '{palette_mode}', using '{HISTOGRAM}'.")
+            palette_mode = HISTOGRAM
+        self.__palette_mode: str = palette_mode
+        self.__marquee: bool = marquee
+        
+        if renderer not in (WIDGETS_RENDERER, CANVAS_RENDERER):
+            logger.error(f"App.__init__: Invalid renderer '{renderer}', using '{WIDGETS_RENDERER}'.")
+            renderer = WIDGETS_RENDERER
+        self.__renderer: str = renderer
+        self.__startup: Union[Startup, None] = startup
+        self.__theme_colors: tuple[Union[str, None], Union[str, None]] = (None, None)
+        self.__views_loaded = False
+        
+        # The bar is first shown as it was last time, in song mode its' colors too so there's no flash of the default ones.
+        self.__last_state: Union[LastState, None] = load_last_state()
+        self.__saved_state: Union[LastState, None] = self.__last_state
+        self.__saved_cover: tuple[Union[ImageTk.PhotoImage, None], Union[bytes, None]] = (None, None)
+        if self.__last_state is not None and background_mode == "song" and self.__last_state.background:
+            background_color = self.__last_state.background
         
         self.system_tray = SystemTray()
         self.spotify = Spotify()
+        self.cover_cache = CoverCache()
+        self.image_pipeline = ImagePipeline()
+        self.sprite_cache = SpriteCache()
+        self.theme_index = ThemeIndex()
         
         super().__init__(title=title,
                          icon_path=icon_path,
                          opacity=opacity,
-                         background_color=background_color)
+                         background_color=background_color,
+                         frame_rate=frame_rate)
 
     def _setup(self) -> None:
         """Applies App-specific geometry, background mode and widgets"""
         # Guard: spotify/system_tray may not exist yet on the very first Base.__init__ call
         # if subclass attributes aren't set. The attribute check below handles this safely
-        width, height = 370, 170
+        width, height = WINDOW_SIZE
         super()._setup(geometry=(width, height), func=self._create_buttons, args=(self._window,))
         self._window.withdraw()
         self.__set_initial_position(width, height)
+        if self.__last_state is not None and self.__last_state.position == self.__position:
+            self._window.geometry(f"+{self.__last_state.x}+{self.__last_state.y}")
         
         try:
-            if self.__background_mode == "song":
-                self.set_background_song()
-            else:
+            if self.__background_mode != "song":
                 self._window.config(bg=self._background_color)
         except TclError:
             logger.error(f"App._setup: Invalid background color '{self._background_color}'")
@@ -79,13 +132,82 @@ class App(Base):
         self._window.bind("<ButtonRelease-1>",
                         lambda e: self.__snap_to_nearest_position(width, height))
         
-        logger.info("App._setup: Loading views data.")
+        self._window.deiconify()
+        if self.__startup is None:
+            self.__load_views()
+            return
+        
+        logger.info(f"App._setup: Skeleton visible {self.__startup.elapsed_ms:.0f}ms after startup began.")
+        # Loaded even if the snapshot failed, the views then make their own requests.
+        self.__startup.when_finished(SNAPSHOT, lambda: self.post(self.__load_views))
+        
+    @tracing.traced("first load", "gui")
+    def __load_views(self) -> None:
+        logger.info("App.__load_views: Loading views data.")
         self.gui_manager.load_all()
+        self._on_next_song()
         
-        self._window.deiconify()
-        logger.info("App._setup: Window visible and loaded.")
+        elapsed = f" {self.__startup.elapsed_ms:.0f}ms after startup began" if self.__startup is not None else ""
+        logger.info(f"App.__load_views: Window visible and loaded{elapsed}.")
         
         self.system_tray.gui_manager = self.gui_manager
+        self.__views_loaded = True
+        self._scheduler.call_later(LAST_STATE_INTERVAL_MS, self.__save_periodically)
+        
+    def __capture_last_state(self) -> LastState:
+        """Captures what the bar shows right now. On the Tk thread."""
+        photo = self.gui_manager.cover_photo
+        cached_photo, cover = self.__saved_cover
+        if photo is not None and photo is not cached_photo:
+            cover = encode_cover(ImageTk.getimage(photo))
+            self.__saved_cover = (photo, cover)
+        elif photo is None and self.__last_state is not None:
+            cover = self.__last_state.cover
+        
+        album = self.gui_manager.album_label.title or ""
+        background, text = self.__theme_colors
+        return LastState(title=self.gui_manager.song_label.title or "",
+                         artist=self.gui_manager.artist_label.title or "",
+                         album=album[2:] if album.startswith("- ") else album,
+                         cover=cover,
+                         background=background,
+                         text=text,
+                         is_playing=self.gui_manager.pause_button.is_active,
+                         position=self.__position,
+                         x=self._window.winfo_x(),
+                         y=self._window.winfo_y())
+        
+    def save_last_state(self, in_background: bool = False) -> None:
+        """Saves what the bar shows, if it changed since it was last saved. Must be called on the Tk thread."""
+        if not self.__views_loaded:
+            return
+        try:
+            state = self.__capture_last_state()
+        except TclError as e:
+            logger.debug(f"App.save_last_state: The window is gone, nothing to save: {e}")
+            return
+        if state == self.__saved_state:
+            return
+        self.__saved_state = state
+        
+        if in_background:
+            threading.Thread(target=save_last_state, args=(state,), daemon=True).start()
+        else:
+            save_last_state(state)
+        
+    def __save_periodically(self) -> None:
+        self.save_last_state(in_background=True)
+        self._scheduler.call_later(LAST_STATE_INTERVAL_MS, self.__save_periodically)
+        
+    def on_close(self) -> None:
+        self.save_last_state()
+        super().on_close()
+        
+    def run(self) -> None:
+        try:
+            super().run()
+        finally:
+            self.save_last_state()
       
     def __start_move(self, event: Event) -> None:
         self._window.x = None
@@ -131,6 +253,8 @@ class App(Base):
             width (int): The width of the window.
             height (int): The height of the window.
         """
+        from screeninfo import get_monitors
+
         logger.debug("App.__snap_to_nearest_position: Snapping window to nearest position.")
 
         current_x = self._window.winfo_x()
@@ -161,125 +285,117 @@ class App(Base):
         
         
     def set_background_as_image(self):
-        """Sets the background image of the app as the current tracks image."""
+        """Sets the background image of the app as the current tracks image. 
+            Shows the blurred smallest cover variant first and upgrades it if it's smaller than the window.
+        """
         logger.debug(f"App.set_background_as_image: Loading and background image.")
         try:
-            image_url = self.spotify.get_cover_url()
-            response = requests.get(image_url)
-            image = Image.open(BytesIO(response.content))
-            
+            images = self.spotify.get_cover_images()
             w, h = self._window.winfo_width(), self._window.winfo_height()
-            image = self._resize_image(image, w, h)
-            image = image.filter(ImageFilter.GaussianBlur(radius=25))
-            tk_image = ImageTk.PhotoImage(image)
             
+            preview_url = smallest_cover_url(images)
+            self.__show_background_image(preview_url, w, h)
+            
+            image_url = select_cover_url(images, max(w, h))
+            if image_url != preview_url:
+                self.__show_background_image(image_url, w, h)
+            logger.info("App.set_background_as_image: Requested.")
+        except Exception as e:
+            logger.error(f"App.set_background_as_image: {e}")
+            
+    def __show_background_image(self, image_url: str, width: int, height: int) -> None:
+        """Shows the blurred cover at the given URL as the background. Decoded and blurred off the Tk thread."""
+        self.image_pipeline.load_photo("background", self._scheduler, image_url, (width, height),
+                                       on_done=self.__set_background_photo, blur_radius=25)
+        
+    def __set_background_photo(self, tk_image: ImageTk.PhotoImage) -> None:
+        if self.__renderer == CANVAS_RENDERER:
+            # A label would be hidden under the canvas, so the image is drawn on it.
+            self.canvas_bar.set_background_image(tk_image)
+            return
+        if self.__bg_label is None:
             self.__bg_label = BackgroundImage(self._window, image=tk_image)
-            self.__bg_label.image = tk_image  # Keep a reference to prevent garbage collection
             self.__bg_label.place(x=0, y=0, relwidth=1, relheight=1)
             self.__bg_label.lower()
-            logger.info("App.set_background_as_image: Done.")
-        except Exception as e:
-            logger.error(f"App.set_background_as_image: {e}")
+        else:
+            self.__bg_label.config(image=tk_image)
+        self.__bg_label.image = tk_image  # Keep a reference to prevent garbage collection
 
-    def set_background_song(self, image_url: str | None = None):
-        """Sets the background as the prominent color of the song"""
+    def set_background_song(self, album: dict | None = None):
+        """Sets the background as the prominent color of the song.
+            Albums seen before are themed from the `ThemeIndex`, otherwise the color is computed off the Tk thread.
+        """
         logger.debug(f"App.set_background_song: Loading and background image.")
-        try:
-            if image_url is None:
-                image_url = self.spotify.get_cover_url()
-            response = requests.get(image_url)
-            image = Image.open(BytesIO(response.content))
+        if album is None:
+            album = self.spotify.get_album()
+        if not album:
+            logger.error("App.set_background_song: No album found for the current track.")
+            return
+        
+        theme = self.theme_index.get(album.get("id"), self.__theme_settings)
+        if theme is not None:
+            self.__set_song_theme(theme)
+            return
+        
+        if select_cover_url(album.get("images"), PALETTE_SIZE) is None:
+            logger.error("App.set_background_song: No cover found for the current track.")
+            return
+        
+        self.image_pipeline.run("background_song", self._scheduler, lambda: self.__compute_song_theme(album),
+                                on_done=self.__set_song_theme)
+
+    @property
+    def __theme_settings(self) -> str:
+        """The palette settings a song theme depends on, part of its' `ThemeIndex` key."""
+        return f"{self.__palette_mode}:{'soft' if self.__soft_color_mode else 'raw'}"
+
+    @tracing.traced("palette", "image")
+    def __compute_song_theme(self, album: dict) -> Theme | None:
+        """Computes the theme of the album from its' cover and stores it in the `ThemeIndex`. Off the Tk thread."""
+        image_url = select_cover_url(album.get("images"), PALETTE_SIZE)
+        image = self.cover_cache.get_image(image_url, (PALETTE_SIZE, PALETTE_SIZE))
+        if image is None:
+            return None
+        palette = extract_palette(image, self.__palette_mode, self.__soft_color_mode)
+        theme = Theme(palette.primary, self._get_inversed_color(palette.primary), palette)
+        self.theme_index.put(album.get("id"), self.__theme_settings, theme)
+        return theme
+
+    def _prepare_next_song(self, album: dict) -> None:
+        """Prepares everything an upcoming song needs, so it's shown from memory. Called by the prefetcher, off the Tk thread."""
+        images = album.get("images")
+        self.cover_cache.get_image(select_cover_url(images, TRAY_ICON_SIZE), (TRAY_ICON_SIZE, TRAY_ICON_SIZE))
+        
+        if self.__background_mode == "song":
+            theme = self.theme_index.get(album.get("id"), self.__theme_settings, count=False) or self.__compute_song_theme(album)
+            if theme is not None:
+                self.sprite_cache.warm(theme.text)
 
-            color = self._get_dominant_color(image)
-            self.set_theme(color)
-            
-            self._window.update_idletasks()
-            logger.info("App.set_background_song: Done.")
-        except Exception as e:
-            logger.error(f"App.set_background_song: Error setting background image: {e}")
+    def __set_song_theme(self, theme: Theme | None) -> None:
+        if theme is None:
+            return
+        self.palette = theme.palette
+        self.set_theme(theme.background, theme.text)
 
-    def set_theme(self, color: str) -> None:
-        self._window.configure(background=color)
-        self._set_bg_recursive(self._window, color)
-        
-        inversed_color = self._get_inversed_color(color)
-        self._set_textcolor_recursive(self._window, inversed_color)
-        self.apply_theme(inversed_color)
+    @tracing.traced("theme apply", "theme")
+    def set_theme(self, color: str, text_color: str | None = None) -> None:
+        """Applies the background color, and the text color (or the one that contrasts the background) to the bar."""
+        inversed_color = text_color or self._get_inversed_color(color)
+        self.__theme_colors = (color, inversed_color)
+        self.__set_icon_theme(inversed_color)
+        self.theme_registry.apply(background=color, text=inversed_color)
 
     def _get_inversed_color(self, color: str) -> str:
         return "#FFFFFF" if self._is_dark(color) else "#696B6B"
         
     def apply_theme(self, theme_color: str) -> None:
-        """Pre-process all button images for the current theme, save to a temp dir."""
-        self._recolor_image_folder(src="resources/buttons", dst="resources/buttons_themed", color=theme_color)
-        self.__apply_theme(self._window, theme_color) 
-
-    def __apply_theme(self, widget, color: str) -> None:
-        if not widget:
-            return
-        
-        for child in widget.winfo_children():
-            if isinstance(child, CustomButton) and child.image_path is not None:
-                child.refresh_image()
-            elif isinstance(child, Scale):
-                if child.is_vertical:
-                    line = child._scale_line_vertical
-                else:
-                    line = child._scale_line_horizontal
-                child.update_colors(line, color, color)
-            else:
-                self.__apply_theme(child, color)
-
-    def _recolor_image_folder(self, src: str, dst: str, color: str) -> None:
-        color = ImageColor.getrgb(color)
-        dim = tuple(int(c * 0.8) for c in color)
-        os.makedirs(dst, exist_ok=True)
-        
-        for fname in os.listdir(src):
-            if not fname.endswith(".png"):
-                continue
-            image = Image.open(os.path.join(src, fname)).convert("RGBA")
-            recolored = self._recolor_image(image, color, dim)
-            recolored.save(os.path.join(dst, fname))
-    
-    def _recolor_image(self, image: Image, inversed: tuple[int, int, int], dim: tuple[int]) -> Image:
-        gray = ImageOps.grayscale(image)
-        result = Image.new("RGBA", image.size)
-        
-        pixels = [
-            (
-                int(dim[0] * (1 - t) + inversed[0] * t),
-                int(dim[1] * (1 - t) + inversed[1] * t),
-                int(dim[2] * (1 - t) + inversed[2] * t),
-                a
-            )
-            for g, a in zip(gray.getdata(), image.getchannel("A").getdata())
-            for t in (g / 255,)
-        ]
-            
-        result.putdata(pixels)
-        return result
-    
-    def _set_textcolor_recursive(self, widget, color: str) -> None:
-        try:
-            widget.configure(fg=color)
-        except:
-            pass
-
-        for child in widget.winfo_children():
-            self._set_textcolor_recursive(child, color)
+        """Colors the text, scales and button icons. The icons come from the in-memory `SpriteCache`."""
+        self.__set_icon_theme(theme_color)
+        self.theme_registry.apply(text=theme_color)
 
-    def _set_bg_recursive(self, widget, color: str) -> None:
-        try:
-            widget.configure(bg=color)
-        except:
-            pass
-
-        for child in widget.winfo_children():
-            self._set_bg_recursive(child, color)
-            
-            if isinstance(child, Button):
-                child.configure(activebackground=color)
+    def __set_icon_theme(self, theme_color: str) -> None:
+        self.sprite_cache.set_theme(theme_color)
+        self.sprite_cache.warm(theme_color, photos=True)
 
     def _is_dark(self, hex_color: str) -> bool:
         if "#" not in hex_color:
@@ -289,43 +405,49 @@ class App(Base):
         return (0.299 * r + 0.587 * g + 0.114 * b) < 128
 
     def _get_dominant_color(self, image: ImageFile) -> str:
-        """Gets the prominent color of an image."""
-        image = image.convert("RGB").resize((150, 150))
-        counts: dict = defaultdict(int)
-        for r, g, b in image.getdata():
-            counts[(r // 16, g // 16, b // 16)] += 1
-            
-        top = sorted(counts.items(), key=lambda x: x[1], reverse=True)[:5][::-1]
-        chosen_bucket, chosen_count = None, 0
-        
-        for bucket, count in top:
-            r, g, b = (x* 16 + 8 for x in bucket)
-            brightness = 0.299*r + 0.586*g + 0.114*b
-            if brightness < 40 and count < chosen_count * 2.5:
-                continue
-            chosen_bucket, chosen_count = bucket, count
-            
-        if chosen_bucket is None:
-            chosen_bucket = top[0][0]
-
-        r, g, b = (x * 16 + 8 for x in chosen_bucket)
-        color = (self._soften_color((r, g, b)) if self.__soft_color_mode else (r, g, b))
-        return "#%02x%02x%02x" % color
-
-    def _soften_color(self, rgb: tuple[int, int, int]) -> tuple[int, int, int]:
-        r, g, b = (x / 255 for x in rgb)
-        h, s, v = colorsys.rgb_to_hsv(r, g, b)
-        s = min(s, 0.95)
-        v = min(v, 0.87)
-        r, g, b = colorsys.hsv_to_rgb(h, s, v)
-        return tuple([int(r*255), int(g*255), int(b*255)])
-
-    def _resize_image(self, image: PhotoImage, fixed_width: int, fixed_height: int) -> PhotoImage:
-        return image.resize((fixed_width, fixed_height), Image.Resampling.LANCZOS)
+        """Gets the prominent color of an image. The rest of its' palette is kept in `self.palette`."""
+        self.palette = extract_palette(image, self.__palette_mode, self.__soft_color_mode)
+        return self.palette.primary
 
+    @tracing.traced("Tk build", "gui")
     def _create_buttons(self, window: Tk) -> None:
         """A function that creates the spotify buttons for a given window."""
         logger.debug("App._create_buttons: Creating buttons.")
+        self.theme_registry = ThemeRegistry.of(window)
+        self.theme_registry.register(window, BACKGROUND)
+        
+        if self.__renderer == CANVAS_RENDERER:
+            self.__create_canvas_bar(window)
+        else:
+            self.__create_widgets(window)
+        
+        self.system_tray.gui_manager = self.gui_manager 
+        
+        self.set_background()
+        if self.__last_state is not None:
+            self.__show_last_state(self.__last_state)
+
+        logger.debug("App._create_buttons: Done.")
+
+    def __show_last_state(self, state: LastState) -> None:
+        """Renders the saved state before the window is shown, the live state replaces it once it's loaded."""
+        if self.__background_mode == "song" and state.background:
+            self.set_theme(state.background, state.text)
+        self.gui_manager.show_last_state(state)
+
+    def __load_placeholder(self) -> ImageTk.PhotoImage:
+        """The cover shown until the first track loads."""
+        try:
+            image = Image.open("./resources/images/place_holder.png")
+        except FileNotFoundError:
+            logger.error("App.__load_placeholder: Placeholder image not found.")
+            return None
+        image.thumbnail((85, 85))
+        return ImageTk.PhotoImage(image)
+
+    def __create_widgets(self, window: Tk) -> None:
+        """Builds the bar out of separate widgets."""
+        placeholder = self.__load_placeholder()
         self.playback_scale = PlaybackScale(window)
         self.playback_scale.place(relx=0.5, rely=0.9, anchor="center")
         self.volume_scale = VolumeScale(window)
@@ -334,11 +456,9 @@ class App(Base):
         self.exit_button = ExitButton(window, width=100)
         self.exit_button.place(relx=1.0, rely=0.0, x=0, y=0, anchor="ne")
         
-        window.update_idletasks() 
-        window.update() 
-        
         button_frame = Frame(window, bg=window.cget('bg'))
         button_frame.place(relx=0.478, y=135, anchor="center")
+        self.theme_registry.register(button_frame, BACKGROUND)
                 
         self.shuffle_button = ShuffleButton(button_frame)
         self.shuffle_button.pack(side="left", padx=1)
@@ -355,59 +475,108 @@ class App(Base):
         self.repeat_button = RepeatButton(button_frame)
         self.repeat_button.pack(side="left", padx=1)
         
-        try:
-            image = Image.open("./resources/images/place_holder.png")
-        except FileNotFoundError:
-            logger.error("App._create_buttons: Placeholder image not found.")
-        image.thumbnail((85, 85))
-        tk_image = ImageTk.PhotoImage(image)
-        self.__song_pic = Label(window, image=tk_image, bg="black") 
-        self.__song_pic.image = tk_image 
-        self.__song_pic.place(x=30, y=20)
-        
-        window.update_idletasks()
-        self.song_name = SongLabel(window, max_width=200)
-        self.song_name.place(x=self.__song_pic.winfo_x() + 96, y=self.__song_pic.winfo_y() + 8)
+        self.__song_pic = Label(window, image=placeholder, bg="black") 
+        self.__song_pic.image = placeholder 
+        self.__song_pic.place(x=COVER_POSITION[0], y=COVER_POSITION[1])
+        self.theme_registry.register(self.__song_pic, BACKGROUND)
+        
+        # Long titles either scroll or get cut with "…".
+        label_class = MarqueeLabel if self.__marquee else SongLabel
+        
+        self.song_name = label_class(window, max_width=TITLE_MAX_WIDTH)
+        self.song_name.place(x=SONG_POSITION[0], y=SONG_POSITION[1])
         self.song_name.title = "Song Label"
         
-        window.update_idletasks()
-        self.artist_name = SongLabel(window, font_size=10, is_bold=False, max_width=200)
-        self.artist_name.place(x=self.song_name.winfo_x(), y=self.song_name.winfo_y() + 22)
+        self.artist_name = label_class(window, font_size=10, is_bold=False, max_width=TITLE_MAX_WIDTH)
+        self.artist_name.place(x=ARTIST_POSITION[0], y=ARTIST_POSITION[1])
         self.artist_name.title = "Artist Label"
         
-        window.update_idletasks()
-        self.album_name = SongLabel(window, font_size=10, is_bold=False, max_width=125)
-        self.album_name.place(x=self.artist_name.winfo_x(), y=self.artist_name.winfo_y())
+        self.album_name = label_class(window, font_size=10, is_bold=False, max_width=ALBUM_MAX_WIDTH)
+        self.album_name.place(x=ARTIST_POSITION[0], y=ARTIST_POSITION[1])
         self.album_name.title = "Album Label"
         
         self.gui_manager = GuiManager(
-                window, on_next_song=self._on_next_song, playback_scale=self.playback_scale, volume_scale=self.volume_scale,
+                window, on_next_song=self._on_next_song, prepare_next_song=self._prepare_next_song, playback_scale=self.playback_scale, volume_scale=self.volume_scale,
                 exit_button=self.exit_button, pause_button=self.pause_button, next_button=self.next_button,
                 repeat_button=self.repeat_button, previous_button=self.prev_button, shuffle_button=self.shuffle_button,
                 song_pic=self.__song_pic, song_label=self.song_name, artist_label=self.artist_name,
                 album_label=self.album_name
                 )
-        
-        self.system_tray.gui_manager = self.gui_manager 
-        
-        self.set_background()
 
-        logger.debug("App._create_buttons: Done.")
+    def __create_canvas_bar(self, window: Tk) -> None:
+        """Draws the whole bar on a single canvas."""
+        width, height = WINDOW_SIZE
+        self.canvas_bar = CanvasBar(window, width, height, placeholder=self.__load_placeholder())
+        self.canvas_bar.place(x=0, y=0)
+        
+        self.gui_manager = GuiManager(
+                window, on_next_song=self._on_next_song, prepare_next_song=self._prepare_next_song, **self.canvas_bar.views()
+                )
 
     def set_background(self) -> None:
         if not self.__background_mode == "default":
             return
-        if self._background_color is not None:
-            self.set_theme(self._background_color)
-        if self.__buttons_color is not None:
-            self._set_textcolor_recursive(self._window, self.__buttons_color)
-            self.apply_theme(self.__buttons_color)
+        try:
+            if self._background_color is not None:
+                self.set_theme(self._background_color)
+            if self.__buttons_color is not None:
+                self.apply_theme(self.__buttons_color)
+        except TclError:
+            logger.error(f"App.set_background: Invalid color '{self._background_color}' or '{self.__buttons_color}'")
 
+    def apply_config(self, config: Config, changed: list[str]) -> None:
+        """Applies a changed config to the running bar. Must be called on the Tk thread.
+            The position, padding, opacity, colors and background mode change live, the rest on the next launch.
 
-    def _on_next_song(self, image_url: str | None = None) -> None:
-        """Called on the next song"""
+        Args:
+            config (Config): The new config.
+            changed (list[str]): The fields of the config that changed.
+        """
+        restart = [field for field in changed if field in RESTART_FIELDS]
+        if restart:
+            logger.warning(f"App.apply_config: {', '.join(restart)} will change on the next launch.")
+        
+        if "position" in changed or "padding" in changed:
+            self.__position, self.__padding = config.position, config.padding
+            self.__set_initial_position(*WINDOW_SIZE)
+        
+        if "opacity" in changed:
+            self.opacity = config.opacity
+        
+        if any(field in changed for field in BACKGROUND_FIELDS):
+            self.__background_mode = config.background_mode
+            self._background_color = config.background_color
+            self.__buttons_color = config.buttons_color
+            self.__soft_color_mode = config.soft_color_mode
+            self.__palette_mode = config.palette_mode
+            self.__apply_background_mode()
+        logger.info(f"App.apply_config: Applied {', '.join(changed)}.")
+
+    def __apply_background_mode(self) -> None:
+        if self.__background_mode != "background_only":
+            if self.__bg_label is not None:
+                self.__bg_label.destroy()
+                self.__bg_label = None
+            if self.__renderer == CANVAS_RENDERER:
+                self.canvas_bar.set_background_image(None)
+        
+        if self.__background_mode == "default":
+            self.set_background()
+        elif self.__background_mode == "song":
+            # The album is fetched off the Tk thread, the theme is applied back on it.
+            threading.Thread(target=lambda: self.post(self.set_background_song, self.spotify.get_album() or {}),
+                             daemon=True).start()
+        elif self.__background_mode == "background_only":
+            self.set_background_as_image()
+
+
+    def _on_next_song(self, album: dict | None = None) -> None:
+        """Called on the next song with its' album, fetched here if not given."""
+        if album is None:
+            album = self.spotify.get_album() or {}
+        self.system_tray.set_cover(select_cover_url(album.get("images"), TRAY_ICON_SIZE))
         if self.__background_mode == "song":
-            self.set_background_song(image_url)
+            self.set_background_song(album)
 
 
     
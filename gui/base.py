@@ -13,6 +13,7 @@
 # limitations under the License.
 
 from logger import logger
+from views.frame_scheduler import FrameScheduler
 from tkinter import Tk, TclError, Event
 import ctypes
 from typing import Callable, Union
@@ -22,9 +23,11 @@ class Base():
                  title: str,
                  icon_path: str,
                  opacity: float = 1,
-                 background_color: str = "lightgray") -> None:
-        logger.debug(f"Base.__init__: Initializing with {title=}, {icon_path=}, {opacity=}, {background_color=}")
+                 background_color: str = "lightgray",
+                 frame_rate: int = 30) -> None:
+        logger.debug(f"Base.__init__: Initializing with {title=}, {icon_path=}, {opacity=}, {background_color=}, {frame_rate=}")
         self._window: Tk = Tk()
+        self._scheduler: FrameScheduler = FrameScheduler(self._window, frame_rate)
         self._title: str = title
         self._icon_path: str = icon_path
         self._opacity: float = opacity
@@ -56,8 +59,8 @@ class Base():
         self._make_borderless()
         self._set_rounded_corners()
         window.wm_attributes("-topmost", 1)
-        window.after(500, self._make_borderless)
-        window.after(500, self._set_rounded_corners)
+        self._scheduler.call_later(500, self._make_borderless)
+        self._scheduler.call_later(500, self._set_rounded_corners)
         
         window.update()
         window.bind("<Button-1>", self._start_move)
@@ -74,6 +77,7 @@ class Base():
         
     def on_close(self) -> None:
         logger.info("Base: Window closed.")
+        self._scheduler.stop()
         self._window.destroy()
         
     def _make_borderless(self) -> None:
@@ -117,6 +121,17 @@ class Base():
             new_y = self._window.winfo_y() + (event.y - self._window.y)
             self._window.geometry(f"+{new_x}+{new_y}")
             
+    def post(self, func: Callable, *args) -> None:
+        """Runs `func(*args)` on the Tk thread. Safe to call from any thread."""
+        self._scheduler.post(func, *args)
+
+    def call_later(self, delay_ms: int, func: Callable, *args) -> int:
+        """Runs `func(*args)` on the Tk thread after `delay_ms`. Returns an id usable with `cancel`."""
+        return self._scheduler.call_later(delay_ms, func, *args)
+
+    def cancel(self, timer_id: int) -> None:
+        self._scheduler.cancel(timer_id)
+            
     @property
     def opacity(self) -> float:
         return self._opacity
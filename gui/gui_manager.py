@@ -13,41 +13,59 @@
 # limitations under the License.
 
 import threading
-from tkinter import Label, PhotoImage
-from PIL import Image, ImageTk
-import requests
-from io import BytesIO
+from tkinter import Label
+from PIL import ImageTk
 import time
 from typing import Union, TypedDict, Unpack, Callable
 
 from api import Spotify
+from gui.last_state import LastState, decode_cover
+from gui.prefetcher import Prefetcher, TrackViewModel
 from logger import logger
+import tracing
+from media import CoverImages, ImagePipeline, select_cover_url, smallest_cover_url
+from views.frame_scheduler import FrameScheduler
 from views.scales import PlaybackScale, VolumeScale
 from views.buttons import ExitButton, NextButton, PreviousButton, PauseButton, RepeatButton, ShuffleButton
-from views.label import SongLabel, TimeLabel, SONG, ARTIST, ALBUM
+from views.layout import album_placement
+from views.label import TrackText, TimeLabel, SONG, ARTIST, ALBUM
+from views.canvas.buttons import CanvasCallbackButton, CanvasExitButton, CanvasPauseButton, CanvasRepeatButton, CanvasShuffleButton
+from views.canvas.items import CanvasImage
+from views.canvas.scales import CanvasPlaybackScale, CanvasVolumeScale
+
+THUMBNAIL_SIZE = 83
 
 class ViewComponents(TypedDict, total=False):
-    exit_button: ExitButton
-    next_button: NextButton
-    previous_button: PreviousButton
-    pause_button: PauseButton
-    repeat_button: RepeatButton
-    shuffle_button: ShuffleButton
-    song_label: SongLabel
-    artist_label: SongLabel
-    album_label: SongLabel
+    exit_button: Union[ExitButton, CanvasExitButton]
+    next_button: Union[NextButton, CanvasCallbackButton]
+    previous_button: Union[PreviousButton, CanvasCallbackButton]
+    pause_button: Union[PauseButton, CanvasPauseButton]
+    repeat_button: Union[RepeatButton, CanvasRepeatButton]
+    shuffle_button: Union[ShuffleButton, CanvasShuffleButton]
+    song_label: TrackText
+    artist_label: TrackText
+    album_label: TrackText
     time_label: TimeLabel
-    playback_scale: PlaybackScale
-    volume_scale: VolumeScale
-    song_pic: Label
+    playback_scale: Union[PlaybackScale, CanvasPlaybackScale]
+    volume_scale: Union[VolumeScale, CanvasVolumeScale]
+    song_pic: Union[Label, CanvasImage]
 
 class GuiManager():
-    def __init__(self, master, on_next_song: Callable | None = None, **kwargs: Unpack[ViewComponents]) -> None:
-        """Manages the given views."""
+    def __init__(self,
+                 master,
+                 on_next_song: Callable | None = None,
+                 prepare_next_song: Callable | None = None,
+                 **kwargs: Unpack[ViewComponents]) -> None:
+        """Manages the given views.
+            `prepare_next_song` is called off the Tk thread with the album of every prefetched track.
+        """
         
         self.master = master
         self.views = kwargs
         self.spotify = Spotify()
+        self.scheduler = FrameScheduler.of(master)
+        self.image_pipeline = ImagePipeline()
+        self.prefetcher = Prefetcher(THUMBNAIL_SIZE, prepare=prepare_next_song)
         
         self.skip_count = 0 
         self.last_skip_time = 0 
@@ -59,39 +77,45 @@ class GuiManager():
         self._check_pause_thread_id = None
         self.current_track = None
         self.on_next_song = on_next_song
+        # The trace flow of the last skip, from the click to the render of the new track.
+        self._action_flow = None
+        # The last cover shown in `song_pic`, None until one is loaded.
+        self.cover_photo: Union[ImageTk.PhotoImage, None] = None
         
         for name, value in self.views.items():
             setattr(self, name, value)
         
         
+    @tracing.traced("load views", "gui")
     def load_all(self) -> None:
         """Load all of the given views."""
         logger.info("GuiManager.load_all: Loading all views...")
         
+        # Each view is either a widget, or an item of the single canvas renderer.
         components = [
-            ('playback_scale', PlaybackScale, lambda c: (
+            ('playback_scale', (PlaybackScale, CanvasPlaybackScale), lambda c: (
                 c.set_callback(self.on_playback_scale_next),
                 c.load()
             )),
-            ('volume_scale', VolumeScale, lambda c: c.load()),
-            ('next_button', NextButton, lambda c: c.set_callback(self.on_next_button_click)),
-            ('previous_button', PreviousButton, lambda c: c.set_callback(self.on_previous_button_click)),
-            ('pause_button', PauseButton, lambda c: (
+            ('volume_scale', (VolumeScale, CanvasVolumeScale), lambda c: c.load()),
+            ('next_button', (NextButton, CanvasCallbackButton), lambda c: c.set_callback(self.on_next_button_click)),
+            ('previous_button', (PreviousButton, CanvasCallbackButton), lambda c: c.set_callback(self.on_previous_button_click)),
+            ('pause_button', (PauseButton, CanvasPauseButton), lambda c: (
                 c.set_callback(self.on_pause_button_click),
                 c.load()
             )),
-            ('shuffle_button', ShuffleButton, lambda c: c.load()),
-            ('repeat_button', RepeatButton, lambda c: c.load()),
-            ('song_label', SongLabel, lambda c: c.load(type=SONG)),
-            ('artist_label', SongLabel, lambda c: (
+            ('shuffle_button', (ShuffleButton, CanvasShuffleButton), lambda c: c.load()),
+            ('repeat_button', (RepeatButton, CanvasRepeatButton), lambda c: c.load()),
+            ('song_label', TrackText, lambda c: c.load(type=SONG)),
+            ('artist_label', TrackText, lambda c: (
                 c.set_callback(self.on_button_click_artist),
                 c.load(type=ARTIST)
             )),
-            ('album_label', SongLabel, lambda c: (
+            ('album_label', TrackText, lambda c: (
                 c.set_callback(self.on_button_click_album),
                 self.__load_album_label()
             )),
-            ('song_pic', Label, lambda c: self.__load_song_image()),
+            ('song_pic', (Label, CanvasImage), lambda c: self.__load_song_image()),
         ]
         
         for attr_name, expected_type, setup_func in components:
@@ -108,12 +132,26 @@ class GuiManager():
         if hasattr(self, 'song_label') and self.song_label.title == "Unknown":
             self._handle_unknown_song()
 
+        self.prefetcher.prefetch()
+
         if self._check_manager_thread_id is None:
             threading.Thread(target=self.__changes_check_manager).start()
             logger.debug("GuiManager.load_all: Started background thread.")
             
         logger.debug("GuiManager.load_all: Function has completed.")
     
+    def show_last_state(self, state: LastState) -> None:
+        """Shows the track the bar last showed, until the live state is loaded by `load_all`."""
+        self.song_label.title = state.title
+        self.artist_label.title = state.artist
+        self.__load_album_label(title=state.album)
+        
+        cover = decode_cover(state.cover)
+        if cover is not None:
+            self.image_pipeline.show("song_pic", cover, on_done=self.__set_song_pic)
+        self.pause_button.is_active = state.is_playing
+        logger.debug("GuiManager.show_last_state: Showing the last state.")
+    
     def _handle_unknown_song(self) -> None:
         """Handle the case where song info is not yet available."""
         volume = self.spotify.volume 
@@ -169,6 +207,8 @@ class GuiManager():
     def on_next_button_click(self):
         """Callback function for when the next button is clicked."""
         logger.debug("GuiManager.on_next_button_click: Next button clicked.")
+        self._action_flow = tracing.new_flow()
+        tracing.instant("next clicked", "input")
         current_time = time.time()
 
         if current_time - self.last_skip_time > self.skip_reset_duration:
@@ -292,9 +332,10 @@ class GuiManager():
         """Skips to the next song(s), depands on self.skip_count"""
         logger.info("GuiManager._skip_to_next: Skipping to next track.")
         self.skipping = True
-        for _ in range(self.skip_count):
-            self.spotify.skip_to_next()
-            time.sleep(0.1)
+        with tracing.span("skip to next", "gui", flow=self._action_flow, skips=self.skip_count):
+            for _ in range(self.skip_count):
+                self.spotify.skip_to_next()
+                time.sleep(0.1)
         self.playback_scale.reset()
         
         self.skipping = False
@@ -302,24 +343,54 @@ class GuiManager():
         logger.debug(f"GuiManager._skip_to_next: Function has completed.")
  
     def _load_next_track_details(self):
-        """Loads the next track in queue details."""
-        logger.info("GuiManager._load_next_track_details: Loading next track details.")
-        queue = self.spotify.get_queue()
+        """Loads the next track in queue details. Rendered from the prefetched view model when it's staged."""
+        with tracing.span("load next track", "gui", flow=self._action_flow):
+            logger.info("GuiManager._load_next_track_details: Loading next track details.")
+            staged = self.prefetcher.staged(self.skip_count)
+            if staged is not None:
+                self.scheduler.post(self.__show_track, staged)
+                logger.debug("GuiManager._load_next_track_details: Showing the prefetched track.")
+                return
+        
+            queue = self.spotify.get_queue()
 
-        if self.skip_count <= len(queue):
-            target_track = queue[self.skip_count - 1]
-            self.song_label.title = target_track["name"]
-            self.artist_label.title = target_track["artists"][0]["name"]
-            self.__load_album_label(title=target_track["album"]["name"])
+            if self.skip_count <= len(queue):
+                target_track = queue[self.skip_count - 1]
+                self.song_label.title = target_track["name"]
+                self.artist_label.title = target_track["artists"][0]["name"]
+                self.__load_album_label(title=target_track["album"]["name"])
             
-            image_url = target_track["album"]["images"][0]["url"]
-            self.__load_song_image(image_url)
+                album = target_track["album"]
+                self.__load_song_image(album["images"])
 
-            self.playback_scale.reset()
-            self.playback_scale.end_time.miliseconds = target_track["duration_ms"]
-            self.on_next_song(image_url)
+                self.playback_scale.reset()
+                self.playback_scale.end_time.miliseconds = target_track["duration_ms"]
+                self.on_next_song(album)
 
-        logger.debug(f"GuiManager._load_next_track_details: Function has completed.")
+            self.prefetcher.prefetch()
+            logger.debug("GuiManager._load_next_track_details: Function has completed.")
+
+    def __show_track(self, track: TrackViewModel) -> None:
+        """Shows a prefetched track in a single pass on the Tk thread, without any network or disk access.
+            If the queue changed since it was prefetched, the song change check corrects it within a second.
+        """
+        with tracing.span("render track", "render", flow=self._action_flow):
+            start = time.perf_counter()
+            self.song_label.title = track.title
+            self.artist_label.title = track.artist
+            self.__load_album_label(title=track.album_title)
+        
+            if track.thumbnail is not None:
+                self.image_pipeline.show("song_pic", track.thumbnail, on_done=self.__set_song_pic)
+            else:
+                self.__load_song_image(track.album.get("images"))
+        
+            self.playback_scale.reset()
+            self.playback_scale.end_time.miliseconds = track.duration_ms
+            self.on_next_song(track.album)
+        
+            self.prefetcher.prefetch()
+        logger.debug(f"GuiManager.__show_track: Shown in {(time.perf_counter() - start) * 1000:.1f}ms.")
 
         
     def __current_track_load_views(self) -> None:
@@ -331,6 +402,7 @@ class GuiManager():
         self.__load_album_label()
         self.__load_song_image()
         self.on_next_song()
+        self.prefetcher.prefetch()
         
         logger.debug(f"GuiManager.__current_track_load_views: Function has completed.")
         
@@ -341,12 +413,10 @@ class GuiManager():
             title (str, optional): The title of the label. Defaults to None.
         """
         logger.debug("GuiManager.__load_album_label: Loading album label.")
-        self.master.update_idletasks()
-            
-        artist_label_width = self.artist_label.winfo_width()
+        x, y, max_width = album_placement(self.artist_label.text_width)
         
-        self.album_label.place(x=self.artist_label.winfo_x() + artist_label_width, y=self.artist_label.winfo_y())
-        self.album_label.max_width = 230 - artist_label_width
+        self.album_label.place(x=x, y=y)
+        self.album_label.max_width = max_width
         if title:
             self.album_label.title = f"- {title}"
         else:
@@ -354,49 +424,33 @@ class GuiManager():
         
         logger.debug("GuiManager.__load_album_label: Function has completed.")
 
-    def __load_song_image(self, image_url: str = None) -> None:
-        """Fetch and update the song image in the song_pic label."""
+    def __load_song_image(self, images: CoverImages = None) -> None:
+        """Fetch and update the song image in the song_pic label. 
+            Shows the smallest cover variant first and upgrades it only if it's smaller than the label.
+        """
         logger.debug("GuiManager.__load_song_image: Loading the currents tracks' image.")
-        if not image_url:
-            image_url = self.spotify.get_cover_url()
+        if not images:
+            images = self.spotify.get_cover_images()
         
         try:
-            response = requests.get(image_url)
-            img_data = response.content
-            image = Image.open(BytesIO(img_data))
-            
-            # Get a fixed size for the image (could be the label's initial size or a max size you want)
-            fixed_width = 83  
-            fixed_height = 83 
-            
-            image = self._resize_image_maintaining_aspect_ratio(image, fixed_width, fixed_height)
+            preview_url = smallest_cover_url(images)
+            self.__show_song_image(preview_url)
             
-            photo = ImageTk.PhotoImage(image)
-            
-            self.song_pic.config(image=photo)
-            self.song_pic.image = photo  # Keep a reference to the image to prevent garbage collection
+            image_url = select_cover_url(images, THUMBNAIL_SIZE)
+            if image_url != preview_url:
+                self.__show_song_image(image_url)
             
         except Exception as e:
             logger.error(f"GuiManager.__load_song_image: Error loading song image: {e}")
             
         logger.debug("GuiManager.__load_song_image: Function has completed.")
-            
-    def _resize_image_maintaining_aspect_ratio(self, image: PhotoImage, max_width: int, max_height: int) -> PhotoImage:
-        """Resize the image while maintaining its aspect ratio."""
-        logger.debug("GuiManager._resize_image_maintaining_aspect_ratio: Resizing the image.")
-        img_width, img_height = image.size
-        aspect_ratio = img_width / img_height
-        
-        if img_width > max_width or img_height > max_height:
-            if img_width / max_width > img_height / max_height:
-                new_width = max_width
-                new_height = int(max_width / aspect_ratio)
-            else:
-                new_height = max_height
-                new_width = int(max_height * aspect_ratio)
-            image = image.resize((new_width, new_height), Image.Resampling.LANCZOS)
         
-        logger.debug("GuiManager._resize_image_maintaining_aspect_ratio: Function has completed.")
-        return image
-    
-    
\ No newline at end of file
+    def __show_song_image(self, image_url: str) -> None:
+        """Shows the cover at the given URL in the song_pic label. Decoded off the Tk thread."""
+        self.image_pipeline.load_photo("song_pic", self.scheduler, image_url, (THUMBNAIL_SIZE, THUMBNAIL_SIZE),
+                                       on_done=self.__set_song_pic, keep_aspect_ratio=True)
+        
+    def __set_song_pic(self, photo: ImageTk.PhotoImage) -> None:
+        self.song_pic.config(image=photo)
+        self.song_pic.image = photo  # Keep a reference to the image to prevent garbage collection
+        self.cover_photo = photo
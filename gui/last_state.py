@@ -0,0 +1,116 @@
+# Copyright 2026 Sagi Tsafrir
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import base64
+import json
+import os
+import sys
+import tempfile
+from io import BytesIO
+from pathlib import Path
+from typing import NamedTuple, Union
+
+from PIL import Image
+
+from logger import logger
+
+if getattr(sys, "frozen", False):
+    base_dir = Path(sys.executable).resolve().parent
+else:
+    base_dir = Path(__file__).resolve().parent.parent
+
+STATE_PATH = base_dir / "cache" / "last_state.json"
+STATE_VERSION = 1
+COVER_QUALITY = 85
+
+class LastState(NamedTuple):
+    """What the bar last showed, rendered on the next launch until the live state is loaded."""
+    title: str
+    artist: str
+    album: str
+    cover: Union[bytes, None]
+    background: Union[str, None]
+    text: Union[str, None]
+    is_playing: bool
+    position: str
+    x: int
+    y: int
+
+def encode_cover(image: Image.Image) -> bytes:
+    """Encodes the cover thumbnail as a JPEG."""
+    buffer = BytesIO()
+    image.convert("RGB").save(buffer, "JPEG", quality=COVER_QUALITY)
+    return buffer.getvalue()
+
+def decode_cover(data: Union[bytes, None]) -> Union[Image.Image, None]:
+    if not data:
+        return None
+    try:
+        image = Image.open(BytesIO(data))
+        image.load()
+        return image
+    except OSError as e:
+        logger.error(f"last_state.decode_cover: Failed to decode the saved cover: {e}")
+        return None
+
+def load_last_state(path: Path = STATE_PATH) -> Union[LastState, None]:
+    """Loads the saved state. Returns None if there is none, or it can't be read."""
+    try:
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.error(f"last_state.load_last_state: Failed to read '{path}': {e}")
+        return None
+
+    if data.get("version") != STATE_VERSION:
+        return None
+    try:
+        cover = base64.b64decode(data["cover"]) if data.get("cover") else None
+        return LastState(title=str(data["title"]),
+                         artist=str(data["artist"]),
+                         album=str(data["album"]),
+                         cover=cover,
+                         background=data.get("background"),
+                         text=data.get("text"),
+                         is_playing=bool(data["is_playing"]),
+                         position=str(data["position"]),
+                         x=int(data["x"]),
+                         y=int(data["y"]))
+    except (KeyError, TypeError, ValueError) as e:
+        logger.error(f"last_state.load_last_state: Invalid state in '{path}': {e}")
+        return None
+
+def save_last_state(state: LastState, path: Path = STATE_PATH) -> None:
+    """Saves the state, replacing the previous one at once so it's never left half written."""
+    data = state._asdict()
+    data["cover"] = base64.b64encode(state.cover).decode("ascii") if state.cover else None
+    data["version"] = STATE_VERSION
+
+    path = Path(path)
+    temp_path = None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # A temp file of its' own, so a background save and the one on exit never write the same file.
+        with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=path.parent, prefix=f".tmp-{path.name}",
+                                         delete=False) as file:
+            temp_path = Path(file.name)
+            file.write(json.dumps(data, separators=(",", ":")))
+        os.replace(temp_path, path)
+        logger.debug(f"last_state.save_last_state: Saved '{state.title}'.")
+    except OSError as e:
+        logger.error(f"last_state.save_last_state: Failed to write '{path}': {e}")
+        if temp_path is not None:
+            temp_path.unlink(missing_ok=True)
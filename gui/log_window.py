@@ -0,0 +1,62 @@
+# Copyright 2026 Sagi Tsafrir
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from tkinter import Button, Frame, Misc, Scrollbar, Text, Toplevel, TclError
+
+from logger import logger, recent_logs
+
+class LogWindow(Toplevel):
+    def __init__(self, master: Misc) -> None:
+        """A window with the recent log records, from the in-memory ring buffer of the logger."""
+        super().__init__(master)
+        self.title("Spotify Bar - Log")
+        self.geometry("720x360")
+        self.wm_attributes("-topmost", 1)
+
+        buttons = Frame(self)
+        buttons.pack(side="bottom", fill="x")
+        Button(buttons, text="Refresh", command=self.refresh).pack(side="right", padx=5, pady=5)
+
+        scrollbar = Scrollbar(self)
+        scrollbar.pack(side="right", fill="y")
+        self.__text = Text(self, wrap="none", font=("Consolas", 9), yscrollcommand=scrollbar.set)
+        self.__text.pack(side="left", fill="both", expand=True)
+        scrollbar.config(command=self.__text.yview)
+
+        self.refresh()
+
+    @classmethod
+    def show(cls, master: Misc) -> "LogWindow":
+        """Shows the log window of the master window, creating it if it's not open. Must be called on the Tk thread."""
+        window = master.winfo_toplevel()
+        log_window = getattr(window, "_log_window", None)
+        try:
+            if log_window is not None and log_window.winfo_exists():
+                log_window.refresh()
+                log_window.lift()
+                return log_window
+        except TclError:
+            pass
+        log_window = window._log_window = cls(window)
+        return log_window
+
+    def refresh(self) -> None:
+        lines = recent_logs()
+        self.__text.config(state="normal")
+        self.__text.delete("1.0", "end")
+        self.__text.insert("end", "\n".join(lines))
+        self.__text.config(state="disabled")
+        self.__text.see("end")
+        logger.debug("LogWindow.refresh: Showing %d records.", len(lines))
@@ -0,0 +1,118 @@
+# Copyright 2026 Sagi Tsafrir
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from typing import Any, Callable, NamedTuple, Union
+
+from PIL import Image
+
+from api import Spotify
+from logger import logger
+from media import CoverCache, select_cover_url
+from media.decode import decode_image, fit_size
+
+PREFETCH_COUNT = 2
+
+class TrackViewModel(NamedTuple):
+    """Everything the bar shows for a track, ready to be rendered without any network or disk access."""
+    track_id: str
+    title: str
+    artist: str
+    album_title: str
+    album: dict[str, Any]
+    duration_ms: int
+    thumbnail: Union[Image.Image, None]
+
+class Prefetcher():
+    def __init__(self,
+                 thumbnail_size: int,
+                 prepare: Union[Callable[[dict[str, Any]], None], None] = None,
+                 count: int = PREFETCH_COUNT) -> None:
+        """Prepares the next tracks in the queue while the current one plays.
+
+            For each of the next `count` tracks the cover is downloaded and decoded to the thumbnail size,
+            `prepare` is called with the album (so the app can precompute its' theme), and a `TrackViewModel`
+            is staged. All of the work runs on a single worker thread.
+
+        Args:
+            thumbnail_size (int): The size of the cover thumbnail in the bar.
+            prepare (Callable, optional): Called on the worker with the album of every prefetched track.
+            count (int, optional): How many tracks ahead to prefetch.
+        """
+        self.thumbnail_size = thumbnail_size
+        self.prepare = prepare
+        self.count = count
+        self.spotify = Spotify()
+
+        self.__executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="prefetcher")
+        self.__staged: list[TrackViewModel] = []
+        self.__lock = threading.Lock()
+
+    def prefetch(self) -> None:
+        """Starts prefetching the next tracks of the queue. Called when a track starts."""
+        with self.__lock:
+            self.__staged = []
+        self.__executor.submit(self.__prefetch)
+
+    def staged(self, position: int) -> Union[TrackViewModel, None]:
+        """Returns the staged view model of the track `position` places ahead in the queue (1 is the next track),
+            or None if it is not ready yet."""
+        with self.__lock:
+            if 1 <= position <= len(self.__staged):
+                return self.__staged[position - 1]
+        return None
+
+    def __prefetch(self) -> None:
+        start = time.perf_counter()
+        try:
+            queue = self.spotify.get_queue() or []
+        except Exception as e:
+            logger.error(f"Prefetcher.__prefetch: Failed to get the queue: {e}")
+            return
+
+        for track in queue[:self.count]:
+            try:
+                model = self.__stage(track)
+            except Exception as e:
+                logger.error(f"Prefetcher.__prefetch: Failed to prefetch '{track.get('name')}': {e}")
+                return
+            with self.__lock:
+                self.__staged.append(model)
+
+        logger.debug(f"Prefetcher.__prefetch: Staged {len(self.__staged)} tracks in {(time.perf_counter() - start) * 1000:.0f}ms.")
+
+    def __stage(self, track: dict[str, Any]) -> TrackViewModel:
+        album = track.get("album") or {}
+
+        thumbnail = None
+        data = CoverCache().get_bytes(select_cover_url(album.get("images"), self.thumbnail_size))
+        if data is not None:
+            with Image.open(BytesIO(data)) as probe:
+                size = fit_size(probe.size, self.thumbnail_size, self.thumbnail_size)
+            thumbnail = decode_image(data, size)
+
+        if self.prepare is not None:
+            self.prepare(album)
+
+        return TrackViewModel(track_id=track.get("id"),
+                              title=track["name"],
+                              artist=track["artists"][0]["name"],
+                              album_title=album.get("name", ""),
+                              album=album,
+                              duration_ms=track["duration_ms"],
+                              thumbnail=thumbnail)
@@ -12,8 +12,63 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import atexit
+import logging
+import queue
+import re
+import sys
+from collections import deque
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from pathlib import Path
+
 import colorlog
 
+if getattr(sys, "frozen", False):
+    base_dir = Path(sys.executable).resolve().parent
+else:
+    base_dir = Path(__file__).resolve().parent
+
+LOG_PATH = base_dir / "logs" / "spotify_bar.log"
+LOG_MAX_BYTES = 1024 * 1024
+LOG_BACKUPS = 3
+RING_BUFFER_SIZE = 500
+
+# Bearer headers, and token or secret assignments like `refresh_token=...`, `"access_token": "..."` or `Access Token: ...`.
+_SECRETS = (
+    re.compile(r"(Bearer\s+)[A-Za-z0-9._~+/=-]+"),
+    re.compile(r"((?:access|refresh)[ _]token|client[ _]secret)(['\"]?\s*[:=]\s*['\"]?)[^\s'\",}]+", re.IGNORECASE),
+)
+
+def redact(text: str) -> str:
+    """Replaces bearer and refresh tokens, access tokens and client secrets in the text."""
+    text = _SECRETS[0].sub(r"\1[REDACTED]", text)
+    return _SECRETS[1].sub(r"\1\2[REDACTED]", text)
+
+class RingBufferHandler(logging.Handler):
+    def __init__(self, capacity: int = RING_BUFFER_SIZE) -> None:
+        """Keeps the last `capacity` formatted records in memory, shown from the tray."""
+        super().__init__()
+        self.__records: deque[str] = deque(maxlen=capacity)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.__records.append(self.format(record))
+
+    def lines(self) -> list[str]:
+        return list(self.__records)
+
+class _DeferredQueueHandler(QueueHandler):
+    """Hands the record to the listener as is. The message is merged with its' arguments, redacted and
+    formatted on the listener thread, instead of on the thread that logged it."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+class _RedactingQueueListener(QueueListener):
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = redact(record.getMessage())
+        record.args = None
+        return record
+
 handler = colorlog.StreamHandler()
 formatter = colorlog.ColoredFormatter(
     "  %(log_color)s%(levelname)-8s%(reset)s | %(log_color)s%(message)s%(reset)s",
@@ -21,8 +76,33 @@ formatter = colorlog.ColoredFormatter(
 )
 
 handler.setFormatter(formatter)
+
+plain_formatter = logging.Formatter("%(asctime)s %(levelname)-8s %(threadName)s | %(message)s", datefmt="%Y-%m-%d %H:%M:%S")
+
+ring_buffer = RingBufferHandler()
+ring_buffer.setFormatter(plain_formatter)
+
+handlers: list[logging.Handler] = [handler, ring_buffer]
+try:
+    LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
+    file_handler = RotatingFileHandler(LOG_PATH, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUPS, encoding="utf-8", delay=True)
+    file_handler.setFormatter(plain_formatter)
+    handlers.append(file_handler)
+except OSError as e:
+    print(f"logger: Can't write logs to '{LOG_PATH}': {e}", file=sys.stderr)
+
+# The handlers run on a background thread, logging only puts the record in a queue.
+_queue: queue.SimpleQueue = queue.SimpleQueue()
+_listener = _RedactingQueueListener(_queue, *handlers, respect_handler_level=True)
+_listener.start()
+atexit.register(_listener.stop)
  
 # Set up the logger
 logger = colorlog.getLogger(__name__)
-logger.addHandler(handler)
-logger.setLevel(colorlog.INFO)  
\ No newline at end of file
+logger.addHandler(_DeferredQueueHandler(_queue))
+logger.setLevel(colorlog.INFO)
+logger.propagate = False
+
+def recent_logs() -> list[str]:
+    """The last records logged, oldest first."""
+    return ring_buffer.lines()
\ No newline at end of file
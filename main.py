@@ -12,22 +12,74 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import threading
-import requests
 from pathlib import Path
 import sys
 import multiprocessing
-from typing import Union
 import subprocess
 
 from gui import App, EnvInput
 from api import Spotify
+from config import Config, changed_fields, load_config, watch_config
 from logger import logger
+import tracing
+from media import CoverCache, SpriteCache, ThemeIndex
+from startup import Startup, CONFIG, TOKEN, RESOURCES, SNAPSHOT
 from system_tray import SystemTray
-from updater import Updater
+from updater import Updater, current_install, launch
 
 # Author: Sagi Tsafrir
 # Github: https://github.com/sagsag00/SpotifyBar
 VERSION = "0.3"
+# The update check starts this long after the bar is up, so it never competes with the first render.
+UPDATE_CHECK_DELAY_MS = 3000
+
+def preload_resources(config: Config) -> None:
+    """Opens the caches and renders the button icons off the Tk thread, before the window is built."""
+    CoverCache()
+    ThemeIndex()
+    sprite_cache = SpriteCache()
+    sprite_cache.warm(None)
+    if config.buttons_color is not None:
+        sprite_cache.warm(config.buttons_color)
+
+def wait_for_token() -> None:
+    """Waits for the access token, so the steps that need it report a failure rather than waiting forever."""
+    if not Spotify().wait_until_ready():
+        raise TimeoutError("Timed out waiting for the access token")
+
+def start_background_work(app: App, tray: SystemTray, startup: Startup, config: Config,
+                          base_dir: Path, updater_path: Path) -> None:
+    """Schedules what runs once the bar is built: the update check, the background image and the config watcher."""
+    update_manager = Updater(VERSION)
+    
+    def download_and_install() -> None:
+        # The update is downloaded here rather than by the updater, so the bar keeps working meanwhile
+        # and the progress is shown on the tray. The updater only installs it.
+        new_dir = update_manager.download_update(base_dir, base_dir / "cache", tray.set_update_progress)
+        tray.set_update_progress(None)
+        if new_dir is None:
+            logger.error("main_thread: Failed to download the new version.")
+            return
+        
+        logger.info("main_thread: Starting the updater.")
+        subprocess.Popen([updater_path, "--install", str(new_dir)])
+        app.post(tray.exit_app)
+    
+    def check_for_update() -> None:
+        with tracing.span("version check", "update"):
+            new_version = update_manager.check_new_version(base_dir / "cache" / "update_check.json",
+                                                           load_config().update_check_hours * 3600)
+        if new_version:
+            logger.info(f"main_thread: Version {update_manager.latest_version} is available.")
+            tray.offer_update(update_manager.latest_version, download_and_install)
+    
+    app.call_later(UPDATE_CHECK_DELAY_MS, lambda: threading.Thread(target=check_for_update, daemon=True).start())
+    
+    if config.background_mode == "background_only":
+        startup.when_finished(SNAPSHOT, lambda: app.post(app.set_background_as_image))
+    
+    # Edits to 'config.ini' are applied without restarting.
+    watch_config(lambda old, new: app.post(app.apply_config, new, changed_fields(old, new)))
 
 if __name__ == "__main__":
     multiprocessing.freeze_support()
@@ -35,91 +87,80 @@ if __name__ == "__main__":
     from api.refresh import load_credentials
     if getattr(sys, "frozen", False):
         base_dir = Path(sys.executable).resolve().parent
+        app_path = Path(sys.executable).resolve()
         updater_path = base_dir / "Updater.exe"
     else:
         base_dir = Path(__file__).resolve().parent
+        app_path = Path(__file__).resolve()
         updater_path = base_dir / "updater.py"
     
+    # Each update is installed to its' own folder, see `Updater.install`. When launched from another folder
+    # (e.g. a shortcut to the first install, or after a rollback), hand over to the current version.
+    current_dir = current_install(base_dir)
+    if current_dir != base_dir:
+        launch(current_dir / app_path.name, tuple(sys.argv[1:]))
+        sys.exit(0)
+    
+    # `--trace` or `--trace=<path>` records where the time goes, see tracing.py.
+    trace_flag = next((arg for arg in sys.argv[1:] if arg.split("=", 1)[0] == "--trace"), None)
+    if trace_flag is not None:
+        tracing.enable(trace_flag.partition("=")[2] or None)
+    
     logger.info("main_thread: Loading program")
 
     env_file = base_dir / ".env"
     
-    if not env_file.exists():
-        env_file.write_text("CLIENT_ID=\nCLIENT_SECRET=\nREFRESH_TOKEN=")
-        
-    creds = load_credentials(env_file)
-    CLIENT_ID = creds["CLIENT_ID"]
-    CLIENT_SECRET = creds["CLIENT_SECRET"]
+    with tracing.span("credential load", "startup"):
+        if not env_file.exists():
+            env_file.write_text("CLIENT_ID=\nCLIENT_SECRET=\nREFRESH_TOKEN=")
+            
+        creds = load_credentials(env_file)
+        CLIENT_ID = creds["CLIENT_ID"]
+        CLIENT_SECRET = creds["CLIENT_SECRET"]
 
-    while not (cred := load_credentials(env_file))["CLIENT_ID"] or not cred["CLIENT_SECRET"]:
-        window = EnvInput("Input Credentials", None)
-        window.run()
+        while not (cred := load_credentials(env_file))["CLIENT_ID"] or not cred["CLIENT_SECRET"]:
+            window = EnvInput("Input Credentials", None)
+            window.run()
 
     CLIENT_ID = cred["CLIENT_ID"]
     CLIENT_SECRET = cred["CLIENT_SECRET"]
     
-    download_manager = Updater(VERSION)
-    if download_manager.check_new_version():
-        subprocess.Popen([updater_path, VERSION])
-        sys.exit(0)
-    
-    spotify = Spotify()
-    # if not spotify.open_spotify_app():
+    startup = Startup()
+    startup.add(CONFIG, load_config)
+    startup.add(TOKEN, wait_for_token)
+    startup.add(RESOURCES, preload_resources, requires=(CONFIG,))
+    startup.add(SNAPSHOT, lambda _: Spotify().take_snapshot(), requires=(TOKEN,))
+    # if not Spotify().open_spotify_app():
     #     logger.critical("main_thread: Couldn't open the spotify app.")
     
+    config = startup.result(CONFIG)
     try:
-        with open("config.ini", "r") as file:
-            logger.info("main_thread: Reading the contents of 'config.ini'")
-            lines = file.readlines()
-    except FileNotFoundError:
-        logger.warning("main_thread: 'config.ini' file was not found. Creating a new file.")
-        
-        lines = ["program_title=\n",
-                 "opacity=\n",
-                 "background_color=\n",
-                 "buttons_color=\n"
-                 "position=\n",
-                 "padding=\n",
-                 "background_mode=song\n",
-                 "soft_color_mode=\n"
-                 ]
-        
-        with open("config.ini", "x") as file:
-            file.writelines(lines)
-            
-        logger.info("main_thread: 'config.ini' created.")
-        
-    config_values = {}
-    for line in lines:
-        if '=' in line:
-            key, value = line.strip().split('=', 1)
-            config_values[key] = value
-    
-    program_title: str = config_values.get("program_title") or "Spotify Bar"
-    position: str = config_values.get("position") or "top_end"
-    padding: int = int(config_values.get("padding") or 10)
-    opacity: float = float(config_values.get("opacity") or 1)
-    background_color: str = config_values.get("background_color") or "lightgray"
-    buttons_color: Union[str, None] = str(config_values.get("buttons_color")) or None
-    background_mode: str = config_values.get("background_mode") or "default"
-    soft_color_mode: bool = str(config_values.get("soft_color_mode") or "true").lower() in ("1", "true", "yes", "on")
+        startup.result(RESOURCES)
+    except Exception:
+        # Already logged, everything it preloads is loaded on first use anyway.
+        pass
         
-    app = App(program_title,
+    app = App(config.title,
               "icon.ico",
-              position=position,
-              padding=padding,
-              opacity=opacity,
-              background_color=background_color,
-              buttons_color=buttons_color,
-              background_mode=background_mode,
-              soft_color_mode=soft_color_mode
+              position=config.position,
+              padding=config.padding,
+              opacity=config.opacity,
+              background_color=config.background_color,
+              buttons_color=config.buttons_color,
+              background_mode=config.background_mode,
+              soft_color_mode=config.soft_color_mode,
+              frame_rate=config.frame_rate,
+              palette_mode=config.palette_mode,
+              marquee=config.marquee,
+              renderer=config.renderer,
+              startup=startup
               )
     tray = SystemTray()
     
-    if background_mode == "background_only":
-        app.set_background_as_image()
+    start_background_work(app, tray, startup, config, base_dir, updater_path)
     
     tray_process = threading.Thread(target=tray.run) 
 
     tray_process.start()
-    app.run()
\ No newline at end of file
+    app.run()
+    tracing.save()
\ No newline at end of file
@@ -0,0 +1,5 @@
+from media.cover_cache import CoverCache
+from media.cover_variants import CoverImages, select_cover_url, smallest_cover_url
+from media.image_pipeline import ImagePipeline
+from media.sprite_cache import SpriteCache
+from media.theme_index import Theme, ThemeIndex
\ No newline at end of file
@@ -0,0 +1,242 @@
+# Copyright 2026 Sagi Tsafrir
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Union
+
+import requests
+from PIL import Image
+
+from logger import logger
+import tracing
+from media.decode import decode_image
+
+if getattr(sys, "frozen", False):
+    base_dir = Path(sys.executable).resolve().parent
+else:
+    base_dir = Path(__file__).resolve().parent.parent
+
+CACHE_DIR = base_dir / "cache" / "covers"
+MEMORY_BUDGET_BYTES = 32 * 1024 * 1024
+DISK_BUDGET_BYTES = 64 * 1024 * 1024
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """Writes the data to a temporary file next to `path` and renames it over `path`."""
+    fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(data)
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+
+class CoverCache():
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        if not cls._instance:
+            with cls._lock:
+                if not cls._instance:
+                    cls._instance = super(CoverCache, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(self,
+                 cache_dir: Path = CACHE_DIR,
+                 memory_budget: int = MEMORY_BUDGET_BYTES,
+                 disk_budget: int = DISK_BUDGET_BYTES) -> None:
+        """A two tier cache of cover art, keyed by image URL.
+
+            Decoded images are kept in an in-memory LRU bounded by `memory_budget` bytes.
+            The downloaded files are stored on disk by their content hash, bounded by `disk_budget` bytes,
+            with an index mapping each URL to its file.
+        """
+        if hasattr(self, "initialized"):
+            return
+        self.initialized = True
+
+        self.cache_dir = Path(cache_dir)
+        self.memory_budget = memory_budget
+        self.disk_budget = disk_budget
+
+        self.__memory: OrderedDict[tuple, Image.Image] = OrderedDict()
+        self.__memory_bytes = 0
+        self.__memory_lock = threading.Lock()
+        self.__disk_lock = threading.Lock()
+        # The lock of each URL being fetched and the number of threads using it, removed once none are.
+        self.__url_locks: dict[str, tuple[threading.Lock, int]] = {}
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.__index_path = self.cache_dir / "index.json"
+        self.__index: dict[str, str] = self.__load_index()
+
+    def get_image(self, url: str, size: Union[tuple[int, int], None] = None) -> Union[Image.Image, None]:
+        """Returns the decoded RGB image of the URL. The returned image is shared, do not modify it in place.
+
+        Args:
+            url (str): The image URL.
+            size (tuple[int, int], optional): Decode straight to this size. Defaults to the full size.
+        """
+        if not url:
+            return None
+
+        key = (url, size)
+        with self.__memory_lock:
+            image = self.__memory.get(key)
+            if image is not None:
+                self.__memory.move_to_end(key)
+                self.hits += 1
+                return image
+
+        with self.__locked_url(url):
+            # Another thread may have decoded it while we waited.
+            with self.__memory_lock:
+                image = self.__memory.get(key)
+                if image is not None:
+                    self.__memory.move_to_end(key)
+                    self.hits += 1
+                    return image
+
+            data = self.__get_bytes(url)
+            if data is None:
+                return None
+            image = decode_image(data, size)
+            self.__remember(key, image)
+            return image
+
+    def get_bytes(self, url: str) -> Union[bytes, None]:
+        """Returns the raw bytes of the URL, from disk if available."""
+        if not url:
+            return None
+        with self.__locked_url(url):
+            return self.__get_bytes(url)
+
+    def __get_bytes(self, url: str) -> Union[bytes, None]:
+        data = self.__read_disk(url)
+        if data is not None:
+            with self.__memory_lock:
+                self.disk_hits += 1
+            return data
+
+        with self.__memory_lock:
+            self.misses += 1
+        try:
+            with tracing.span("cover download", "image"):
+                response = requests.get(url, timeout=10)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            logger.error(f"CoverCache.get_bytes: Failed to download '{url}': {e}")
+            return None
+
+        self.__write_disk(url, response.content)
+        logger.debug(f"CoverCache.get_bytes: Downloaded {len(response.content)} bytes from '{url}'.")
+        return response.content
+
+    @contextmanager
+    def __locked_url(self, url: str) -> Iterator[None]:
+        """Holds a lock per URL, so the same cover is never downloaded by two threads at once."""
+        with self.__memory_lock:
+            lock, users = self.__url_locks.get(url, (None, 0))
+            lock = lock or threading.Lock()
+            self.__url_locks[url] = (lock, users + 1)
+        try:
+            with lock:
+                yield
+        finally:
+            with self.__memory_lock:
+                lock, users = self.__url_locks[url]
+                if users == 1:
+                    del self.__url_locks[url]
+                else:
+                    self.__url_locks[url] = (lock, users - 1)
+
+    def __remember(self, key: tuple, image: Image.Image) -> None:
+        size = image.width * image.height * len(image.getbands())
+        with self.__memory_lock:
+            if key in self.__memory:
+                return
+            self.__memory[key] = image
+            self.__memory_bytes += size
+            while self.__memory_bytes > self.memory_budget and len(self.__memory) > 1:
+                _, evicted = self.__memory.popitem(last=False)
+                self.__memory_bytes -= evicted.width * evicted.height * len(evicted.getbands())
+
+    def __load_index(self) -> dict[str, str]:
+        try:
+            return json.loads(self.__index_path.read_text())
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def __read_disk(self, url: str) -> Union[bytes, None]:
+        with self.__disk_lock:
+            digest = self.__index.get(url)
+            if digest is None:
+                return None
+            path = self.cache_dir / digest
+            try:
+                data = path.read_bytes()
+            except FileNotFoundError:
+                del self.__index[url]
+                return None
+            # The modification time doubles as the last access time for the eviction.
+            os.utime(path)
+            return data
+
+    def __write_disk(self, url: str, data: bytes) -> None:
+        digest = hashlib.sha256(data).hexdigest()
+        path = self.cache_dir / digest
+        with self.__disk_lock:
+            try:
+                if not path.exists():
+                    _atomic_write(path, data)
+                self.__index[url] = digest
+                self.__evict_disk()
+                _atomic_write(self.__index_path, json.dumps(self.__index).encode("utf-8"))
+            except OSError as e:
+                logger.error(f"CoverCache.__write_disk: Failed to write the cover to disk: {e}")
+
+    def __evict_disk(self) -> None:
+        """Removes the least recently used files until the disk cache fits its' budget."""
+        files = [path for path in self.cache_dir.iterdir() if path.is_file() and path != self.__index_path
+                 and not path.name.startswith(".tmp-")]
+        total = sum(path.stat().st_size for path in files)
+        if total <= self.disk_budget:
+            return
+
+        removed = set()
+        for path in sorted(files, key=lambda path: path.stat().st_mtime):
+            if total <= self.disk_budget:
+                break
+            total -= path.stat().st_size
+            path.unlink(missing_ok=True)
+            removed.add(path.name)
+
+        self.__index = {url: digest for url, digest in self.__index.items() if digest not in removed}
+        logger.debug(f"CoverCache.__evict_disk: Evicted {len(removed)} covers from disk.")
@@ -0,0 +1,55 @@
+# Copyright 2026 Sagi Tsafrir
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Any, Union
+
+# Spotify album images come in a few sizes (usually 640, 300 and 64 pixels), largest first.
+CoverImages = list[dict[str, Any]]
+
+def _sized(images: CoverImages) -> CoverImages:
+    """Returns the images with a known size, smallest first."""
+    sized = [image for image in images if image.get("width") and image.get("height") and image.get("url")]
+    return sorted(sized, key=lambda image: min(image["width"], image["height"]))
+
+def select_cover_url(images: Union[CoverImages, None], target_size: int) -> Union[str, None]:
+    """Selects the smallest cover variant that is at least `target_size` pixels on its' shorter side.
+
+    Args:
+        images (list[dict]): The `images` list of a Spotify album.
+        target_size (int): The size in pixels the consumer is going to display or analyze the image at.
+
+    Returns:
+        str | None: The URL of the chosen variant, the largest one if none is big enough, or None if there are no images.
+    """
+    if not images:
+        return None
+
+    sized = _sized(images)
+    if not sized:
+        return images[0].get("url")
+
+    for image in sized:
+        if min(image["width"], image["height"]) >= target_size:
+            return image["url"]
+    return sized[-1]["url"]
+
+def smallest_cover_url(images: Union[CoverImages, None]) -> Union[str, None]:
+    """Returns the URL of the smallest cover variant, used to show something as soon as possible."""
+    if not images:
+        return None
+
+    sized = _sized(images)
+    if not sized:
+        return images[-1].get("url")
+    return sized[0]["url"]
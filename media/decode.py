@@ -0,0 +1,58 @@
+# Copyright 2026 Sagi Tsafrir
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from io import BytesIO
+from typing import Union
+
+from PIL import Image
+
+def decode_image(data: bytes, size: Union[tuple[int, int], None] = None) -> Image.Image:
+    """Decodes the image, doing as little work as possible for the requested size.
+
+        JPEGs are decoded directly at a reduced scale using the decoders' draft mode, other formats are
+        shrunk with `reduce()` before the final resize.
+
+    Args:
+        data (bytes): The encoded image.
+        size (tuple[int, int], optional): The size the image is needed at. Defaults to the full size.
+
+    Returns:
+        Image: The decoded RGB image, exactly `size` if given.
+    """
+    image = Image.open(BytesIO(data))
+    if size is None:
+        image.load()
+        return image.convert("RGB")
+
+    width, height = size
+    if image.format == "JPEG":
+        image.draft("RGB", (width, height))
+
+    factor = min(image.width // width, image.height // height)
+    if factor >= 2:
+        image = image.reduce(factor)
+
+    image = image.convert("RGB")
+    if image.size != (width, height):
+        image = image.resize((width, height), Image.Resampling.LANCZOS)
+    return image
+
+def fit_size(image_size: tuple[int, int], max_width: int, max_height: int) -> tuple[int, int]:
+    """Returns the largest size that fits inside the box while maintaining the aspect ratio."""
+    img_width, img_height = image_size
+    aspect_ratio = img_width / img_height
+    if img_width / max_width > img_height / max_height:
+        return max_width, max(int(max_width / aspect_ratio), 1)
+    return max(int(max_height * aspect_ratio), 1), max_height
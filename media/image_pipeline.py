@@ -0,0 +1,164 @@
+# Copyright 2026 Sagi Tsafrir
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import itertools
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from typing import Any, Callable
+
+from PIL import Image, ImageFilter, ImageTk
+
+from logger import logger
+import tracing
+from media.cover_cache import CoverCache
+from media.decode import decode_image, fit_size
+from views.frame_scheduler import FrameScheduler
+
+# Blurring is done at 1/BLUR_DOWNSCALE of the final size, then scaled back up.
+BLUR_DOWNSCALE = 4
+
+class ImagePipeline():
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        if not cls._instance:
+            with cls._lock:
+                if not cls._instance:
+                    cls._instance = super(ImagePipeline, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(self, max_workers: int = 2) -> None:
+        """Fetches, decodes, resizes and blurs images on worker threads.
+            Only the `ImageTk.PhotoImage` construction and the callback run on the Tk thread.
+        """
+        if hasattr(self, "initialized"):
+            return
+        self.initialized = True
+
+        self.__executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="image_pipeline")
+        self.__generations = itertools.count()
+        self.__applied: dict[str, int] = {}
+
+    def run(self, key: str, scheduler: FrameScheduler, task: Callable[[], Any], on_done: Callable[[Any], None]) -> None:
+        """Runs `task` on a worker and hands its' result to `on_done` on the Tk thread.
+
+        Args:
+            key (str): The consumer of the result. Only the most recent request of each consumer is delivered,
+                an older request that finishes later is dropped.
+            scheduler (FrameScheduler): The frame scheduler of the window the result is used in.
+            task (Callable): The work to do off the Tk thread.
+            on_done (Callable): Called on the Tk thread with the result.
+        """
+        generation = next(self.__generations)
+
+        def work() -> None:
+            start = time.perf_counter()
+            try:
+                result = task()
+            except Exception as e:
+                logger.error(f"ImagePipeline.run: Task for {key} failed: {e}")
+                return
+            timings = {"task": time.perf_counter() - start}
+            scheduler.post(self.__deliver, key, generation, result, on_done, timings)
+
+        self.__executor.submit(work)
+
+    def load_photo(self,
+                   key: str,
+                   scheduler: FrameScheduler,
+                   image_url: str,
+                   size: tuple[int, int],
+                   on_done: Callable[[ImageTk.PhotoImage], None],
+                   blur_radius: int = 0,
+                   keep_aspect_ratio: bool = False) -> None:
+        """Loads the image at the URL as a `PhotoImage` of the given size.
+
+        Args:
+            key (str): The consumer of the image. Only the most recent request of each consumer is shown,
+                an older request that finishes later is dropped.
+            scheduler (FrameScheduler): The frame scheduler of the window the image is shown in.
+            image_url (str): The image URL.
+            size (tuple[int, int]): The target size.
+            on_done (Callable): Called on the Tk thread with the `PhotoImage`.
+            blur_radius (int, optional): Gaussian blur radius at the target size. Defaults to no blur.
+            keep_aspect_ratio (bool, optional): Fit the image inside `size` instead of stretching it.
+        """
+        generation = next(self.__generations)
+
+        def work() -> None:
+            with tracing.span("load photo", "image", key=key):
+                load()
+
+        def load() -> None:
+            timings: dict[str, float] = {}
+            try:
+                start = time.perf_counter()
+                data = CoverCache().get_bytes(image_url)
+                timings["fetch"] = time.perf_counter() - start
+                if data is None:
+                    return
+
+                start = time.perf_counter()
+                target = size
+                if keep_aspect_ratio:
+                    with Image.open(BytesIO(data)) as probe:
+                        target = fit_size(probe.size, *size)
+                decode_size = target
+                if blur_radius:
+                    decode_size = (max(target[0] // BLUR_DOWNSCALE, 1), max(target[1] // BLUR_DOWNSCALE, 1))
+                image = decode_image(data, decode_size)
+                timings["decode"] = time.perf_counter() - start
+
+                if blur_radius:
+                    start = time.perf_counter()
+                    image = image.filter(ImageFilter.GaussianBlur(radius=blur_radius / BLUR_DOWNSCALE))
+                    timings["blur"] = time.perf_counter() - start
+
+                    start = time.perf_counter()
+                    image = image.resize(target, Image.Resampling.BILINEAR)
+                    timings["upscale"] = time.perf_counter() - start
+            except Exception as e:
+                logger.error(f"ImagePipeline.load_photo: Failed to load '{image_url}' for {key}: {e}")
+                return
+
+            scheduler.post(self.__deliver, key, generation, image, on_done, timings, True)
+
+        self.__executor.submit(work)
+
+    def show(self, key: str, image: Image.Image, on_done: Callable[[ImageTk.PhotoImage], None]) -> None:
+        """Shows an image that is already decoded, right away. Must be called on the Tk thread.
+            Every older request of the same consumer that is still in flight is dropped.
+        """
+        self.__deliver(key, next(self.__generations), image, on_done, {}, True)
+
+    def __deliver(self, key: str, generation: int, result: Any, on_done: Callable[[Any], None],
+                  timings: dict[str, float], as_photo: bool = False) -> None:
+        if generation < self.__applied.get(key, -1):
+            logger.debug(f"ImagePipeline: Dropped a stale result for {key}.")
+            return
+        self.__applied[key] = generation
+
+        if as_photo:
+            start = time.perf_counter()
+            with tracing.span("photo", "render", key=key):
+                result = ImageTk.PhotoImage(result)
+            timings["photo"] = time.perf_counter() - start
+        on_done(result)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("ImagePipeline: %s %s", key, ", ".join(f"{stage} {seconds * 1000:.1f}ms" for stage, seconds in timings.items()))
@@ -0,0 +1,133 @@
+# Copyright 2026 Sagi Tsafrir
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import colorsys
+from typing import TYPE_CHECKING, NamedTuple
+
+from PIL import Image
+
+# numpy is imported on first use, the palette is only needed once the first cover arrives.
+if TYPE_CHECKING:
+    import numpy as np
+
+HISTOGRAM = "histogram"
+KMEANS = "kmeans"
+PALETTE_MODES = (HISTOGRAM, KMEANS)
+
+SAMPLE_SIZE = 150
+TOP_BUCKETS = 5
+
+class Palette(NamedTuple):
+    primary: str
+    secondary: str
+    accent: str
+
+def soften_color(rgb: tuple[int, int, int]) -> tuple[int, int, int]:
+    """Caps the saturation and brightness of the color so it's easier on the eyes as a background."""
+    r, g, b = (x / 255 for x in rgb)
+    h, s, v = colorsys.rgb_to_hsv(r, g, b)
+    s = min(s, 0.95)
+    v = min(v, 0.87)
+    r, g, b = colorsys.hsv_to_rgb(h, s, v)
+    return tuple([int(r*255), int(g*255), int(b*255)])
+
+def _to_hex(rgb: tuple[int, int, int], soft: bool) -> str:
+    return "#%02x%02x%02x" % (soften_color(rgb) if soft else tuple(rgb))
+
+def _brightness(rgb: tuple[int, int, int]) -> float:
+    r, g, b = rgb
+    return 0.299*r + 0.586*g + 0.114*b
+
+def _pixels(image: Image.Image) -> "np.ndarray":
+    """Returns the RGB pixels of the image as an (n, 3) uint8 array, sampled at most at SAMPLE_SIZE."""
+    import numpy as np
+
+    image = image.convert("RGB")
+    if image.width > SAMPLE_SIZE or image.height > SAMPLE_SIZE:
+        image = image.resize((SAMPLE_SIZE, SAMPLE_SIZE))
+    return np.asarray(image, dtype=np.uint8).reshape(-1, 3)
+
+def _choose_primary(colors: list[tuple[int, int, int]], counts: list[int]) -> int:
+    """Picks the dominant color out of the candidates (most common first), skipping very dark colors
+    unless they are much more common than the alternative. Returns the index of the chosen candidate."""
+    chosen, chosen_count = None, 0
+    for index in reversed(range(len(colors))):
+        if _brightness(colors[index]) < 40 and counts[index] < chosen_count * 2.5:
+            continue
+        chosen, chosen_count = index, counts[index]
+    return 0 if chosen is None else chosen
+
+def _palette_from_candidates(colors: list[tuple[int, int, int]], counts: list[int], soft: bool) -> Palette:
+    primary = _choose_primary(colors, counts)
+    rest = [index for index in range(len(colors)) if index != primary] or [primary]
+    secondary = rest[0]
+
+    def vividness(index: int) -> float:
+        _, s, v = colorsys.rgb_to_hsv(*(x / 255 for x in colors[index]))
+        return s * v
+
+    accent = max(rest, key=vividness)
+    return Palette(_to_hex(colors[primary], soft), _to_hex(colors[secondary], soft), _to_hex(colors[accent], soft))
+
+def histogram_palette(image: Image.Image, soft: bool = True) -> Palette:
+    """Builds the palette from a 4 bit per channel color histogram of the image.
+
+        The primary color is the same as the one picked by the original per pixel implementation,
+        including its' tie breaking by first appearance.
+    """
+    import numpy as np
+
+    pixels = _pixels(image)
+    packed = (pixels[:, 0].astype(np.uint16) >> 4 << 8) | (pixels[:, 1] >> 4 << 4) | (pixels[:, 2] >> 4)
+    counts = np.bincount(packed, minlength=4096)
+
+    # Every bucket tied with the last of the top buckets is a candidate, ties go to the first pixel seen.
+    threshold = np.sort(counts)[-TOP_BUCKETS]
+    candidates = np.flatnonzero((counts >= threshold) & (counts > 0))
+    first_seen = [int(np.argmax(packed == bucket)) for bucket in candidates]
+    ranked = sorted(zip(candidates, first_seen), key=lambda item: (-counts[item[0]], item[1]))[:TOP_BUCKETS]
+
+    buckets = [int(bucket) for bucket, _ in ranked]
+    colors = [((b >> 8) * 16 + 8, ((b >> 4) & 0xF) * 16 + 8, (b & 0xF) * 16 + 8) for b in buckets]
+    return _palette_from_candidates(colors, [int(counts[b]) for b in buckets], soft)
+
+def kmeans_palette(image: Image.Image, soft: bool = True, clusters: int = TOP_BUCKETS) -> Palette:
+    """Builds the palette from k-means clusters of the images' pixels. Slower than the histogram, but
+    picks colors that are actually in the image rather than bucket centers."""
+    import numpy as np
+    from sklearn.cluster import KMeans
+
+    pixels = _pixels(image).astype(np.float32)
+    clusters = min(clusters, len(np.unique(pixels, axis=0)))
+    model = KMeans(n_clusters=clusters, n_init=1, random_state=0).fit(pixels)
+
+    counts = np.bincount(model.labels_, minlength=clusters)
+    order = np.argsort(-counts, kind="stable")
+    colors = [tuple(int(round(c)) for c in model.cluster_centers_[index]) for index in order]
+    return _palette_from_candidates(colors, [int(counts[index]) for index in order], soft)
+
+def extract_palette(image: Image.Image, mode: str = HISTOGRAM, soft: bool = True) -> Palette:
+    """Extracts the primary, secondary and accent colors of the image.
+
+    Args:
+        image (Image): The image, usually a cover.
+        mode (str, optional): `histogram` or `kmeans`. Defaults to `histogram`.
+        soft (bool, optional): Whether to soften the colors. Defaults to True.
+
+    Returns:
+        Palette: The colors as hex strings.
+    """
+    if mode == KMEANS:
+        return kmeans_palette(image, soft)
+    return histogram_palette(image, soft)
@@ -0,0 +1,35 @@
+# Copyright 2026 Sagi Tsafrir
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from PIL import Image, ImageOps
+
+def _channel_lut(dim: int, color: int) -> list[int]:
+    """The value of one channel for every gray level, blending from `dim` (black) to `color` (white)."""
+    return [int(dim * (1 - t) + color * t) for t in (g / 255 for g in range(256))]
+
+def recolor_image(image: Image.Image, color: tuple[int, int, int], dim: tuple[int, int, int]) -> Image.Image:
+    """Recolors an icon: dark pixels become `dim`, light pixels become `color`, alpha is kept.
+
+    Args:
+        image (Image): The RGBA icon.
+        color (tuple[int, int, int]): The color of the lightest pixels.
+        dim (tuple[int, int, int]): The color of the darkest pixels.
+
+    Returns:
+        Image: The recolored RGBA icon.
+    """
+    gray = ImageOps.grayscale(image)
+    bands = [gray.point(_channel_lut(d, c)) for d, c in zip(dim, color)]
+    return Image.merge("RGBA", (*bands, image.getchannel("A")))
@@ -0,0 +1,153 @@
+# Copyright 2026 Sagi Tsafrir
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import sys
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Union
+
+from PIL import Image, ImageColor, ImageTk
+
+from logger import logger
+import tracing
+from media.recolor import recolor_image
+
+if getattr(sys, "frozen", False):
+    base_dir = Path(sys.executable).resolve().parent
+else:
+    base_dir = Path(__file__).resolve().parent.parent
+
+BUTTONS_DIR = base_dir / "resources" / "buttons"
+ICON_SIZE = (15, 15)
+MAX_THEMES = 32
+
+class SpriteCache():
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        if not cls._instance:
+            with cls._lock:
+                if not cls._instance:
+                    cls._instance = super(SpriteCache, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(self, buttons_dir: Path = BUTTONS_DIR) -> None:
+        """Ready to use button icons, keyed by (icon, theme color, size).
+
+            The source icons are read from disk once. Recolored icons are kept as PIL images, which can be
+            prepared on any thread, and as `PhotoImage`s, which are created on the Tk thread on first use.
+            The icons of the last `MAX_THEMES` theme colors are kept.
+        """
+        if hasattr(self, "initialized"):
+            return
+        self.initialized = True
+
+        self.buttons_dir = Path(buttons_dir)
+        self.theme_color: Union[str, None] = None
+        self.__icons: Union[list[str], None] = None
+
+        self.__sources: dict[str, Image.Image] = {}
+        self.__images: OrderedDict[Union[str, None], dict[tuple[str, tuple[int, int]], Image.Image]] = OrderedDict()
+        self.__photos: OrderedDict[Union[str, None], dict[tuple[str, tuple[int, int]], ImageTk.PhotoImage]] = OrderedDict()
+        self.__lock = threading.Lock()
+
+    @property
+    def icons(self) -> list[str]:
+        """The names of every available icon."""
+        if self.__icons is None:
+            self.__icons = sorted(path.stem for path in self.buttons_dir.glob("*.png"))
+        return self.__icons
+
+    def set_theme(self, color: Union[str, None]) -> None:
+        """Sets the theme color used when no color is passed. None means the original icons."""
+        self.theme_color = color
+
+    def render(self, icon: str, color: Union[str, None], size: tuple[int, int] = ICON_SIZE) -> Image.Image:
+        """Returns the icon recolored for the theme color and thumbnailed to the size. Safe on any thread."""
+        key = (icon, size)
+        with self.__lock:
+            images = self.__touch(self.__images, color)
+            image = images.get(key)
+        if image is not None:
+            return image
+
+        image = self.__source(icon)
+        if color is not None:
+            rgb = ImageColor.getrgb(color)[:3]
+            image = recolor_image(image, rgb, tuple(int(c * 0.8) for c in rgb))
+        else:
+            image = image.copy()
+        image.thumbnail(size)
+
+        with self.__lock:
+            self.__touch(self.__images, color)[key] = image
+        return image
+
+    def photo(self, icon: str, color: Union[str, None] = "theme", size: tuple[int, int] = ICON_SIZE) -> ImageTk.PhotoImage:
+        """Returns the icon as a `PhotoImage`. Must be called on the Tk thread.
+
+        Args:
+            icon (str): The icon name, the file name in the buttons folder without its' extension.
+            color (str | None, optional): The theme color. Defaults to the current theme color.
+            size (tuple[int, int], optional): The box the icon is fitted into.
+        """
+        if color == "theme":
+            color = self.theme_color
+        key = (icon, size)
+        photos = self.__touch(self.__photos, color)
+        photo = photos.get(key)
+        if photo is None:
+            photo = photos[key] = ImageTk.PhotoImage(self.render(icon, color, size))
+        return photo
+
+    @tracing.traced("sprite warm", "image")
+    def warm(self, color: Union[str, None], size: tuple[int, int] = ICON_SIZE, photos: bool = False) -> None:
+        """Renders every icon, every button state included, for the theme color ahead of time.
+
+        Args:
+            color (str | None): The theme color.
+            size (tuple[int, int], optional): The box the icons are fitted into.
+            photos (bool, optional): Create the `PhotoImage`s too. Only on the Tk thread. Defaults to False.
+        """
+        for icon in self.icons:
+            if photos:
+                self.photo(icon, color, size)
+            else:
+                self.render(icon, color, size)
+
+    def __source(self, icon: str) -> Image.Image:
+        with self.__lock:
+            image = self.__sources.get(icon)
+        if image is None:
+            with Image.open(self.buttons_dir / f"{icon}.png") as file:
+                image = file.convert("RGBA")
+            with self.__lock:
+                self.__sources[icon] = image
+            logger.debug(f"SpriteCache.__source: Loaded the '{icon}' icon.")
+        return image
+
+    @staticmethod
+    def __touch(themes: OrderedDict, color: Union[str, None]) -> dict:
+        """Returns the icons of the theme color, marking it as recently used and evicting old themes."""
+        icons = themes.get(color)
+        if icons is None:
+            icons = themes[color] = {}
+            while len(themes) > MAX_THEMES:
+                themes.popitem(last=False)
+        else:
+            themes.move_to_end(color)
+        return icons
@@ -0,0 +1,149 @@
+# Copyright 2026 Sagi Tsafrir
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import json
+import sqlite3
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import NamedTuple, Union
+
+from logger import logger
+from media.palette import Palette
+
+if getattr(sys, "frozen", False):
+    base_dir = Path(sys.executable).resolve().parent
+else:
+    base_dir = Path(__file__).resolve().parent.parent
+
+DATABASE_PATH = base_dir / "cache" / "themes.sqlite3"
+
+class Theme(NamedTuple):
+    background: str
+    text: str
+    palette: Palette
+
+class ThemeIndex():
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        if not cls._instance:
+            with cls._lock:
+                if not cls._instance:
+                    cls._instance = super(ThemeIndex, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(self, path: Path = DATABASE_PATH) -> None:
+        """A persistent index of the theme computed for each album, stored in a small sqlite database.
+
+            Themes are keyed by album id and by the palette settings they were computed with,
+            so changing the palette mode does not show stale colors.
+        """
+        if hasattr(self, "initialized"):
+            return
+        self.initialized = True
+
+        self.path = Path(path)
+        self.hits = 0
+        self.misses = 0
+
+        self.__lock = threading.Lock()
+        self.__memory: dict[tuple[str, str], Theme] = {}
+        self.__connection: Union[sqlite3.Connection, None] = None
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.__connection = sqlite3.connect(self.path, check_same_thread=False)
+            self.__connection.execute(
+                "CREATE TABLE IF NOT EXISTS themes ("
+                "album_id TEXT NOT NULL, settings TEXT NOT NULL, background TEXT NOT NULL, text TEXT NOT NULL, "
+                "palette TEXT NOT NULL, updated REAL NOT NULL, PRIMARY KEY (album_id, settings))"
+            )
+            self.__connection.commit()
+        except sqlite3.Error as e:
+            logger.error(f"ThemeIndex.__init__: Failed to open '{self.path}', themes are kept in memory only: {e}")
+            self.__connection = None
+
+    @property
+    def hit_rate(self) -> float:
+        """The share of lookups that were answered by the index, between 0 and 1."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def get(self, album_id: Union[str, None], settings: str, count: bool = True) -> Union[Theme, None]:
+        """Returns the theme of the album, or None if it was never computed with these settings.
+
+        Args:
+            album_id (str): The Spotify album id.
+            settings (str): The palette settings the theme depends on.
+            count (bool, optional): Whether the lookup counts towards the hit rate. Prefetches don't,
+                                    so every track is counted once, when it's shown.
+        """
+        if not album_id:
+            return None
+
+        key = (album_id, settings)
+        with self.__lock:
+            theme = self.__memory.get(key)
+            if theme is None and self.__connection is not None:
+                theme = self.__read(key)
+                if theme is not None:
+                    self.__memory[key] = theme
+
+            if not count:
+                return theme
+            if theme is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        logger.debug(f"ThemeIndex.get: {'Hit' if theme else 'Miss'} for album {album_id}, hit rate {self.hit_rate:.0%}.")
+        return theme
+
+    def put(self, album_id: Union[str, None], settings: str, theme: Theme) -> None:
+        """Stores the theme of the album."""
+        if not album_id:
+            return
+
+        key = (album_id, settings)
+        with self.__lock:
+            self.__memory[key] = theme
+            if self.__connection is None:
+                return
+            try:
+                self.__connection.execute(
+                    "INSERT OR REPLACE INTO themes VALUES (?, ?, ?, ?, ?, ?)",
+                    (album_id, settings, theme.background, theme.text, json.dumps(list(theme.palette)), time.time())
+                )
+                self.__connection.commit()
+            except sqlite3.Error as e:
+                logger.error(f"ThemeIndex.put: Failed to store the theme of album {album_id}: {e}")
+
+    def __read(self, key: tuple[str, str]) -> Union[Theme, None]:
+        try:
+            row = self.__connection.execute(
+                "SELECT background, text, palette FROM themes WHERE album_id = ? AND settings = ?", key
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.error(f"ThemeIndex.__read: Failed to read the theme of album {key[0]}: {e}")
+            return None
+        if row is None:
+            return None
+
+        background, text, palette = row
+        try:
+            return Theme(background, text, Palette(*json.loads(palette)))
+        except (TypeError, ValueError):
+            return None
@@ -0,0 +1,120 @@
+# Copyright 2026 Sagi Tsafrir
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import threading
+import time
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from typing import Any, Callable, Iterable, Union
+
+from logger import logger
+import tracing
+
+# The steps of the app startup, see main.py.
+CONFIG = "config"
+TOKEN = "token"
+RESOURCES = "resources"
+SNAPSHOT = "snapshot"
+
+class Startup():
+    def __init__(self, max_workers: int = 4) -> None:
+        """Runs the startup steps concurrently, each as soon as the steps it requires are done.
+
+            A step is a function that gets the results of the steps it requires, in order.
+            A step whose requirement failed is failed too, without running.
+        """
+        self.__executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="startup")
+        self.__futures: dict[str, Future] = {}
+        self.__start = time.perf_counter()
+        self.timings: dict[str, float] = {}
+
+    @property
+    def elapsed_ms(self) -> float:
+        """The time since the startup began, in milliseconds."""
+        return (time.perf_counter() - self.__start) * 1000
+
+    def add(self, name: str, step: Callable[..., Any], requires: Iterable[str] = ()) -> None:
+        """Adds a step, it starts as soon as every step in `requires` is done.
+
+        Args:
+            name (str): The name of the step, used by `result`, `when_done` and the `requires` of other steps.
+            step (Callable): The function to run on a worker thread, called with the results of `requires`.
+            requires (Iterable[str], optional): The names of the steps that must be done first. They must be added already.
+        """
+        future = Future()
+        self.__futures[name] = future
+        requirements = [self.__futures[requirement] for requirement in requires]
+
+        if not requirements:
+            self.__executor.submit(self.__run, name, step, requirements, future)
+            return
+
+        remaining = [len(requirements)]
+        lock = threading.Lock()
+
+        def on_requirement_done(_: Future) -> None:
+            with lock:
+                remaining[0] -= 1
+                if remaining[0]:
+                    return
+            self.__executor.submit(self.__run, name, step, requirements, future)
+
+        for requirement in requirements:
+            requirement.add_done_callback(on_requirement_done)
+
+    def result(self, name: str, timeout: Union[float, None] = None) -> Any:
+        """Waits for the step and returns its' result. Raises the exception of the step if it failed."""
+        return self.__futures[name].result(timeout)
+
+    def when_done(self, name: str, callback: Callable[[Any], None]) -> None:
+        """Calls `callback` with the result of the step once it succeeds, right away if it already did.
+            The callback runs on the thread that finished the step, post to the Tk thread from it if needed.
+        """
+        def on_done(future: Future) -> None:
+            try:
+                result = future.result()
+            except (Exception, CancelledError):
+                return
+            callback(result)
+
+        self.__futures[name].add_done_callback(on_done)
+
+    def when_finished(self, name: str, callback: Callable[[], None]) -> None:
+        """Calls `callback` once the step is over, whether it succeeded, failed or was cancelled.
+            The callback runs on the thread that finished the step, post to the Tk thread from it if needed.
+        """
+        self.__futures[name].add_done_callback(lambda _: callback())
+
+    def __run(self, name: str, step: Callable[..., Any], requirements: list[Future], future: Future) -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+
+        for requirement in requirements:
+            if requirement.cancelled() or requirement.exception() is not None:
+                logger.error(f"Startup.__run: Skipped {name}, a step it requires failed.")
+                future.set_exception(RuntimeError(f"A step {name} requires failed."))
+                return
+
+        start = time.perf_counter()
+        try:
+            with tracing.span(name, "startup"):
+                result = step(*(requirement.result() for requirement in requirements))
+        except Exception as e:
+            logger.error(f"Startup.__run: {name} failed: {e}")
+            future.set_exception(e)
+            return
+
+        self.timings[name] = (time.perf_counter() - start) * 1000
+        logger.debug(f"Startup.__run: {name} took {self.timings[name]:.1f}ms, done {self.elapsed_ms:.1f}ms after startup began.")
+        future.set_result(result)
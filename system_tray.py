@@ -14,12 +14,18 @@
 
 import os
 import signal
-from pystray import Icon, Menu, MenuItem
-from PIL import Image, ImageDraw
+from typing import TYPE_CHECKING, Callable, Union
+from PIL import Image
 from logger import logger
+import tracing
 import threading
 
-from gui import GuiManager
+from media import CoverCache
+
+if TYPE_CHECKING:
+    from gui import GuiManager
+
+TITLE = "Spotify Bar"
 
 class SystemTray:
     _instance = None
@@ -38,21 +44,17 @@ class SystemTray:
         if hasattr(self, "initialized"):
             return
         
-        # Initializing the system tray menu.
         self.initialized = True
-        self.tray = Icon("media_controls")
-        self.tray.icon = self.create_image()
-        self.tray.menu = Menu(
-            MenuItem("Play/Pause", self.play_pause),
-            MenuItem("Next", self.next_track),
-            MenuItem("Previous", self.previous_track),
-            MenuItem("Exit", self.exit_app)
-        )
-        self.tray.title = "Spotify Bar"
+        # The tray icon is only created when the tray starts, see `run`. Until then the cover is kept here.
+        self.tray = None
+        self.__icon_image: Union[Image.Image, None] = None
+        self.__title = TITLE
+        # The version offered by `offer_update` and the function that installs it.
+        self.__update: Union[tuple[str, Callable[[], None]], None] = None
         
         # Initializing the gui manager as a class member, when created in the `gui.py` code, it will be initialized here.
         # See gui.py: App._create_buttons method for more info.
-        self.gui_manager: GuiManager = None
+        self.gui_manager: "GuiManager" = None
 
     def play_pause(self) -> None:
         """Play/Pause system tray tab."""
@@ -88,22 +90,94 @@ class SystemTray:
         
         threading.Thread(target=self.gui_manager.on_previous_button_click).start()
 
+    def show_log(self) -> None:
+        """Show log system tray tab. Opens a window with the recent log records."""
+        if self.gui_manager is None:
+            logger.warning("SystemTray.show_log: GUI is not set yet. Please wait a few moments until the GUI is up.")
+            return
+        
+        from gui.log_window import LogWindow
+        self.gui_manager.scheduler.post(LogWindow.show, self.gui_manager.master)
+
+    def install_update(self) -> None:
+        """Install update system tray tab. Only shown once an update is offered, see `offer_update`."""
+        if self.__update is None:
+            return
+        version, install = self.__update
+        logger.info(f"SystemTray.install_update: Installing version {version}")
+        
+        self.__update = None
+        if self.tray is not None:
+            self.tray.update_menu()
+        threading.Thread(target=install, daemon=True).start()
+
+    def offer_update(self, version: str, install: Callable[[], None]) -> None:
+        """Adds an "Install update" tab to the menu, that runs `install` on a new thread, and notifies about it."""
+        self.__update = (version, install)
+        if self.tray is None:
+            return
+        self.tray.update_menu()
+        if self.tray.HAS_NOTIFICATION:
+            self.tray.notify(f"Version {version} is available, install it from the tray menu.", TITLE)
+
     def exit_app(self) -> None:
         """Exit the app system tray tab."""
         logger.info("SystemTray.exit_app: Exiting the app...")
-        self.tray.stop()  
+        tracing.save()
+        if self.tray is not None:
+            self.tray.stop()  
         pid = os.getpid()  
         os.kill(pid, signal.SIGINT) 
 
     def create_image(self) -> Image:
         """Creates an icon image."""
+        from PIL import ImageDraw
+
         image = Image.new('RGB', (64, 64), (255, 255, 255))
         draw = ImageDraw.Draw(image)
         draw.rectangle((16, 16, 48, 48), fill=(0, 0, 0))
         logger.info("SystemTray.create_image: Image created successfully")
         return image
 
+    def set_cover(self, image_url: str) -> None:
+        """Sets the tray icon to the given cover art, in the background."""
+        threading.Thread(target=self.__set_cover, args=(image_url,), daemon=True).start()
+        
+    def __set_cover(self, image_url: str) -> None:
+        image = CoverCache().get_image(image_url, (64, 64))
+        if image is None:
+            return
+        self.__icon_image = image
+        if self.tray is not None:
+            self.tray.icon = image
+        logger.debug("SystemTray.set_cover: Tray icon changed to the current cover.")
+
+    def set_update_progress(self, downloaded: Union[int, None], total: int = 0) -> None:
+        """Shows the progress of the update download on the tray title. None goes back to the normal title."""
+        self.__title = TITLE
+        if downloaded is not None:
+            progress = f"{downloaded * 100 // total}%" if total else f"{downloaded // (1024 * 1024)}MB"
+            self.__title = f"{TITLE} - Downloading update {progress}"
+        if self.tray is not None and self.tray.title != self.__title:
+            self.tray.title = self.__title
+
     def run(self) -> None:
-        """Runs the system tray."""
+        """Creates the system tray menu and runs it. pystray is only imported here, it's slow to import."""
+        from pystray import Icon, Menu, MenuItem
+
+        self.tray = Icon("media_controls")
+        self.tray.icon = self.__icon_image if self.__icon_image is not None else self.create_image()
+        self.tray.menu = Menu(
+            MenuItem("Play/Pause", self.play_pause),
+            MenuItem("Next", self.next_track),
+            MenuItem("Previous", self.previous_track),
+            MenuItem("Show log", self.show_log),
+            MenuItem(lambda item: f"Install update {self.__update[0]}" if self.__update is not None else "Install update",
+                     self.install_update,
+                     visible=lambda item: self.__update is not None),
+            MenuItem("Exit", self.exit_app)
+        )
+        self.tray.title = self.__title
+        
         logger.info("SystemTray.run: The tray is running.")
         self.tray.run()
@@ -0,0 +1,161 @@
+# Copyright 2026 Sagi Tsafrir
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Lightweight span tracing, exported as Chrome trace event JSON.
+
+Open the written file in `chrome://tracing` or https://ui.perfetto.dev. Tracing is off unless `enable`
+is called (see the `--trace` flag in main.py), while it's off every span is a shared no-op.
+"""
+
+import functools
+import itertools
+import json
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Union
+
+from logger import logger
+
+if getattr(sys, "frozen", False):
+    base_dir = Path(sys.executable).resolve().parent
+else:
+    base_dir = Path(__file__).resolve().parent
+
+TRACE_PATH = base_dir / "trace.json"
+MAX_EVENTS = 200000
+
+_enabled = False
+_path: Path = TRACE_PATH
+_events: list[dict[str, Any]] = []
+_lock = threading.Lock()
+_start = time.perf_counter()
+_flow_ids = itertools.count(1)
+_started_flows: set[int] = set()
+_thread_names: dict[int, str] = {}
+
+def _now_us() -> float:
+    return (time.perf_counter() - _start) * 1e6
+
+def _add(event: dict[str, Any]) -> None:
+    with _lock:
+        if len(_events) < MAX_EVENTS:
+            _events.append(event)
+            _thread_names[event["tid"]] = threading.current_thread().name
+
+class _Span():
+    __slots__ = ("name", "category", "flow", "args", "start")
+
+    def __init__(self, name: str, category: str, flow: Union[int, None], args: dict[str, Any]) -> None:
+        self.name = name
+        self.category = category
+        self.flow = flow
+        self.args = args
+
+    def __enter__(self) -> "_Span":
+        self.start = _now_us()
+        if self.flow is not None:
+            with _lock:
+                phase = "t" if self.flow in _started_flows else "s"
+                _started_flows.add(self.flow)
+            _add({"name": "action", "cat": "flow", "ph": phase, "id": self.flow, "ts": self.start,
+                  "pid": os.getpid(), "tid": threading.get_ident()})
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        event = {"name": self.name, "cat": self.category, "ph": "X", "ts": self.start, "dur": _now_us() - self.start,
+                 "pid": os.getpid(), "tid": threading.get_ident()}
+        if self.args:
+            event["args"] = self.args
+        _add(event)
+
+class _NullSpan():
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        pass
+
+_NULL_SPAN = _NullSpan()
+
+def enable(path: Union[Path, str, None] = None) -> None:
+    """Starts recording spans, to be written to `path` by `save`. Defaults to `trace.json` next to the app."""
+    global _enabled, _path
+    _path = Path(path) if path else TRACE_PATH
+    _enabled = True
+    logger.info(f"tracing.enable: Tracing to '{_path}'.")
+
+def is_enabled() -> bool:
+    return _enabled
+
+def span(name: str, category: str = "app", flow: Union[int, None] = None, **args) -> Union[_Span, _NullSpan]:
+    """A context manager that records the time spent inside it.
+
+    Args:
+        name (str): The name of the span, like "token refresh".
+        category (str, optional): The category of the span, like "spotify" or "image". Defaults to "app".
+        flow (int, optional): A flow from `new_flow`, the viewer draws arrows between the spans of a flow,
+            even across threads. Used for an action, from the click through the requests to the render.
+        **args: Shown with the span in the viewer.
+    """
+    if not _enabled:
+        return _NULL_SPAN
+    return _Span(name, category, flow, args)
+
+def traced(name: Union[str, None] = None, category: str = "app") -> Callable:
+    """A decorator that records every call of the function as a span, named after the function by default."""
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            with _Span(span_name, category, None, {}):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def instant(name: str, category: str = "app", **args) -> None:
+    """Records a point in time, like a click."""
+    if not _enabled:
+        return
+    _add({"name": name, "cat": category, "ph": "i", "s": "t", "ts": _now_us(),
+          "pid": os.getpid(), "tid": threading.get_ident(), "args": args})
+
+def new_flow() -> Union[int, None]:
+    """Returns the id of a new flow, to pass to the spans of one action. None while tracing is off."""
+    if not _enabled:
+        return None
+    return next(_flow_ids)
+
+def save() -> None:
+    """Writes the recorded spans as Chrome trace event JSON. Does nothing while tracing is off."""
+    if not _enabled:
+        return
+    with _lock:
+        events = list(_events)
+        # Names the threads in the viewer.
+        metadata = [{"name": "thread_name", "ph": "M", "pid": os.getpid(), "tid": tid, "args": {"name": name}}
+                    for tid, name in _thread_names.items()]
+    try:
+        _path.write_text(json.dumps({"traceEvents": metadata + events, "displayTimeUnit": "ms"}), encoding="utf-8")
+        logger.info(f"tracing.save: Wrote {len(events)} events to '{_path}'.")
+    except OSError as e:
+        logger.error(f"tracing.save: Failed to write '{_path}': {e}")
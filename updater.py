@@ -1,24 +1,187 @@
 import requests
+import hashlib
+import json
+import os
+import tempfile
+import time
 from pathlib import Path
+from urllib.parse import quote
 from zipfile import ZipFile
 import shutil
 import sys
 import subprocess
-from typing import Union
+from typing import Any, Iterable, Union
 
+from download import ProgressCallback, download_file
 from logger import logger
 
 KEEP_FILES = {"config.ini", ".env", "api/info.ini"}
+RELEASES_API = "https://api.github.com/repos/sagsag00/SpotifyBar/releases/latest"
+# (connect, read) seconds, an offline or slow network fails the check instead of holding it up.
+CHECK_TIMEOUT = (5, 10)
+
+# Every release has a manifest asset with the hash of each of its' files, so only the changed files are downloaded.
+# {"version": "0.4", "base_url": "<url the files are served under>", "files": {"<relative path>": {"sha256": "...", "size": 123}}}
+MANIFEST_NAME = "manifest.json"
+HASH_CHUNK_SIZE = 1024 * 1024
+# The release zip is downloaded in this many parallel ranges.
+DOWNLOAD_SEGMENTS = 4
+
+# Each update is installed to its' own folder in `<root>/versions`, and the pointer file in the root names the folder
+# that runs, and the one before it for a rollback: {"current": "versions/0.4", "previous": "."}.
+# The root is the folder the app was first installed to, "." in the pointer is the root itself.
+VERSIONS_DIR = "versions"
+POINTER_NAME = "current.json"
+
+def hash_file(path: Path) -> str:
+    """Returns the sha256 hex digest of the file."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        while chunk := file.read(HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def build_manifest(release_dir: Path, version: str, base_url: str) -> dict[str, Any]:
+    """Builds the manifest of a release, from the directory its' zip is made of."""
+    files = {}
+    for path in sorted(release_dir.rglob("*")):
+        rel_path = path.relative_to(release_dir).as_posix()
+        if path.is_file() and rel_path not in KEEP_FILES and rel_path != MANIFEST_NAME:
+            files[rel_path] = {"sha256": hash_file(path), "size": path.stat().st_size}
+    return {"version": version, "base_url": base_url, "files": files}
+
+def install_root(app_dir: Path) -> Path:
+    """Returns the folder with the pointer file, for the folder of a running version."""
+    app_dir = app_dir.resolve()
+    if app_dir.parent.name == VERSIONS_DIR:
+        return app_dir.parent.parent
+    return app_dir
+
+def read_pointer(root: Path) -> dict[str, Union[str, None]]:
+    try:
+        pointer = json.loads((root / POINTER_NAME).read_text())
+        return {"current": pointer["current"], "previous": pointer.get("previous")}
+    except (FileNotFoundError, ValueError, KeyError, TypeError):
+        return {"current": ".", "previous": None}
+
+def write_pointer(root: Path, current: Path, previous: Union[Path, None]) -> None:
+    """Switches the version that runs. The pointer is replaced in one rename, so it's never half written."""
+    pointer = {
+        "current": current.relative_to(root).as_posix(),
+        "previous": previous.relative_to(root).as_posix() if previous is not None else None
+    }
+    fd, temp_path = tempfile.mkstemp(dir=root, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "w") as file:
+            json.dump(pointer, file)
+        os.replace(temp_path, root / POINTER_NAME)
+    except BaseException:
+        Path(temp_path).unlink(missing_ok=True)
+        raise
+
+def current_install(app_dir: Path) -> Path:
+    """Returns the folder of the version the pointer file names, app_dir if it names none that exists."""
+    root = install_root(app_dir)
+    current = (root / read_pointer(root)["current"]).resolve()
+    return current if current.is_dir() else app_dir.resolve()
+
+def rollback(app_dir: Path) -> Union[Path, None]:
+    """Switches back to the previous version. Returns its' folder, or None if there is none."""
+    root = install_root(app_dir)
+    pointer = read_pointer(root)
+    if pointer["previous"] is None or not (root / pointer["previous"]).is_dir():
+        logger.error("There is no previous version to roll back to.")
+        return None
+    
+    previous = (root / pointer["previous"]).resolve()
+    write_pointer(root, previous, (root / pointer["current"]).resolve())
+    logger.info(f"Rolled back to '{pointer['previous']}'.")
+    return previous
+
+def launch(app_path: Path, args: tuple[str, ...] = ()) -> None:
+    """Starts the app in its' own folder, its' resources are loaded relative to it."""
+    if app_path.name == "main.py":
+        subprocess.Popen([sys.executable, str(app_path), *args], cwd=app_path.parent)
+        return
+    subprocess.Popen([str(app_path), *args], cwd=app_path.parent)
+
+def _link(src: Path, dest: Path) -> None:
+    """Hard links src to dest, or copies it where hard links aren't supported."""
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        os.link(src, dest)
+    except OSError:
+        shutil.copy2(src, dest)
    
 class Updater(): 
-    def __init__(self, version: float):
+    def __init__(self, version: float, releases_url: str = RELEASES_API):
         self.__version = version
+        self.releases_url = releases_url
+        # The manifest of the release being installed, None if it has none.
+        self.manifest: Union[dict[str, Any], None] = None
+        # The latest release and its' version, set by `check_new_version`.
+        self.release: Union[dict[str, Any], None] = None
+        self.latest_version: Union[str, None] = None
 
-    def check_new_version(self) -> bool:
-        response = requests.get("https://github.com/sagsag00/SpotifyBar/releases/latest")
-        new_version = response.url.split("/")[-1].replace("v", "")
+    def check_new_version(self, cache_path: Union[Path, None] = None, interval: float = 0) -> bool:
+        """
+        Checks if there's a newer release, and sets `release` and `latest_version`.
+        The last response is cached with its' ETag, and only asked again as a conditional request,
+        which the API answers with an empty 304 while the release is the same.
+        Args:
+            cache_path: Where to cache the last response, nothing is cached if None.
+            interval: Seconds in which the cached response is used without asking at all.
+        Returns:
+            Whether a newer version is available. If the check failed the cached response is used, if there is one.
+        """
+        cache = self.__load_check_cache(cache_path)
+        release = cache.get("release")
         
-        return not self.is_bigger_version(self.__version, new_version)
+        if release is None or time.time() - cache.get("checked_at", 0) >= interval:
+            headers = {"Accept": "application/vnd.github+json"}
+            if release is not None and cache.get("etag"):
+                headers["If-None-Match"] = cache["etag"]
+            try:
+                response = requests.get(self.releases_url, headers=headers, timeout=CHECK_TIMEOUT)
+                if response.status_code != 304:
+                    response.raise_for_status()
+                    release = response.json()
+                    cache["etag"] = response.headers.get("ETag")
+                cache["release"] = release
+                cache["checked_at"] = time.time()
+                self.__save_check_cache(cache_path, cache)
+            except (requests.RequestException, ValueError) as e:
+                logger.warning(f"Failed to check for a new version: {e}")
+        
+        if not isinstance(release, dict):
+            return False
+        self.release = release
+        self.latest_version = str(release.get("tag_name", "")).lstrip("v")
+        try:
+            return not self.is_bigger_version(self.__version, self.latest_version)
+        except ValueError:
+            logger.error(f"Invalid release version '{self.latest_version}'.")
+            return False
+
+    def __load_check_cache(self, cache_path: Union[Path, None]) -> dict[str, Any]:
+        if cache_path is None:
+            return {}
+        try:
+            cache = json.loads(cache_path.read_text())
+        except (FileNotFoundError, ValueError):
+            return {}
+        # A cache from another releases URL (e.g. a test server) says nothing about this one.
+        return cache if isinstance(cache, dict) and cache.get("url") == self.releases_url else {}
+
+    def __save_check_cache(self, cache_path: Union[Path, None], cache: dict[str, Any]) -> None:
+        if cache_path is None:
+            return
+        cache["url"] = self.releases_url
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            cache_path.write_text(json.dumps(cache))
+        except OSError as e:
+            logger.error(f"Failed to cache the version check: {e}")
     
     @staticmethod
     def is_bigger_version(version: str, compared_version: str) -> bool:
@@ -29,44 +192,175 @@ class Updater():
 
         return v1 >= v2
 
-    def download_new_version(self) -> Union[Path, None]:
+    def fetch_release(self) -> Union[dict[str, Any], None]:
+        """Gets the latest release from the GitHub API."""
+        try:
+            response = requests.get(self.releases_url, timeout=10)
+            response.raise_for_status()
+            return response.json()
+        except (requests.RequestException, ValueError) as e:
+            logger.error(f"Failed to get the latest release: {e}")
+            return None
+
+    def fetch_manifest(self, release: dict[str, Any]) -> Union[dict[str, Any], None]:
+        """Downloads the manifest of the release. Returns None if it has none, or it's invalid."""
+        asset = next((asset for asset in release.get("assets", []) if asset.get("name") == MANIFEST_NAME), None)
+        if asset is None:
+            logger.info("The release has no manifest.")
+            return None
+        try:
+            response = requests.get(asset["browser_download_url"], timeout=10)
+            response.raise_for_status()
+            manifest = response.json()
+        except (requests.RequestException, ValueError) as e:
+            logger.error(f"Failed to download the manifest: {e}")
+            return None
+        
+        if not isinstance(manifest.get("files"), dict):
+            logger.error("The manifest has no files.")
+            return None
+        return manifest
+
+    def changed_files(self, manifest: dict[str, Any], app_dir: Path) -> list[str]:
+        """Returns the files of the manifest that are missing from the install or differ from it."""
+        changed = []
+        for rel_path, entry in manifest["files"].items():
+            if rel_path in KEEP_FILES:
+                continue
+            path = app_dir / rel_path
+            # The size is compared first, so most changed files are found without hashing them.
+            if not path.is_file() or path.stat().st_size != entry.get("size") or hash_file(path) != entry["sha256"]:
+                changed.append(rel_path)
+        return changed
+
+    def verify(self, new_dir: Path, manifest: dict[str, Any], unchanged: Iterable[str] = ()) -> bool:
+        """
+        Checks that new_dir has every file in the manifest, and that each one matches its' hash.
+        Args:
+            unchanged: Files that aren't expected in new_dir, since `install` links them from the running version.
+        """
+        missing = manifest["files"].keys() - set(unchanged)
+        for path in new_dir.rglob("*"):
+            rel_path = path.relative_to(new_dir).as_posix()
+            entry = manifest["files"].get(rel_path)
+            if path.is_file() and entry is not None:
+                if hash_file(path) != entry["sha256"]:
+                    logger.error(f"Hash mismatch for '{rel_path}'.")
+                    return False
+                missing.discard(rel_path)
+        if missing:
+            logger.error(f"{len(missing)} files are missing, e.g. '{min(missing)}'.")
+            return False
+        return True
+
+    def download_changed_files(self, manifest: dict[str, Any], changed: list[str], new_dir: Path,
+                               progress: Union[ProgressCallback, None] = None) -> bool:
+        """Downloads the changed files into new_dir, keeping their relative paths, and verifies each one.
+            Files that are already there from an earlier attempt are kept.
+        """
+        base_url = manifest["base_url"].rstrip("/")
+        total = sum(manifest["files"][rel_path]["size"] for rel_path in changed)
+        completed = 0
+        try:
+            for rel_path in changed:
+                entry = manifest["files"][rel_path]
+                path = new_dir / rel_path
+                
+                if not path.is_file() or hash_file(path) != entry["sha256"]:
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                    file_progress = None
+                    if progress is not None:
+                        file_progress = lambda done, _, completed=completed: progress(completed + done, total)
+                    download_file(f"{base_url}/{quote(rel_path)}", path, file_progress)
+                    
+                    if hash_file(path) != entry["sha256"]:
+                        path.unlink()
+                        logger.error(f"Hash mismatch for the downloaded '{rel_path}'.")
+                        return False
+                
+                completed += entry["size"]
+                if progress is not None:
+                    progress(completed, total)
+        except (requests.RequestException, OSError) as e:
+            logger.error(f"Failed to download the changed files: {e}")
+            return False
+        return True
+
+    def download_update(self, app_dir: Path, download_dir: Path = Path("."),
+                        progress: Union[ProgressCallback, None] = None) -> Union[Path, None]:
+        """
+        Downloads the new version. Only the changed files are downloaded if the release has a manifest,
+        otherwise (or if that fails) the whole release is. The manifest is saved with the new files, for `install`.
+        An interrupted download is resumed by the next call.
+        Args:
+            progress: Called with the bytes downloaded so far and the total, from the download threads.
+        Returns:
+            The directory with the new files, or None on failure.
+        """
+        release = self.release or self.fetch_release()
+        if release is None:
+            return None
+        
+        download_dir.mkdir(parents=True, exist_ok=True)
+        self.manifest = self.fetch_manifest(release)
+        if self.manifest is not None and self.manifest.get("base_url"):
+            changed = self.changed_files(self.manifest, app_dir)
+            logger.info(f"{len(changed)} of {len(self.manifest['files'])} files changed.")
+            
+            new_dir = download_dir / f"SpotifyBar-{self.manifest.get('version', 'new')}-delta"
+            new_dir.mkdir(parents=True, exist_ok=True)
+            if self.download_changed_files(self.manifest, changed, new_dir, progress):
+                # Saved with the files that weren't downloaded, the only ones `install` may take from app_dir.
+                self.manifest["unchanged"] = sorted(self.manifest["files"].keys() - set(changed))
+                (new_dir / MANIFEST_NAME).write_text(json.dumps(self.manifest))
+                return new_dir
+            
+            shutil.rmtree(new_dir, ignore_errors=True)
+            logger.warning("Delta update failed, downloading the whole release.")
+        
+        new_dir = self.download_new_version(release, download_dir, progress)
+        if new_dir is not None and self.manifest is not None:
+            if not self.verify(new_dir, self.manifest):
+                shutil.rmtree(new_dir, ignore_errors=True)
+                return None
+            (new_dir / MANIFEST_NAME).write_text(json.dumps(self.manifest))
+        return new_dir
+
+    def download_new_version(self, release: Union[dict[str, Any], None] = None, download_dir: Path = Path("."),
+                             progress: Union[ProgressCallback, None] = None) -> Union[Path, None]:
         """
-        Download the new version.
+        Download the whole new version, in parallel ranges when the server supports them.
         Returns:
             Extracted directory path, or None on failure.
         """
         
         logger.info("Downloading new version...")
         try:
-            response = requests.get("https://api.github.com/repos/sagsag00/SpotifyBar/releases/latest")
-            response.raise_for_status()
-            data = response.json()
+            data = release or self.fetch_release()
+            if data is None:
+                return None
             
-            assets = data.get("assets", [])
+            assets = [asset for asset in data.get("assets", []) if asset.get("name") != MANIFEST_NAME]
             if not assets:
                 logger.error("No assets found in latest release.")
                 return None
             
             asset = assets[0]
             asset_url = asset["browser_download_url"]
-            filename: str = asset["name"]
-            
-            r = requests.get(asset_url, stream=True)
-            r.raise_for_status()
-            with open(filename, "wb") as f:
-                for chunk in r.iter_content(1024):
-                    f.write(chunk)
+            filename = download_dir / asset["name"]
                     
-            if not filename.endswith(".zip"):
+            if filename.suffix != ".zip":
                 logger.error(f"Unsupported file format: {filename}")
                 return None
+            
+            download_file(asset_url, filename, progress, DOWNLOAD_SEGMENTS)
                 
-            extract_dir = Path(filename).with_suffix("")
+            extract_dir = filename.with_suffix("")
             extract_dir.mkdir(exist_ok=True)
             with ZipFile(filename, "r") as zip_ref:
                 zip_ref.extractall(extract_dir)
                 
-            Path(filename).unlink()
+            filename.unlink()
             logger.info(f"Extracted new version to {extract_dir}")
             return extract_dir
         
@@ -74,40 +368,79 @@ class Updater():
             logger.error(f"Failed to download new version: {e}")
             return None
                
-    def replace_files(self, new_dir: Path, app_dir: Path):
+    def install(self, new_dir: Path, app_dir: Path) -> Union[Path, None]:
         """
-        Replaces all files in app_dir with files from new_dir,
-        except those in KEEP_FILES.
+        Installs the new version next to the running one, and switches to it.
+        new_dir is moved to `versions/<version>.staging`, the files it doesn't have (the ones `download_update`
+        found unchanged, and KEEP_FILES) are hard linked from app_dir, and once it's complete it's renamed to `versions/<version>`
+        and the pointer file is switched to it. Until the pointer is switched the running version is untouched,
+        and after it, it's kept as the previous version for `rollback`.
+        Returns:
+            The folder of the installed version, or None on failure.
         """
+        app_dir = app_dir.resolve()
+        root = install_root(app_dir)
+        version = str(self.manifest["version"]) if self.manifest is not None and self.manifest.get("version") else new_dir.name
+        version_dir = root / VERSIONS_DIR / version
+        staging_dir = root / VERSIONS_DIR / f"{version}.staging"
+        if version_dir.resolve() == app_dir:
+            logger.error(f"Version {version} is the one running.")
+            return None
+        
         try:
-            for src_path in new_dir.rglob("*"):
-                rel_path = src_path.relative_to(new_dir)
-                
-                if str(rel_path).replace("\\", "/") in KEEP_FILES:
-                    continue
-                
-                dest_path = app_dir / rel_path
-                
-                if src_path.is_dir():
-                    dest_path.mkdir(exist_ok=True)
-                else:
-                    dest_path.parent.mkdir(parents=True, exist_ok=True)
-                    shutil.copy2(src_path, dest_path)
-                    
-            shutil.rmtree(new_dir)  
-            logger.info("Files replaced successfully.")
-        except Exception as e:
-            logger.error(f"Failed to replace files: {e}")
+            staging_dir.parent.mkdir(exist_ok=True)
+            shutil.rmtree(staging_dir, ignore_errors=True)
+            shutil.move(new_dir, staging_dir)
+            
+            if self.manifest is not None:
+                # One walk instead of a stat per file, a whole release has every file already.
+                staged = {Path(dir_path, name).relative_to(staging_dir).as_posix()
+                          for dir_path, _, names in os.walk(staging_dir) for name in names}
+                missing = self.manifest["files"].keys() - staged
+                unexpected = missing - set(self.manifest.get("unchanged", ()))
+                if unexpected:
+                    raise OSError(f"{len(unexpected)} files are missing from the download, e.g. '{min(unexpected)}'")
+                for rel_path in missing:
+                    _link(app_dir / rel_path, staging_dir / rel_path)
+            for rel_path in KEEP_FILES:
+                if (app_dir / rel_path).is_file():
+                    (staging_dir / rel_path).unlink(missing_ok=True)
+                    _link(app_dir / rel_path, staging_dir / rel_path)
+            
+            shutil.rmtree(version_dir, ignore_errors=True)
+            os.replace(staging_dir, version_dir)
+            write_pointer(root, version_dir, app_dir)
+        except OSError as e:
+            logger.error(f"Failed to install the new version, keeping the current one: {e}")
+            shutil.rmtree(staging_dir, ignore_errors=True)
+            return None
+        
+        # Only the installed version and the one before it are kept.
+        for path in (root / VERSIONS_DIR).iterdir():
+            if path.is_dir() and path != version_dir and path != app_dir:
+                shutil.rmtree(path, ignore_errors=True)
+        
+        logger.info(f"Installed version {version}.")
+        return version_dir
        
+    def load_manifest(self, new_dir: Path) -> None:
+        """Loads the manifest that `download_update` saved with the new files, if there is one."""
+        try:
+            self.manifest = json.loads((new_dir / MANIFEST_NAME).read_text())
+        except (FileNotFoundError, ValueError):
+            self.manifest = None
+
     def restart_app(self, app_path: Path):
-        if app_path.name == "main.py":
-            subprocess.Popen([sys.executable, str(app_path)])
-            return
-        subprocess.Popen([str(app_path)])
+        launch(app_path)
        
 def main():
-    VERSION = sys.argv[1] if len(sys.argv) > 1 else "0.0"
-    manager = Updater(VERSION)
+    # `updater.py --manifest <release dir> <version> <base url>` writes the manifest of a release.
+    if len(sys.argv) == 5 and sys.argv[1] == "--manifest":
+        release_dir = Path(sys.argv[2])
+        manifest = build_manifest(release_dir, sys.argv[3], sys.argv[4])
+        (release_dir / MANIFEST_NAME).write_text(json.dumps(manifest, indent=1))
+        logger.info(f"Wrote the manifest of {len(manifest['files'])} files.")
+        return
     
     if getattr(sys, "frozen", False):
         app_dir = Path(sys.executable).resolve().parent
@@ -115,14 +448,33 @@ def main():
     else:
         app_dir = Path(__file__).resolve().parent
         app_path = app_dir / "main.py"
+    
+    # `updater.py --rollback` switches back to the version before the last update.
+    if len(sys.argv) == 2 and sys.argv[1] == "--rollback":
+        previous = rollback(app_dir)
+        if previous is None:
+            sys.exit(1)
+        launch(previous / app_path.name)
+        return
+    
+    # `updater.py --install <dir>` installs an update the app already downloaded, see `download_update`.
+    if len(sys.argv) == 3 and sys.argv[1] == "--install":
+        manager = Updater("0.0")
+        new_dir = Path(sys.argv[2])
+        manager.load_manifest(new_dir)
+    else:
+        VERSION = sys.argv[1] if len(sys.argv) > 1 else "0.0"
+        manager = Updater(VERSION)
         
-    new_dir = manager.download_new_version()
-    if new_dir is None:
-        logger.error("Update failed, aborting.")
-        sys.exit(1)
+        new_dir = manager.download_update(app_dir)
+        if new_dir is None:
+            logger.error("Update failed, aborting.")
+            sys.exit(1)
         
-    manager.replace_files(new_dir, app_dir)
-    manager.restart_app(app_path)
+    installed_dir = manager.install(new_dir, app_dir)
+    if installed_dir is None:
+        sys.exit(1)
+    manager.restart_app(installed_dir / app_path.name)
                 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -12,11 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from tkinter import Button, Tk, PhotoImage
-from PIL import Image, ImageTk
+from tkinter import Button, Tk
 from pathlib import Path
+from typing import Union
 
 from api import Spotify
+from media import SpriteCache
+from views.theme_registry import ThemeRegistry, BACKGROUND, TEXT, ICON
 
 class CustomButton(Button):
     def __init__(self, master: Tk = None, image_path: str = None, **kwargs) -> None:
@@ -24,7 +26,8 @@ class CustomButton(Button):
         
             Args:
                 master (Tk): The master window.
-                image_path (str): The path to the desired button icon.
+                image_path (str): The path to the desired button icon. Only its' name is used, the icon itself
+                    comes from the `SpriteCache` in the current theme color.
                 **kwargs: default keyword arguements of `tkinter.Button`
         """
         if kwargs.get("text"):
@@ -40,18 +43,17 @@ class CustomButton(Button):
         kwargs["height"] = kwargs.get("height", 1)
         
         self.tk_image = None
+        self.icon: Union[str, None] = None
         super().__init__(master, **kwargs)
         
         if image_path is not None:
-            path = Path(image_path)
-            themed_path = path.parent.parent / "buttons_themed" / path.name
-            
-            if themed_path.exists():
-                path = themed_path
-            
-            self.image_path = str(path)
-            self.tk_image = self.add_image(image_path)
-            self.config(image=self.tk_image, width=24, height=20)
+            self.set_icon(Path(image_path).stem)
+            self.config(width=24, height=20)
+        
+        registry = ThemeRegistry.of(self)
+        registry.register(self, BACKGROUND)
+        registry.register(self, TEXT)
+        registry.register(self, ICON, lambda color: self.refresh_image())
         
         self.bind("<ButtonPress-1>", self.on_press)
         self.bind("<ButtonRelease-1>", self.on_release)
@@ -66,23 +68,18 @@ class CustomButton(Button):
         """On release return the button to its' original size (animation)."""
         self.config(width=24, height=20)
        
-    def add_image(self, image_path: str) -> ImageTk.PhotoImage:
-        """Adds an image to the button"""
-        image = Image.open(image_path)
-        image.thumbnail((15, 15))
-        return ImageTk.PhotoImage(image)
+    def set_icon(self, icon: str) -> None:
+        """Shows the icon in the current theme color."""
+        self.icon = icon
+        self.tk_image = SpriteCache().photo(icon)
+        self.config(image=self.tk_image)
         
     def on_click(self):
         """On click function. Has to implement on each button"""
         raise NotImplementedError("function on_click is not defined.")
     
     def refresh_image(self) -> None:
-        """Reload image from disk, picking up themed version if available."""
-        if self.image_path is None:
+        """Shows the current icon again, in the current theme color."""
+        if self.icon is None:
             return
-        path = Path(self.image_path)
-        themed_path = path.parent.parent / "buttons_themed" / path.name
-        if themed_path.exists():
-            path = themed_path
-        self.tk_image = self.add_image(str(path))
-        self.config(image=self.tk_image)
\ No newline at end of file
+        self.set_icon(self.icon)
\ No newline at end of file
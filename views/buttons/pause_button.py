@@ -56,10 +56,7 @@ class PauseButton(CustomButton):
         logger.debug("PauseButton.on_click: Function has completed.")  
     
     def change_image(self) -> None:
-        self.image_path = "resources/buttons/pause.png" if self._is_active else "resources/buttons/resume.png"
-        self.tk_image = self.add_image(self.image_path)  
-        self.config(image=self.tk_image)
-        self.refresh_image()
+        self.set_icon("pause" if self._is_active else "resume")
         
     @property
     def is_active(self) -> bool:
@@ -27,19 +27,17 @@ class RepeatButton(CustomButton):
         # Cycle through the three modes
         if self.mode == "off":
             self.mode = "context"
-            self.image_path = "resources/buttons/repeat_context.png"
+            icon = "repeat_context"
         elif self.mode == "context":
             self.mode = "track"
-            self.image_path = "resources/buttons/repeat_track.png"
+            icon = "repeat_track"
         else: 
             self.mode = "off"
-            self.image_path = "resources/buttons/repeat_off.png"
+            icon = "repeat_off"
             
         self.spotify.set_repeat_mode(self.mode)
         
-        self.tk_image = self.add_image(self.image_path)
-        self.config(image=self.tk_image)
-        self.refresh_image()
+        self.set_icon(icon)
         
         logger.debug("RepeatButton.on_click: Function has completed.")
         
@@ -50,16 +48,14 @@ class RepeatButton(CustomButton):
         
         if mode == "off":
             self.mode = "off"
-            self.image_path = "resources/buttons/repeat_off.png"
+            icon = "repeat_off"
         elif mode == "context":
             self.mode = "context"
-            self.image_path = "resources/buttons/repeat_context.png"
+            icon = "repeat_context"
         else: 
             self.mode = "track"
-            self.image_path = "resources/buttons/repeat_track.png"
+            icon = "repeat_track"
 
-        self.tk_image = self.add_image(self.image_path)  
-        self.config(image=self.tk_image) 
-        self.refresh_image()
+        self.set_icon(icon)
         
         logger.debug("RepeatButton.load: Function has completed.")
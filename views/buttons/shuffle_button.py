@@ -29,10 +29,7 @@ class ShuffleButton(CustomButton):
             self.spotify.set_shuffle_mode("on")
         
         self.is_active = not self.is_active  
-        self.image_path = "resources/buttons/shuffle_on.png" if self.is_active else "resources/buttons/shuffle_off.png"
-        self.tk_image = self.add_image(self.image_path)  
-        self.config(image=self.tk_image)
-        self.refresh_image()
+        self.set_icon("shuffle_on" if self.is_active else "shuffle_off")
         
         logger.debug("ShuffleButton.on_click: Function has completed.")  
         
@@ -41,9 +38,6 @@ class ShuffleButton(CustomButton):
         if is_active is None:
             return
         self.is_active = is_active  
-        self.image_path = "resources/buttons/shuffle_on.png" if self.is_active else "resources/buttons/shuffle_off.png"
-        self.tk_image = self.add_image(self.image_path)  
-        self.config(image=self.tk_image) 
-        self.refresh_image()
+        self.set_icon("shuffle_on" if self.is_active else "shuffle_off")
         
         logger.debug("ShuffleButton.load: Function has completed.")  
\ No newline at end of file
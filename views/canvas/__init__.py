@@ -0,0 +1 @@
+from views.canvas.canvas_bar import CanvasBar
\ No newline at end of file
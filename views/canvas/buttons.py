@@ -0,0 +1,155 @@
+# Copyright 2026 Sagi Tsafrir
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import os
+import signal
+import threading
+from tkinter import Canvas
+from typing import Callable, Union
+
+from api import Spotify
+from logger import logger
+from media import SpriteCache
+
+ICON_TAG = "icon"
+
+class CanvasButton():
+    def __init__(self, canvas: Canvas, name: str, x: int, y: int, icon: str) -> None:
+        """An icon item that acts as a button, standing in for `CustomButton`.
+
+        Args:
+            canvas (Canvas): The bar canvas.
+            name (str): The hit-test target name of the item.
+            x (int), y (int): The center of the icon.
+            icon (str): The icon name in the `SpriteCache`.
+        """
+        self.canvas = canvas
+        self.spotify = Spotify()
+        self.icon: Union[str, None] = None
+        self.tk_image = None
+        self.item = canvas.create_image(x, y, anchor="center", tags=(ICON_TAG, name))
+        canvas.add_target(name, on_click=self.on_click)
+        self.set_icon(icon)
+
+    def set_icon(self, icon: str) -> None:
+        """Shows the icon in the current theme color."""
+        self.icon = icon
+        self.tk_image = SpriteCache().photo(icon)
+        self.canvas.itemconfig(self.item, image=self.tk_image)
+
+    def refresh_image(self) -> None:
+        if self.icon is not None:
+            self.set_icon(self.icon)
+
+    def on_click(self) -> None:
+        raise NotImplementedError("function on_click is not defined.")
+
+class CanvasCallbackButton(CanvasButton):
+    """The next and previous buttons. Clicking runs the callback on a thread."""
+
+    def __init__(self, canvas: Canvas, name: str, x: int, y: int, icon: str) -> None:
+        super().__init__(canvas, name, x, y, icon)
+        self.callable: Callable[..., None] = None
+
+    def set_callback(self, callable: Callable[..., None]) -> None:
+        self.callable = callable
+
+    def on_click(self) -> None:
+        if self.callable:
+            threading.Thread(target=self.callable).start()
+
+class CanvasPauseButton(CanvasButton):
+    def __init__(self, canvas: Canvas, x: int, y: int) -> None:
+        super().__init__(canvas, "pause", x, y, "pause")
+        self._is_active = True
+        self.callback: Callable[[bool], None] = None
+
+    def set_callback(self, callback: Callable[[bool], None]) -> None:
+        self.callback = callback
+
+    def on_click(self) -> None:
+        """Toggles between playing and paused, like `PauseButton`."""
+        paused = self._is_active
+        threading.Thread(target=self.spotify.pause if paused else self.spotify.play).start()
+        if self.callback:
+            threading.Thread(target=self.callback, args=(paused,)).start()
+        self._is_active = not self._is_active
+        self.change_image()
+        logger.debug("CanvasPauseButton.on_click: Function has completed.")
+
+    def load(self) -> None:
+        is_active = self.spotify.is_player_active()
+        if is_active is None:
+            return
+        self._is_active = is_active
+        self.change_image()
+
+    def change_image(self) -> None:
+        self.set_icon("pause" if self._is_active else "resume")
+
+    @property
+    def is_active(self) -> bool:
+        return self._is_active
+
+    @is_active.setter
+    def is_active(self, new_val: bool) -> None:
+        if isinstance(new_val, bool) and new_val != self._is_active:
+            self._is_active = new_val
+            self.change_image()
+
+class CanvasShuffleButton(CanvasButton):
+    def __init__(self, canvas: Canvas, x: int, y: int) -> None:
+        super().__init__(canvas, "shuffle", x, y, "shuffle_off")
+        self.is_active = False
+
+    def on_click(self) -> None:
+        self.is_active = not self.is_active
+        threading.Thread(target=self.spotify.set_shuffle_mode, args=("on" if self.is_active else "off",)).start()
+        self.set_icon("shuffle_on" if self.is_active else "shuffle_off")
+
+    def load(self) -> None:
+        is_active = self.spotify.is_shuffle_active()
+        if is_active is None:
+            return
+        self.is_active = is_active
+        self.set_icon("shuffle_on" if self.is_active else "shuffle_off")
+
+class CanvasRepeatButton(CanvasButton):
+    MODES = ("off", "context", "track")
+
+    def __init__(self, canvas: Canvas, x: int, y: int) -> None:
+        super().__init__(canvas, "repeat", x, y, "repeat_off")
+        self.mode = "off"
+
+    def on_click(self) -> None:
+        """Cycles between the off, context and track repeat modes."""
+        self.mode = self.MODES[(self.MODES.index(self.mode) + 1) % len(self.MODES)]
+        threading.Thread(target=self.spotify.set_repeat_mode, args=(self.mode,)).start()
+        self.set_icon(f"repeat_{self.mode}")
+
+    def load(self) -> None:
+        mode = self.spotify.get_repeat_mode()
+        if mode is None:
+            return
+        self.mode = mode if mode in self.MODES else "track"
+        self.set_icon(f"repeat_{self.mode}")
+
+class CanvasExitButton(CanvasButton):
+    def __init__(self, canvas: Canvas, x: int, y: int) -> None:
+        super().__init__(canvas, "exit", x, y, "exit")
+
+    def on_click(self) -> None:
+        self.canvas.winfo_toplevel().destroy()
+        os.kill(os.getpid(), signal.SIGINT)
@@ -0,0 +1,162 @@
+# Copyright 2026 Sagi Tsafrir
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from tkinter import Canvas, Event, Misc
+from typing import Any, Callable, NamedTuple, Union
+
+from PIL import ImageTk
+
+from logger import logger
+from views.canvas.buttons import CanvasButton, CanvasCallbackButton, CanvasExitButton, CanvasPauseButton, CanvasRepeatButton, CanvasShuffleButton
+from views.canvas.items import TEXT_TAG, CanvasImage, CanvasTrackText
+from views.canvas.scales import KNOB_TAG, LINE_TAG, CanvasPlaybackScale, CanvasVolumeScale
+from views.layout import COVER_POSITION, SONG_POSITION, ARTIST_POSITION, TITLE_MAX_WIDTH, ALBUM_MAX_WIDTH
+from views.theme_registry import ThemeRegistry, BACKGROUND, TEXT, SCALE, ICON
+
+# Pixels around the pointer that still count as a hit, so small icons are easy to click.
+HIT_HALO = 3
+BACKGROUND_IMAGE_TAG = "background_image"
+
+class Target(NamedTuple):
+    on_click: Union[Callable[[], None], None]
+    on_drag: Union[Callable[[int, int], None], None]
+    on_release: Union[Callable[[int, int], None], None]
+
+class CanvasBar(Canvas):
+    def __init__(self, master: Misc, width: int, height: int, placeholder: Union[ImageTk.PhotoImage, None] = None, **kwargs) -> None:
+        """The whole bar drawn on a single canvas, an alternative to building it from separate widgets.
+
+            Every part of the bar is a tagged canvas item. Clicks and drags are hit-tested against the items'
+            targets, and theming is a few `itemconfig` calls by tag. The parts are exposed with the same names
+            and interface as the widgets `GuiManager` manages, see `views()`.
+
+        Args:
+            master (Misc): The window.
+            width (int), height (int): The size of the bar.
+            placeholder (PhotoImage, optional): The cover shown until the first track loads.
+        """
+        kwargs["bg"] = master.cget("bg")
+        kwargs["highlightthickness"] = 0
+        kwargs["bd"] = 0
+        super().__init__(master, width=width, height=height, **kwargs)
+
+        self.__targets: dict[str, Target] = {}
+        self.__pressed: Union[str, None] = None
+        self.__background_image: Union[ImageTk.PhotoImage, None] = None
+
+        self.song_pic = CanvasImage(self, *COVER_POSITION, placeholder)
+        self.song_label = CanvasTrackText(self, "song", *SONG_POSITION, ("Circular-black", 12, "bold"), TITLE_MAX_WIDTH)
+        self.artist_label = CanvasTrackText(self, "artist", *ARTIST_POSITION, ("Circular-black", 10, ""), TITLE_MAX_WIDTH)
+        self.album_label = CanvasTrackText(self, "album", *ARTIST_POSITION, ("Circular-black", 10, ""), ALBUM_MAX_WIDTH)
+
+        self.shuffle_button = CanvasShuffleButton(self, 125, 135)
+        self.previous_button = CanvasCallbackButton(self, "previous", 151, 135, "previous")
+        self.pause_button = CanvasPauseButton(self, 177, 135)
+        self.next_button = CanvasCallbackButton(self, "next", 203, 135, "next")
+        self.repeat_button = CanvasRepeatButton(self, 229, 135)
+        self.exit_button = CanvasExitButton(self, width - 12, 12)
+        self.buttons: tuple[CanvasButton, ...] = (self.shuffle_button, self.previous_button, self.pause_button,
+                                                 self.next_button, self.repeat_button, self.exit_button)
+
+        self.playback_scale = CanvasPlaybackScale(self, 91, 153, 177, ("David", 8, "bold"))
+        self.volume_scale = CanvasVolumeScale(self, width - 17, 27, 115)
+
+        registry = ThemeRegistry.of(self)
+        registry.register(self, BACKGROUND, lambda color: self.configure(bg=color))
+        registry.register(self, TEXT, lambda color: self.itemconfig(TEXT_TAG, fill=color))
+        registry.register(self, SCALE, self.__set_scale_color)
+        registry.register(self, ICON, self.__refresh_icons)
+
+        self.bind("<ButtonPress-1>", self.__on_press)
+        self.bind("<B1-Motion>", self.__on_motion)
+        self.bind("<ButtonRelease-1>", self.__on_release)
+        logger.debug(f"CanvasBar.__init__: Drew the bar with {len(self.find_all())} items.")
+
+    def views(self) -> dict[str, Any]:
+        """The parts of the bar, keyed like the keyword arguments of `GuiManager`."""
+        return dict(playback_scale=self.playback_scale, volume_scale=self.volume_scale, exit_button=self.exit_button,
+                    pause_button=self.pause_button, next_button=self.next_button, repeat_button=self.repeat_button,
+                    previous_button=self.previous_button, shuffle_button=self.shuffle_button, song_pic=self.song_pic,
+                    song_label=self.song_label, artist_label=self.artist_label, album_label=self.album_label)
+
+    def set_background_image(self, image: Union[ImageTk.PhotoImage, None]) -> None:
+        """Shows the image below every other item, the canvas covers the window so it's the bar's background.
+            None removes it.
+        """
+        if image is None:
+            self.delete(BACKGROUND_IMAGE_TAG)
+        elif self.__background_image is None:
+            self.create_image(0, 0, anchor="nw", image=image, tags=(BACKGROUND_IMAGE_TAG,))
+            self.tag_lower(BACKGROUND_IMAGE_TAG)
+        else:
+            self.itemconfig(BACKGROUND_IMAGE_TAG, image=image)
+        self.__background_image = image  # Keep a reference to prevent garbage collection
+
+    def add_target(self, tag: str,
+                   on_click: Union[Callable[[], None], None] = None,
+                   on_drag: Union[Callable[[int, int], None], None] = None,
+                   on_release: Union[Callable[[int, int], None], None] = None) -> None:
+        """Makes the items with the tag react to the pointer.
+
+        Args:
+            tag (str): The tag of the items.
+            on_click (Callable, optional): Called when the pointer is pressed and released over the items.
+            on_drag (Callable, optional): Called with the pointer position while dragging from the items.
+            on_release (Callable, optional): Called with the pointer position when a drag from the items ends.
+        """
+        self.__targets[tag] = Target(on_click, on_drag, on_release)
+
+    def hit_test(self, x: int, y: int) -> Union[str, None]:
+        """Returns the target under the point, the topmost one if they overlap."""
+        for item in reversed(self.find_overlapping(x - HIT_HALO, y - HIT_HALO, x + HIT_HALO, y + HIT_HALO)):
+            for tag in self.gettags(item):
+                if tag in self.__targets:
+                    return tag
+        return None
+
+    def __refresh_icons(self, color: str) -> None:
+        for button in self.buttons:
+            button.refresh_image()
+
+    def __set_scale_color(self, color: str) -> None:
+        self.itemconfig(LINE_TAG, fill=color)
+        self.itemconfig(KNOB_TAG, fill=color, outline=color)
+
+    # Returning "break" keeps presses and drags on a target from also moving the window.
+    def __on_press(self, event: Event) -> Union[str, None]:
+        self.__pressed = self.hit_test(event.x, event.y)
+        if not self.__pressed:
+            return None
+        if self.__targets[self.__pressed].on_drag:
+            self.__targets[self.__pressed].on_drag(event.x, event.y)
+        return "break"
+
+    def __on_motion(self, event: Event) -> Union[str, None]:
+        if not self.__pressed:
+            return None
+        if self.__targets[self.__pressed].on_drag:
+            self.__targets[self.__pressed].on_drag(event.x, event.y)
+        return "break"
+
+    def __on_release(self, event: Event) -> Union[str, None]:
+        pressed, self.__pressed = self.__pressed, None
+        if not pressed:
+            return None
+        target = self.__targets[pressed]
+        if target.on_release:
+            target.on_release(event.x, event.y)
+        if target.on_click and self.hit_test(event.x, event.y) == pressed:
+            target.on_click()
+        return "break"
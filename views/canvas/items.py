@@ -0,0 +1,121 @@
+# Copyright 2026 Sagi Tsafrir
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from tkinter import Canvas
+from typing import Callable, Union
+
+from PIL import ImageTk
+
+from api import Spotify
+from logger import logger
+from views.label.song_label import TrackText
+from views.label.text_fit import measure_text, truncate_text
+from views.label.time_value import TimeValue
+
+TEXT_TAG = "text"
+
+class CanvasImage():
+    def __init__(self, canvas: Canvas, x: int, y: int, image: Union[ImageTk.PhotoImage, None] = None) -> None:
+        """An image item, standing in for the cover `Label`."""
+        self.canvas = canvas
+        self.image = image
+        self.item = canvas.create_image(x, y, anchor="nw", image=image)
+
+    def config(self, image: ImageTk.PhotoImage = None, **kwargs) -> None:
+        if image is not None:
+            self.canvas.itemconfig(self.item, image=image)
+
+    configure = config
+
+class CanvasTrackText(TrackText):
+    def __init__(self, canvas: Canvas, name: str, x: int, y: int, font: tuple, max_width: int) -> None:
+        """A text item showing the song, artist or album, standing in for `SongLabel`.
+
+        Args:
+            canvas (Canvas): The bar canvas.
+            name (str): The hit-test target name of the item.
+            x (int), y (int): The top left corner of the text.
+            font (tuple): The font spec.
+            max_width (int): Longer titles are cut with "…".
+        """
+        self.canvas = canvas
+        self.font = font
+        self.max_width = max_width
+        self.spotify = Spotify()
+        self.callable: Callable = None
+        self.item = canvas.create_text(x, y, anchor="nw", font=font, fill="black", tags=(TEXT_TAG, name))
+        canvas.add_target(name, on_click=self.on_click)
+
+    @property
+    def title(self) -> str:
+        return self.canvas.itemcget(self.item, "text")
+
+    @title.setter
+    def title(self, new_title: str) -> None:
+        if not new_title or new_title.strip() == "- None":
+            new_title = "Unknown"
+            logger.info("CanvasTrackText.title.setter: Title was empty or 'None', setting to 'Unknown'")
+        self.canvas.itemconfig(self.item, text=truncate_text(self.canvas, new_title, self.font, self.max_width))
+
+    def place(self, x: int = None, y: int = None, **kwargs) -> None:
+        current_x, current_y = self.canvas.coords(self.item)
+        self.canvas.coords(self.item, current_x if x is None else x, current_y if y is None else y)
+
+    @property
+    def text_width(self) -> int:
+        return measure_text(self.canvas, self.title, self.font)
+
+    def winfo_x(self) -> int:
+        return int(self.canvas.coords(self.item)[0])
+
+    def winfo_y(self) -> int:
+        return int(self.canvas.coords(self.item)[1])
+
+    def winfo_width(self) -> int:
+        bbox = self.canvas.bbox(self.item)
+        return bbox[2] - bbox[0] if bbox else 0
+
+class CanvasTimeText():
+    def __init__(self, canvas: Canvas, x: int, y: int, font: tuple) -> None:
+        """A "m:ss" text item, standing in for `TimeLabel`. Reconfigured only when the shown text changes."""
+        self.canvas = canvas
+        self.__value = TimeValue()
+        self.item = canvas.create_text(x, y, anchor="center", font=font, fill="gray", text=self.__value.text, tags=TEXT_TAG)
+
+    @property
+    def value(self) -> TimeValue:
+        return self.__value
+
+    @value.setter
+    def value(self, new_value: Union[TimeValue, None]) -> None:
+        if new_value is None or new_value == self.__value:
+            return
+        changed = new_value.text != self.__value.text
+        self.__value = new_value
+        if changed:
+            self.canvas.itemconfig(self.item, text=new_value.text)
+
+    @property
+    def miliseconds(self) -> int:
+        return self.__value.milliseconds
+
+    @miliseconds.setter
+    def miliseconds(self, new_val: Union[int, None]) -> None:
+        if new_val is not None:
+            self.value = TimeValue(new_val)
+
+    @property
+    def curr_time(self) -> str:
+        return self.__value.text
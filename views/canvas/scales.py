@@ -0,0 +1,129 @@
+# Copyright 2026 Sagi Tsafrir
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import threading
+from tkinter import Canvas
+
+from api import Spotify
+from views.canvas.items import CanvasTimeText
+from views.frame_scheduler import FrameScheduler
+from views.scales.playback_timer import PlaybackTimer
+
+LINE_TAG = "scale_line"
+KNOB_TAG = "scale_knob"
+KNOB_SIZE = 10
+VOLUME_UPDATE_DELAY_MS = 200
+
+class CanvasPlaybackScale(PlaybackTimer):
+    def __init__(self, canvas: Canvas, x: int, y: int, length: int, time_font: tuple) -> None:
+        """The playback timeline as a line, a knob and two time texts, standing in for `PlaybackScale`.
+
+            The timer is the same `PlaybackTimer` as `PlaybackScale`.
+
+        Args:
+            canvas (Canvas): The bar canvas.
+            x (int), y (int): The left end of the line.
+            length (int): The length of the line the knob moves along.
+            time_font (tuple): The font spec of the time texts.
+        """
+        self.canvas = canvas
+        self.x, self.y, self.length = x, y, length
+        self.spotify = Spotify()
+        self._init_timer(FrameScheduler.of(canvas), f"canvas_playback{canvas}")
+        self._knob_x = 0
+
+        canvas.create_line(x, y, x + length + KNOB_SIZE, y, fill="gray", width=3, tags=(LINE_TAG, "playback"))
+        self.knob = canvas.create_oval(x, y - 5, x + KNOB_SIZE, y + 5, fill="darkgray", outline="darkgray", width=2,
+                                       tags=(KNOB_TAG, "playback"))
+        self.curr_time = CanvasTimeText(canvas, x - 15, y, time_font)
+        self.end_time = CanvasTimeText(canvas, x + length + KNOB_SIZE + 20, y, time_font)
+        canvas.add_target("playback", on_drag=self.__on_drag, on_release=self.__on_release)
+
+    @property
+    def value(self) -> int:
+        return int(self._knob_x / self.length * 100)
+
+    @value.setter
+    def value(self, new_val: float) -> None:
+        self.__set_knob_x(round((new_val or 0) / 100 * self.length + 0.5))
+
+    def _move_knob(self, fraction: float) -> bool:
+        return self.__set_knob_x(round(fraction * self.length + 0.5))
+
+    def __set_knob_x(self, new_x: int) -> bool:
+        new_x = min(max(new_x, 0), self.length)
+        if new_x == self._knob_x:
+            return False
+        self.canvas.move(self.knob, new_x - self._knob_x, 0)
+        self._knob_x = new_x
+        return True
+
+    def __on_drag(self, x: int, y: int) -> None:
+        self.stop_timer()
+        self.__set_knob_x(x - self.x)
+        self.curr_time.miliseconds = int(self.end_time.miliseconds * (self.value / 100))
+
+    def __on_release(self, x: int, y: int) -> None:
+        self.curr_time.miliseconds = int(self.end_time.miliseconds * (self.value / 100)) - 1
+        threading.Thread(target=self.spotify.set_playback_state_ms, args=(self.curr_time.miliseconds,)).start()
+        self.start_timer()
+
+class CanvasVolumeScale():
+    def __init__(self, canvas: Canvas, x: int, y: int, length: int) -> None:
+        """The volume as a vertical line and a knob, standing in for `VolumeScale`.
+
+        Args:
+            canvas (Canvas): The bar canvas.
+            x (int), y (int): The top end of the line.
+            length (int): The length of the line the knob moves along.
+        """
+        self.canvas = canvas
+        self.x, self.y, self.length = x, y, length
+        self.spotify = Spotify()
+        self._scheduler = FrameScheduler.of(canvas)
+        self._volume_update_job: int = None
+        self._knob_y = 0
+
+        canvas.create_line(x, y, x, y + length + KNOB_SIZE, fill="gray", width=3, tags=(LINE_TAG, "volume"))
+        self.knob = canvas.create_oval(x - 5, y, x + 5, y + KNOB_SIZE, fill="darkgray", outline="darkgray", width=2,
+                                       tags=(KNOB_TAG, "volume"))
+        canvas.add_target("volume", on_drag=self.__on_drag)
+
+    @property
+    def value(self) -> int:
+        return 100 - int(self._knob_y / self.length * 100)
+
+    @value.setter
+    def value(self, new_val: int) -> None:
+        new_val = 50 if new_val is None else new_val
+        self.__set_knob_y(round(abs(100 - new_val) / 100 * self.length + 0.5))
+
+    def load(self) -> None:
+        self.value = self.spotify.get_volume()
+
+    def __set_knob_y(self, new_y: int) -> None:
+        new_y = min(max(new_y, 0), self.length)
+        self.canvas.move(self.knob, 0, new_y - self._knob_y)
+        self._knob_y = new_y
+
+    def __on_drag(self, x: int, y: int) -> None:
+        self.__set_knob_y(y - self.y)
+        if self._volume_update_job:
+            self._scheduler.cancel(self._volume_update_job)
+        self._volume_update_job = self._scheduler.call_later(VOLUME_UPDATE_DELAY_MS, self.__update_volume)
+
+    def __update_volume(self) -> None:
+        self._volume_update_job = None
+        threading.Thread(target=self.spotify.set_volume, args=(self.value,)).start()
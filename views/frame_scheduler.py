@@ -0,0 +1,253 @@
+# Copyright 2026 Sagi Tsafrir
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import heapq
+import itertools
+import math
+import queue
+import threading
+import time
+from collections import deque
+from tkinter import Misc, TclError
+from typing import Callable
+
+from logger import logger
+
+STATS_WINDOW = 240
+
+class FrameScheduler():
+    def __init__(self, master: Misc, frame_rate: int = 30) -> None:
+        """A single frame loop on the Tk thread that drives every animation and timer of a window.
+
+            Animations are callbacks `callback(now: float) -> bool` that are called once per frame and
+            return whether they changed anything on screen. Timers are one-shot callbacks that replace
+            widget level `after()` chains. While nothing is animating the loop only wakes for the next timer,
+            and with no timers either it stops until `add_animation`, `call_later` or `post` needs it again.
+            Every method can be called from any thread, off the Tk thread the changes are posted to it.
+
+            Args:
+                master (Misc): The window the loop runs on.
+                frame_rate (int): Frames per second while something is animating.
+        """
+        self.master = master
+        self.frame_rate = frame_rate
+
+        self.__animations: dict[str, Callable[[float], bool]] = {}
+        self.__timers: list[tuple[float, int, Callable, tuple]] = []
+        self.__cancelled: set[int] = set()
+        self.__timer_ids = itertools.count(1)
+        self.__posted: queue.SimpleQueue = queue.SimpleQueue()
+        self.__after_id: str = None
+        # Set while nothing animates and the loop waits for the next timer or stopped for lack of them,
+        # so a `post` knows to wake it.
+        self.__sleeping = False
+        self.__sleep_lock = threading.Lock()
+        self.__tk_thread = threading.get_ident()
+
+        self.__frame_times: deque[float] = deque(maxlen=STATS_WINDOW)
+        self.frames_rendered = 0
+        self.frames_skipped = 0
+
+        master._frame_scheduler = self
+        logger.debug(f"FrameScheduler.__init__: Frame scheduler created at {frame_rate} fps.")
+
+    @classmethod
+    def of(cls, widget: Misc) -> "FrameScheduler":
+        """Returns the frame scheduler of the widgets' window, creating one if needed."""
+        window = widget.winfo_toplevel()
+        scheduler = getattr(window, "_frame_scheduler", None)
+        if scheduler is None:
+            scheduler = cls(window)
+        return scheduler
+
+    @property
+    def frame_rate(self) -> int:
+        return self.__frame_rate
+
+    @frame_rate.setter
+    def frame_rate(self, new_rate: int) -> None:
+        self.__frame_rate = min(max(int(new_rate), 1), 240)
+        self.__frame_interval = 1 / self.__frame_rate
+
+    def is_tk_thread(self) -> bool:
+        """Returns whether it's called from the thread the loop runs on."""
+        return threading.get_ident() == self.__tk_thread
+
+    def start(self) -> None:
+        """Starts the frame loop. Does nothing if it's already running."""
+        if not self.is_tk_thread():
+            self.post(self.start)
+            return
+        with self.__sleep_lock:
+            self.__sleeping = False
+        if self.__after_id is None:
+            self.__after_id = self.master.after(0, self.__tick)
+            logger.debug("FrameScheduler.start: Frame loop started.")
+
+    def stop(self) -> None:
+        """Stops the frame loop."""
+        if not self.is_tk_thread():
+            self.post(self.stop)
+            return
+        with self.__sleep_lock:
+            self.__sleeping = False
+        if self.__after_id is not None:
+            try:
+                self.master.after_cancel(self.__after_id)
+            except TclError:
+                pass
+            self.__after_id = None
+            logger.debug("FrameScheduler.stop: Frame loop stopped.")
+
+    def add_animation(self, name: str, callback: Callable[[float], bool]) -> None:
+        """Registers an animation, replacing any animation with the same name."""
+        if not self.is_tk_thread():
+            self.post(self.add_animation, name, callback)
+            return
+        self.__animations[name] = callback
+        self.__start_or_wake()
+
+    def remove_animation(self, name: str) -> None:
+        if not self.is_tk_thread():
+            self.post(self.remove_animation, name)
+            return
+        self.__animations.pop(name, None)
+
+    def is_animating(self, name: str) -> bool:
+        return name in self.__animations
+
+    def call_later(self, delay_ms: int, func: Callable, *args) -> int:
+        """Runs `func(*args)` on the Tk thread after `delay_ms`. Returns an id usable with `cancel`."""
+        timer_id = next(self.__timer_ids)
+        timer = (time.perf_counter() + delay_ms / 1000, timer_id, func, args)
+        if self.is_tk_thread():
+            self.__push_timer(timer)
+        else:
+            self.post(self.__push_timer, timer)
+        return timer_id
+
+    def __push_timer(self, timer: tuple[float, int, Callable, tuple]) -> None:
+        heapq.heappush(self.__timers, timer)
+        self.__start_or_wake()
+
+    def cancel(self, timer_id: int) -> None:
+        if not self.is_tk_thread():
+            self.post(self.cancel, timer_id)
+            return
+        if timer_id is not None and any(timer[1] == timer_id for timer in self.__timers):
+            self.__cancelled.add(timer_id)
+
+    def post(self, func: Callable, *args) -> None:
+        """Runs `func(*args)` on the Tk thread on the next frame. Safe to call from any thread."""
+        self.__posted.put((func, args))
+        with self.__sleep_lock:
+            wake, self.__sleeping = self.__sleeping, False
+        if not wake:
+            return
+        if self.is_tk_thread():
+            self.__wake()
+            return
+        try:
+            # tkinter hands calls from other threads to the Tk thread, only `__wake` touches the loop state.
+            self.master.after(0, self.__wake)
+        except (RuntimeError, TclError) as e:
+            logger.error(f"FrameScheduler.post: Failed to wake the frame loop: {e}")
+
+    def frame_stats(self) -> dict[str, float]:
+        """Returns the average and max time spent in the recent rendered frames, in milliseconds."""
+        if not self.__frame_times:
+            return {"average_ms": 0.0, "max_ms": 0.0, "frames": 0}
+        return {
+            "average_ms": sum(self.__frame_times) / len(self.__frame_times) * 1000,
+            "max_ms": max(self.__frame_times) * 1000,
+            "frames": len(self.__frame_times)
+        }
+
+    def __start_or_wake(self) -> None:
+        """Starts the loop, or if it's sleeping until a later timer, runs the next frame now to reschedule it."""
+        if self.__sleeping:
+            self.__wake()
+        else:
+            self.start()
+
+    def __wake(self) -> None:
+        """Runs the next frame now instead of when the next timer is due."""
+        if self.__after_id is not None:
+            try:
+                self.master.after_cancel(self.__after_id)
+            except TclError:
+                pass
+            self.__after_id = None
+        self.start()
+
+    def __tick(self) -> None:
+        self.__after_id = None
+        frame_start = time.perf_counter()
+
+        while True:
+            try:
+                func, args = self.__posted.get_nowait()
+            except queue.Empty:
+                break
+            self.__run(func, args)
+
+        while self.__timers and self.__timers[0][0] <= frame_start:
+            _, timer_id, func, args = heapq.heappop(self.__timers)
+            if timer_id in self.__cancelled:
+                self.__cancelled.discard(timer_id)
+                continue
+            self.__run(func, args)
+
+        changed = False
+        for callback in list(self.__animations.values()):
+            changed = bool(self.__run(callback, (frame_start,))) or changed
+
+        if changed:
+            self.__frame_times.append(time.perf_counter() - frame_start)
+            self.frames_rendered += 1
+            if self.frames_rendered % 600 == 0:
+                stats = self.frame_stats()
+                logger.debug("FrameScheduler: avg frame %.3fms, max %.3fms, %d skipped.",
+                             stats["average_ms"], stats["max_ms"], self.frames_skipped)
+        elif self.__animations:
+            self.frames_skipped += 1
+
+        if self.__after_id is not None:
+            # Already started again by a callback of this frame.
+            return
+        with self.__sleep_lock:
+            self.__sleeping = not self.__animations and self.__posted.empty()
+            if self.__sleeping and not self.__timers:
+                return
+        self.__after_id = self.master.after(self.__next_delay_ms(), self.__tick)
+
+    def __next_delay_ms(self) -> int:
+        """The next frame while animating, otherwise the next timer."""
+        if not self.__posted.empty():
+            return 1
+        if self.__animations:
+            delay = self.__frame_interval
+            if self.__timers:
+                delay = min(delay, max(self.__timers[0][0] - time.perf_counter(), 0))
+        else:
+            delay = max(self.__timers[0][0] - time.perf_counter(), 0)
+        # Rounded up, a frame a little before the timer is due would only schedule another one.
+        return max(math.ceil(delay * 1000), 1)
+
+    def __run(self, func: Callable, args: tuple):
+        try:
+            return func(*args)
+        except Exception as e:
+            logger.error(f"FrameScheduler: Error in scheduled callback {func}: {e}")
+            return False
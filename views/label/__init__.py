@@ -1,3 +1,5 @@
-from views.label.song_label import SongLabel, SONG, ARTIST, ALBUM
+from views.label.song_label import SongLabel, TrackText, SONG, ARTIST, ALBUM
+from views.label.marquee_label import MarqueeLabel
+from views.label.time_value import TimeValue
 from views.label.time_label import TimeLabel
 from views.label.background_image import BackgroundImage
\ No newline at end of file
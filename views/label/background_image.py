@@ -13,9 +13,11 @@
 # limitations under the License.
 
 from tkinter import Label
+from views.theme_registry import ThemeRegistry, BACKGROUND
 
 class BackgroundImage(Label):
     def __init__(self, master = None, **kwrags) -> None:
         super().__init__(master, **kwrags)
+        ThemeRegistry.of(self).register(self, BACKGROUND)
         
     
\ No newline at end of file
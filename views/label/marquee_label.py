@@ -0,0 +1,168 @@
+# Copyright 2026 Sagi Tsafrir
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import time
+from collections import deque
+from tkinter import Canvas
+from typing import Callable
+
+from api import Spotify
+from logger import logger
+from views.frame_scheduler import FrameScheduler
+from views.label.song_label import TrackText
+from views.label.text_fit import font_for
+from views.theme_registry import ThemeRegistry, BACKGROUND, TEXT
+
+SCROLL_SPEED = 30  # Pixels per second.
+GAP = 40  # Pixels between the end of the title and its' next copy.
+TAG = "title"
+
+class MarqueeLabel(TrackText, Canvas):
+    def __init__(self, master = None, font_size = 12, is_bold = True, max_width: int = 125, **kwargs):
+        """A label that scrolls titles longer than `max_width` instead of truncating them.
+
+            The title is drawn once as two canvas text items, one after the other, and scrolled with `move()`
+            by the windows' frame scheduler, so a frame never reconfigures text or relayouts the window.
+            It only scrolls while the pointer is over it and the window is visible.
+        """
+        self.__font = ("Circular-black", font_size, "bold" if is_bold else "")
+        kwargs["bg"] = master.cget("bg")
+        kwargs["highlightthickness"] = 0
+        kwargs["bd"] = 0
+        kwargs["height"] = font_for(master, self.__font).metrics("linespace")
+        kwargs["width"] = max_width
+        super().__init__(master, **kwargs)
+
+        self.__max_width = max_width
+        self.__title = ""
+        self.__text_width = 0
+        self.__offset = 0.0
+        self.__last_frame: float = None
+        self.__frame_costs: deque[float] = deque(maxlen=60)
+        self.__hovered = False
+        self.__animation = f"marquee{self}"
+        self.__scheduler = FrameScheduler.of(self)
+
+        self.spotify = Spotify()
+        self.callable: Callable = None
+
+        y = kwargs["height"] // 2
+        self.__items = (self.create_text(0, y, anchor="w", font=self.__font, fill="black", tags=TAG),
+                        self.create_text(0, y, anchor="w", font=self.__font, fill="black", tags=TAG, state="hidden"))
+
+        registry = ThemeRegistry.of(self)
+        registry.register(self, BACKGROUND)
+        registry.register(self, TEXT, lambda color: self.itemconfig(TAG, fill=color))
+
+        self.bind("<Button-1>", lambda e: self.on_click())
+        self.bind("<Enter>", self.__on_enter)
+        self.bind("<Leave>", self.__on_leave)
+        logger.debug(f"MarqueeLabel.__init__: MarqueeLabel initialized with font_size={font_size}, is_bold={is_bold}, max_width={max_width}")
+
+    @property
+    def title(self) -> str:
+        return self.__title
+
+    @title.setter
+    def title(self, new_title: str) -> None:
+        if not new_title or new_title.strip() == "- None":
+            new_title = "Unknown"
+            logger.info("MarqueeLabel.title.setter: Title was empty or 'None', setting to 'Unknown'")
+        if new_title == self.__title:
+            return
+
+        self.__title = new_title
+        self.__text_width = font_for(self, self.__font).measure(new_title)
+        for item in self.__items:
+            self.itemconfig(item, text=new_title)
+        self.__layout()
+        logger.debug("MarqueeLabel.title.setter: Title set: %s", new_title)
+
+    @property
+    def text_width(self) -> int:
+        """The width the label takes for its' current title."""
+        return min(self.__text_width, self.__max_width)
+
+    @property
+    def max_width(self) -> int:
+        return self.__max_width
+
+    @max_width.setter
+    def max_width(self, new_width: int) -> None:
+        if new_width != self.__max_width:
+            self.__max_width = new_width
+            self.__layout()
+
+    @property
+    def frame_cost_ms(self) -> float:
+        """The average time spent in the last scrolled frames, in milliseconds."""
+        if not self.__frame_costs:
+            return 0.0
+        return sum(self.__frame_costs) / len(self.__frame_costs) * 1000
+
+    @property
+    def __overflows(self) -> bool:
+        return self.__text_width > self.__max_width
+
+    def __layout(self) -> None:
+        """Sizes the canvas to the title and moves the title back to its' start. Only on title or width changes.
+            The copy is only shown while the title overflows, which either change can flip.
+        """
+        self.__offset = 0.0
+        self.coords(self.__items[0], 0, self.winfo_reqheight() // 2)
+        self.coords(self.__items[1], self.__text_width + GAP, self.winfo_reqheight() // 2)
+        self.itemconfig(self.__items[1], state="normal" if self.__overflows else "hidden")
+        self.config(width=min(self.__text_width, self.__max_width))
+        if self.__hovered and self.__overflows:
+            self.__start()
+        else:
+            self.__stop()
+
+    def __on_enter(self, event) -> None:
+        self.__hovered = True
+        if self.__overflows:
+            self.__start()
+
+    def __on_leave(self, event) -> None:
+        self.__hovered = False
+        self.__stop()
+
+    def __start(self) -> None:
+        if not self.__scheduler.is_animating(self.__animation):
+            self.__last_frame = None
+            self.__scheduler.add_animation(self.__animation, self.__on_frame)
+
+    def __stop(self) -> None:
+        self.__scheduler.remove_animation(self.__animation)
+
+    def __on_frame(self, now: float) -> bool:
+        """Frame callback. Scrolls the title by whole pixels, returns whether it moved."""
+        start = time.perf_counter()
+        if not self.winfo_viewable():
+            self.__stop()
+            return False
+
+        elapsed = 0.0 if self.__last_frame is None else now - self.__last_frame
+        self.__last_frame = now
+
+        # The copy follows the title one loop length behind, so wrapping around is seamless.
+        before = int(self.__offset)
+        self.__offset = (self.__offset + elapsed * SCROLL_SPEED) % (self.__text_width + GAP)
+        dx = before - int(self.__offset)
+        if dx:
+            self.move(TAG, dx, 0)
+
+        self.__frame_costs.append(time.perf_counter() - start)
+        return bool(dx)
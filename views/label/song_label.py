@@ -17,29 +17,18 @@ from api import Spotify
 from typing import Callable
 import threading
 from logger import logger
+from views.label.text_fit import measure_text, truncate_text
+from views.theme_registry import ThemeRegistry, BACKGROUND, TEXT
 
 SONG = 0
 ARTIST = 1
 ALBUM = 2
 
-class SongLabel(Label):
-    def __init__(self, master = None, font_size = 12, is_bold = True, max_width: int = 125, **kwargs):
-        bold = ""
-        if is_bold:
-            bold = "bold"
-        kwargs["fg"] = "black"
-        kwargs["font"] = ("Circular-black", font_size, bold)
-        kwargs["bg"] = master.cget("bg")
-        super().__init__(master, **kwargs)
-
-        self.max_width = max_width
-        self.spotify = Spotify()
-        self.callable: Callable = None
-        
-        self.bind("<Button-1>", lambda e: self.on_click())
-        logger.debug(f"SongLabel.__init__: SongLabel initialized with font_size={font_size}, is_bold={is_bold}, max_width={max_width}")
-
-        
+class TrackText():
+    """The track loading and click handling shared by the labels that show the song, artist and album.
+        Subclasses provide the `title` and `text_width` properties, `spotify` and `callable`.
+    """
+    
     def set_callback(self, callable: Callable) -> None:
         self.callable = callable
         logger.debug("SongLabel.set_callback: Function has completed.") 
@@ -53,7 +42,7 @@ class SongLabel(Label):
         logger.debug("SongLabel.on_click: Function has completed.") 
     
     def load(self, type: int) -> None:
-        logger.debug(f"SongLabel.load: loading with type={type}")
+        logger.debug("SongLabel.load: loading with type=%s", type)
         if type not in (SONG, ARTIST, ALBUM):
             logger.error(f"SongLabel.load: Invalid type {type} passed to load function.")
             return
@@ -72,6 +61,37 @@ class SongLabel(Label):
     def __load_album(self) -> None:
         self.title = f"- {self.spotify.get_song_album()}"
 
+class SongLabel(TrackText, Label):
+    def __init__(self, master = None, font_size = 12, is_bold = True, max_width: int = 125, **kwargs):
+        bold = ""
+        if is_bold:
+            bold = "bold"
+        kwargs["fg"] = "black"
+        self.__font = kwargs["font"] = ("Circular-black", font_size, bold)
+        kwargs["bg"] = master.cget("bg")
+        super().__init__(master, **kwargs)
+
+        self.max_width = max_width
+        self.spotify = Spotify()
+        self.callable: Callable = None
+        
+        registry = ThemeRegistry.of(self)
+        registry.register(self, BACKGROUND)
+        registry.register(self, TEXT)
+        
+        self.bind("<Button-1>", lambda e: self.on_click())
+        logger.debug(f"SongLabel.__init__: SongLabel initialized with font_size={font_size}, is_bold={is_bold}, max_width={max_width}")
+
+    @property
+    def text_width(self) -> int:
+        """The width the label takes for its' current text, measured with the font instead of a layout pass."""
+        return measure_text(self, self.cget("text"), self.__font) + self.__padding
+
+    @property
+    def __padding(self) -> int:
+        """The label adds its' padding and border around the text on both sides."""
+        return 2 * sum(self.winfo_pixels(self.cget(option)) for option in ("padx", "borderwidth", "highlightthickness"))
+
     @property
     def title(self) -> str:
         return self.cget("text")
@@ -82,15 +102,7 @@ class SongLabel(Label):
             new_title = "Unknown"
             logger.info("SongLabel.title.setter: Title was empty or 'None', setting to 'Unknown'")
             
-        truncated_title = new_title
-
-        self.config(text=truncated_title)
-        self.update_idletasks()
-
-        while self.winfo_reqwidth() > self.max_width and len(truncated_title) > 1:
-            truncated_title = truncated_title[:-2] + "…"
-            self.config(text=truncated_title)
-            self.update_idletasks()
-
+        truncated_title = truncate_text(self, new_title, self.__font, self.max_width - self.__padding)
+        
         self.config(text=truncated_title)
-        logger.debug(f"SongLabel.title.setter: Final title set: {truncated_title}")
+        logger.debug("SongLabel.title.setter: Final title set: %s", truncated_title)
\ No newline at end of file
@@ -0,0 +1,70 @@
+# Copyright 2026 Sagi Tsafrir
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from functools import lru_cache
+from tkinter import Misc
+from tkinter.font import Font
+
+ELLIPSIS = "…"
+FontSpec = tuple
+
+_fonts: dict[FontSpec, Font] = {}
+
+def font_for(widget: Misc, spec: FontSpec) -> Font:
+    """Returns a `Font` for the spec, created once per spec, used to measure text without laying anything out."""
+    font = _fonts.get(spec)
+    if font is None:
+        font = _fonts[spec] = Font(root=widget, font=spec)
+    return font
+
+@lru_cache(maxsize=512)
+def _measure(spec: FontSpec, text: str) -> int:
+    return _fonts[spec].measure(text)
+
+def measure_text(widget: Misc, text: str, spec: FontSpec) -> int:
+    """Returns the width of the text in pixels when drawn in the font, without laying anything out. Memoized."""
+    font_for(widget, spec)
+    return _measure(spec, text)
+
+@lru_cache(maxsize=256)
+def _truncate(text: str, spec: FontSpec, max_width: int) -> str:
+    if len(text) <= 1 or _measure(spec, text) <= max_width:
+        return text
+
+    # The longest prefix that fits with the ellipsis, the same result as removing a character at a time.
+    low, high = 0, max(len(text) - 2, 0)
+    while low < high:
+        middle = (low + high + 1) // 2
+        if _measure(spec, text[:middle] + ELLIPSIS) <= max_width:
+            low = middle
+        else:
+            high = middle - 1
+    return text[:low] + ELLIPSIS
+
+def truncate_text(widget: Misc, text: str, spec: FontSpec, max_width: int) -> str:
+    """Truncates the text with an ellipsis so it fits in `max_width` pixels when drawn in the font.
+        Measured with font metrics using a binary search, and memoized by (text, font, max_width).
+
+    Args:
+        widget (Misc): Any widget, used to create the font the first time the spec is seen.
+        text (str): The text.
+        spec (tuple): The font spec, for example `("Circular-black", 12, "bold")`.
+        max_width (int): The width available to the text itself, in pixels.
+
+    Returns:
+        str: The text, or the longest prefix of it followed by "…" that fits.
+    """
+    font_for(widget, spec)
+    return _truncate(text, spec, max_width)
@@ -13,17 +13,39 @@
 # limitations under the License.
 
 from tkinter import Label
+from typing import Union
 from logger import logger
+from views.label.time_value import TimeValue
+from views.theme_registry import ThemeRegistry, BACKGROUND, TEXT
 
 class TimeLabel(Label):
     def __init__(self, master = None, start_time: str = "00:00", **kwargs) -> None:
-        kwargs["text"] = start_time 
+        self.__value = TimeValue.parse(start_time)
+        self.__shown_text = kwargs["text"] = self.__value.text
         super().__init__(master, **kwargs)
         
-        self.__curr_time_min = int(start_time.split(":")[0])
-        self.__curr_time_sec = int(start_time.split(":")[1])
+        registry = ThemeRegistry.of(self)
+        registry.register(self, BACKGROUND)
+        registry.register(self, TEXT)
         
         logger.debug("TimeLabel.__init__: TimeLabel is initialized")
+        
+    def __render(self) -> None:
+        """Reconfigures the label only when the displayed text actually changes."""
+        text = self.__value.text
+        if self.__shown_text != text:
+            self.text = text
+           
+    @property
+    def value(self) -> TimeValue:
+        return self.__value
+    
+    @value.setter
+    def value(self, new_value: Union[TimeValue, None]) -> None:
+        if new_value is None or new_value == self.__value:
+            return
+        self.__value = new_value
+        self.__render()
            
     @property
     def text(self) -> str:
@@ -31,108 +53,85 @@ class TimeLabel(Label):
     
     @text.setter
     def text(self, new_val: str) -> None:
+        self.__shown_text = new_val
         self.config(text=new_val)
         
     @text.deleter
     def text(self) -> None:
-        self.config(text="00:00")
+        self.text = "00:00"
         
     @property
     def curr_time(self) -> str:
-        return f"{self.__curr_time_min}:{self.__curr_time_sec}"
+        return self.__value.text
     
     @curr_time.setter
-    def curr_time(self, new_value) -> None:
+    def curr_time(self, new_value: Union[str, None]) -> None:
         if new_value is None:
             return
-        self.__curr_time_min = int(new_value.split(":")[0])
-        self.__curr_time_sec = int(new_value.split(":")[1])
-        self.config(text=new_value)
+        self.value = TimeValue.parse(new_value)
     
     @curr_time.deleter
     def curr_time(self) -> None:
-        self.__curr_time_min = 0
-        self.__curr_time_sec = 0
-        self.text = f"{self.minutes}:{self.seconds:02}"
+        self.value = TimeValue()
     
     @property
     def minutes(self) -> int:
-        return self.__curr_time_min
+        return self.__value.minutes
     
     @minutes.setter
-    def minutes(self, new_value) -> None:
+    def minutes(self, new_value: Union[int, None]) -> None:
         if new_value is None:
             return
-        self.__curr_time_min = new_value
-        self.text = f"{self.minutes}:{self.seconds:02}"
+        self.value = TimeValue.from_seconds(new_value * 60 + self.seconds)
     
     @minutes.deleter
     def minutes(self) -> None:
-        self.__curr_time_min = 0
-        self.text = f"{self.minutes}:{self.seconds:02}"
+        self.minutes = 0
     
     @property
     def seconds(self) -> int:
-        return self.__curr_time_sec
+        return self.__value.seconds
     
     @seconds.setter
-    def seconds(self, new_value) -> None:
+    def seconds(self, new_value: Union[int, None]) -> None:
         if new_value is None:
             return
-        if new_value >= 60:
-            self.__curr_time_min += new_value // 60
-        self.__curr_time_sec = new_value % 60
-        self.text = f"{self.minutes}:{self.seconds:02}"
+        # Overflowing seconds carry into the minutes.
+        self.value = TimeValue.from_seconds(self.minutes * 60 + new_value)
         
     @seconds.deleter
     def seconds(self) -> None:
-        self.__curr_time_sec = 0
-        self.text = f"{self.minutes}:{self.seconds:02}"
+        self.seconds = 0
         
     @property
     def miliseconds(self) -> int:
-        return (self.minutes * 60 + self.seconds) * 1000
+        return self.__value.milliseconds
     
     @miliseconds.setter
-    def miliseconds(self, new_val: int) -> None:
-        seconds = new_val // 1000
-        minutes = seconds // 60
-        seconds %= 60
-        
-        self.seconds = seconds
-        self.minutes = minutes
+    def miliseconds(self, new_val: Union[int, None]) -> None:
+        if new_val is None:
+            return
+        self.value = TimeValue(new_val)
     
     def __eq__(self, other) -> bool:
-        return self.minutes == other.minutes and self.seconds == other.seconds
+        return self.__value == TimeLabel.__as_value(other)
     
     def __gt__(self, other) -> bool:
-        if self.minutes > other.minutes:
-            return True
-        elif self.minutes == other.minutes:
-            return self.seconds > other.seconds
-        return False
+        return self.__value > TimeLabel.__as_value(other)
     
     def __ge__(self, other) -> bool:
-        return self > other or self == other
+        return self.__value >= TimeLabel.__as_value(other)
     
     def __lt__(self, other) -> bool:
-        return not self >= other
+        return self.__value < TimeLabel.__as_value(other)
     
     def __le__(self, other) -> bool:
-        return not self > other
+        return self.__value <= TimeLabel.__as_value(other)
     
-    def __add__(self, other):
-        new_time_label = TimeLabel()
-        new_time_label.curr_time = self.curr_time
-        
-        if isinstance(other, int):
-            new_time_label.seconds += other
-            
-        if isinstance(other, TimeLabel):
-            new_time_label.miliseconds += other.miliseconds
-        
-        return new_time_label
-
-        
-        
-    
\ No newline at end of file
+    def __add__(self, other) -> TimeValue:
+        """Returns the sum as a `TimeValue`. An int is treated as milliseconds, like `TimeValue` does."""
+        return self.__value + TimeLabel.__as_value(other)
+    
+    @staticmethod
+    def __as_value(other) -> TimeValue:
+        return other.value if isinstance(other, TimeLabel) else other
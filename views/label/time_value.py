@@ -0,0 +1,110 @@
+# Copyright 2026 Sagi Tsafrir
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from functools import lru_cache, total_ordering
+from typing import Union
+
+@lru_cache(maxsize=2048)
+def _format_seconds(total_seconds: int) -> str:
+    """Formats a whole amount of seconds as "m:ss". Cached, since the same values are shown every track."""
+    minutes, seconds = divmod(total_seconds, 60)
+    return f"{minutes}:{seconds:02}"
+
+@total_ordering
+class TimeValue():
+    """An immutable playback time, stored as whole milliseconds."""
+
+    __slots__ = ("_milliseconds",)
+
+    def __init__(self, milliseconds: int = 0) -> None:
+        object.__setattr__(self, "_milliseconds", max(int(milliseconds), 0))
+
+    def __setattr__(self, name, value) -> None:
+        raise AttributeError("TimeValue is immutable.")
+
+    @classmethod
+    def from_seconds(cls, seconds: int) -> "TimeValue":
+        return cls(seconds * 1000)
+
+    @classmethod
+    def parse(cls, text: str) -> "TimeValue":
+        """Parses a "m:ss" string.
+
+        Args:
+            text (str): The time in "m:ss" format.
+
+        Returns:
+            TimeValue: The parsed time.
+        """
+        minutes, seconds = text.split(":")
+        return cls((int(minutes) * 60 + int(seconds)) * 1000)
+
+    @property
+    def milliseconds(self) -> int:
+        return self._milliseconds
+
+    @property
+    def total_seconds(self) -> int:
+        return self._milliseconds // 1000
+
+    @property
+    def minutes(self) -> int:
+        return self.total_seconds // 60
+
+    @property
+    def seconds(self) -> int:
+        """The seconds part of the time (0 -> 59)."""
+        return self.total_seconds % 60
+
+    @property
+    def text(self) -> str:
+        """The time in "m:ss" format."""
+        return _format_seconds(self.total_seconds)
+
+    def __add__(self, other: Union["TimeValue", int]) -> "TimeValue":
+        """Adds another `TimeValue` or an amount of milliseconds."""
+        if isinstance(other, TimeValue):
+            return TimeValue(self._milliseconds + other._milliseconds)
+        if isinstance(other, int):
+            return TimeValue(self._milliseconds + other)
+        return NotImplemented
+
+    __radd__ = __add__
+
+    def __sub__(self, other: Union["TimeValue", int]) -> "TimeValue":
+        """Subtracts another `TimeValue` or an amount of milliseconds. Never goes below zero."""
+        if isinstance(other, TimeValue):
+            return TimeValue(self._milliseconds - other._milliseconds)
+        if isinstance(other, int):
+            return TimeValue(self._milliseconds - other)
+        return NotImplemented
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, TimeValue):
+            return NotImplemented
+        return self._milliseconds == other._milliseconds
+
+    def __lt__(self, other) -> bool:
+        if not isinstance(other, TimeValue):
+            return NotImplemented
+        return self._milliseconds < other._milliseconds
+
+    def __hash__(self) -> int:
+        return hash(self._milliseconds)
+
+    def __str__(self) -> str:
+        return self.text
+
+    def __repr__(self) -> str:
+        return f"TimeValue({self._milliseconds})"
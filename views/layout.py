@@ -0,0 +1,40 @@
+# Copyright 2026 Sagi Tsafrir
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+# The bar is laid out from these known sizes and the measured text widths, never by reading back
+# the geometry of placed widgets, so building and updating the bar doesn't need to flush the event loop.
+
+WINDOW_SIZE = (370, 170)
+
+COVER_POSITION = (30, 20)
+SONG_POSITION = (COVER_POSITION[0] + 96, COVER_POSITION[1] + 8)
+ARTIST_POSITION = (SONG_POSITION[0], SONG_POSITION[1] + 22)
+
+TITLE_MAX_WIDTH = 200
+ALBUM_MAX_WIDTH = 125
+# The artist and the album share a row, the album takes whatever the artist leaves.
+ARTIST_ROW_WIDTH = 230
+
+def album_placement(artist_width: int) -> tuple[int, int, int]:
+    """Places the album right after the artist.
+
+    Args:
+        artist_width (int): The width of the artist text, in pixels.
+
+    Returns:
+        tuple[int, int, int]: The x and y of the album and its' max width.
+    """
+    x, y = ARTIST_POSITION
+    return x + artist_width, y, ARTIST_ROW_WIDTH - artist_width
@@ -0,0 +1,158 @@
+# Copyright 2026 Sagi Tsafrir
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import threading
+import time
+from typing import Callable
+
+from logger import logger
+from views.frame_scheduler import FrameScheduler
+from views.label.time_value import TimeValue
+
+ONE_SECOND = TimeValue.from_seconds(1)
+SYNC_INTERVAL = TimeValue.from_seconds(20)
+
+class PlaybackTimer():
+    """The playback timer shared by `PlaybackScale` and `CanvasPlaybackScale`.
+
+        The position is extrapolated on every frame from the last known position (the anchor), and synced with
+        spotify every `SYNC_INTERVAL`. Every Tk change happens on the Tk thread: called from a worker thread,
+        `start`, `start_timer`, `stop_timer`, `reset` and `load` read spotify there and post the rest.
+
+        Users set `spotify`, `curr_time` and `end_time`, call `_init_timer` and implement `value` and `_move_knob`.
+    """
+
+    def _init_timer(self, scheduler: FrameScheduler, animation: str) -> None:
+        self._scheduler = scheduler
+        self._animation = animation
+        self.stop_callback: Callable = None
+        self._is_timer_running = False
+        self._anchor_ms = 0
+        self._anchor_time = time.perf_counter()
+        self._last_sync = TimeValue()
+
+    def _move_knob(self, fraction: float) -> bool:
+        """Moves the knob to the fraction of the track played, returns whether it moved."""
+        raise NotImplementedError
+
+    def set_callback(self, callback: Callable) -> None:
+        """Sets the callback to be called one second before the end of the track."""
+        self.stop_callback = callback
+
+    def start(self) -> None:
+        """Starts the timer and playback moving animation from scratch, while syncing it with spotify."""
+        self._on_tk_thread(self.__start, *self._read_playback())
+
+    def __start(self, position_ms: int, duration_ms: int) -> None:
+        self._apply_playback(position_ms, duration_ms)
+        if not self.curr_time.miliseconds:
+            logger.warning("PlaybackTimer.start: No playback state found.")
+            return
+        self.start_timer()
+
+    def start_timer(self) -> None:
+        """Starts moving the timer and the knob on the frame scheduler. Prevents multiple timers."""
+        if not self._scheduler.is_tk_thread():
+            self._scheduler.post(self.start_timer)
+            return
+        if self._is_timer_running:
+            return
+        self._is_timer_running = True
+        self._anchor(self.curr_time.miliseconds)
+        self._scheduler.add_animation(self._animation, self._on_frame)
+
+    _start_animation_playback_position = start_timer
+
+    def stop_timer(self) -> None:
+        if not self._scheduler.is_tk_thread():
+            self._scheduler.post(self.stop_timer)
+            return
+        self._scheduler.remove_animation(self._animation)
+        if self._is_timer_running:
+            self._is_timer_running = False
+            logger.debug("PlaybackTimer.stop_timer: Timer stopped.")
+
+    def reset(self) -> None:
+        """Resets the timer to 0:00"""
+        if not self._scheduler.is_tk_thread():
+            self._scheduler.post(self.reset)
+            return
+        self.stop_timer()
+        self.curr_time.value = TimeValue()
+        self.start_timer()
+
+    def load(self) -> None:
+        """Loads the current playback position and the duration of the current playing track."""
+        self._on_tk_thread(self._apply_playback, *self._read_playback())
+
+    def sync(self) -> None:
+        """Like `load`, but the playback is read on a worker thread even when called from the Tk thread."""
+        threading.Thread(target=lambda: self._scheduler.post(self._apply_playback, *self._read_playback()),
+                         daemon=True).start()
+
+    def _read_playback(self) -> tuple[int, int]:
+        return self.spotify.get_playback_state_ms(), self.spotify.get_song_duration_ms()
+
+    def _on_tk_thread(self, func: Callable, *args) -> None:
+        """Runs `func(*args)` now on the Tk thread, or posts it to the Tk thread from any other."""
+        if self._scheduler.is_tk_thread():
+            func(*args)
+        else:
+            self._scheduler.post(func, *args)
+
+    def _apply_playback(self, position_ms: int, duration_ms: int) -> None:
+        self.curr_time.miliseconds = position_ms
+        self.end_time.miliseconds = duration_ms
+        self.value = (self.curr_time.miliseconds / (self.end_time.miliseconds + 0.1)) * 100
+        self._anchor(self.curr_time.miliseconds)
+
+        if self.curr_time.value > self.end_time.value:
+            self.stop_timer()
+        logger.debug("PlaybackTimer.load: Loaded current time: %s, end time: %s.", self.curr_time.value, self.end_time.value)
+
+    def _anchor(self, position_ms: int) -> None:
+        """Sets the known playback position the frames extrapolate from."""
+        self._anchor_ms = position_ms
+        self._anchor_time = time.perf_counter()
+        self._last_sync = TimeValue(position_ms)
+
+    def _on_frame(self, now: float) -> bool:
+        """Frame callback. Advances the timer and knob, returns whether anything on screen changed."""
+        position = TimeValue(self._anchor_ms + int((now - self._anchor_time) * 1000))
+        end = self.end_time.value
+
+        # Check if we've reached the end time
+        if position >= end:
+            self.stop_timer()
+            self.sync()
+            return False
+
+        # Stop one second before the end of the song
+        if position + ONE_SECOND >= end:
+            self.stop_timer()
+            if self.stop_callback:
+                self.stop_callback()
+            logger.debug("PlaybackTimer._on_frame: End time reached, stopping playback.")
+            return False
+
+        # Sync every 20 seconds
+        if position - self._last_sync >= SYNC_INTERVAL:
+            self._last_sync = position
+            self.sync()
+
+        text_changed = position.total_seconds != self.curr_time.value.total_seconds
+        self.curr_time.value = position
+        moved = self._move_knob(position.milliseconds / end.milliseconds)
+        return text_changed or moved
@@ -15,6 +15,7 @@
 from tkinter import Tk, Canvas, Event
 from api import Spotify
 from logger import logger
+from views.theme_registry import ThemeRegistry, BACKGROUND, SCALE
 
 class Scale(Canvas):
     def __init__(self, master: Tk = None, orientation: str = "vertical", **kwargs):
@@ -51,6 +52,10 @@ class Scale(Canvas):
         else:
             self._create_horizontal()
             self.bind("<B1-Motion>", self._move_button_horizontal)
+        
+        registry = ThemeRegistry.of(self)
+        registry.register(self, BACKGROUND)
+        registry.register(self, SCALE, self.set_theme_color)
             
         self.spotify = Spotify()
         logger.debug("Scale.__init__: Spotify instance created in scale control.")
@@ -59,6 +64,11 @@ class Scale(Canvas):
         self.itemconfig(line, fill=line_color)
         self.itemconfig(self.button, fill=button_color, outline=button_color)  
       
+    def set_theme_color(self, color: str) -> None:
+        """Colors both the line and the button of the scale."""
+        line = self._scale_line_vertical if self.is_vertical else self._scale_line_horizontal
+        self.update_colors(line, color, color)
+      
     def _create_vertical(self):
         y_pos = self._y_position()
         self._scale_line_vertical = self.create_line(7.5, 0, 7.5, self._height, fill="gray", width=3)
@@ -71,6 +81,7 @@ class Scale(Canvas):
         self._scale_line_horizontal = self.create_line(0, 7.5, self._width, 7.5, fill="gray", width=3)
         self.button = self.create_oval(x_pos, 2.5, x_pos + 10, 12.5,
                                         fill="darkgray", outline="darkgray", width=2)
+        self._button_x = x_pos
         logger.debug("Scale._create_horizontal: Horizontal scale created.")
         
     def _y_position(self) -> int:
@@ -91,7 +102,7 @@ class Scale(Canvas):
         if max_value <= new_y <= min_value:
             self.coords(self.button, 2.5, new_y, 12.5, new_y + 10)
             self._scale_value = 100 - int((new_y / self._height) * 100)
-            logger.debug(f"Scale._move_button_vertical: Vertical button moved to {new_y}, scale value updated to {self._scale_value}")
+            logger.debug("Scale._move_button_vertical: Vertical button moved to %s, scale value updated to %s", new_y, self._scale_value)
       
     def _move_button_horizontal(self, event: Event = None) -> None:
         """Move the button and update the value based on the mouse position."""
@@ -102,8 +113,23 @@ class Scale(Canvas):
         min_value = self._width
         if max_value <= new_x <= min_value:
             self.coords(self.button, new_x, 2.5, new_x + 10, 12.5)
+            self._button_x = new_x
             self._scale_value = int((new_x / self._width) * 100)   
-            logger.debug(f"Scale._move_button_horizontal: Horizontal button moved to {new_x}, scale value updated to {self._scale_value}")   
+            logger.debug("Scale._move_button_horizontal: Horizontal button moved to %s, scale value updated to %s", new_x, self._scale_value)   
+    
+    def _set_button_x(self, new_x: int) -> bool:
+        """Moves the horizontal button with a single `coords` call, only if its' pixel position changed.
+        
+        Returns:
+            bool: Whether or not the button moved.
+        """
+        new_x = min(max(new_x, 0), self._width)
+        if new_x == self._button_x:
+            return False
+        self.coords(self.button, new_x, 2.5, new_x + 10, 12.5)
+        self._button_x = new_x
+        self._scale_value = int((new_x / self._width) * 100)
+        return True
     
     @property
     def value(self):
@@ -113,9 +139,9 @@ class Scale(Canvas):
     def value(self, new_val: int):
         if not new_val:
             new_val = 50 if self.is_vertical else 0
-            logger.debug(f"No value passed, defaulting to {new_val}.")
+            logger.debug("No value passed, defaulting to %s.", new_val)
         
-        logger.debug(f"Scale.value.setter: Setting scale value to {new_val}")
+        logger.debug("Scale.value.setter: Setting scale value to %s", new_val)
         
         if self.is_vertical:
             if new_val <= 1:
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 from views.scales import Scale
+from views.frame_scheduler import FrameScheduler
 from logger import logger
 
 class VolumeScale(Scale):
@@ -20,25 +21,26 @@ class VolumeScale(Scale):
         super().__init__(master, "vertical", **kwargs)
         self.bind("<B1-Motion>", self._move_button_vertical)
     
-        self._volume_update_job = None
+        self._scheduler = FrameScheduler.of(master)
+        self._volume_update_job: int = None
         logger.debug(f"VolumeScale.__init__: VolumeScale initialized with master={master} and kwargs={kwargs}")
         
     def load(self):
         self.value = self.spotify.get_volume()
-        logger.debug(f"VolumeScale.load: VolumeScale loaded with initial volume={self.value}")
+        logger.debug("VolumeScale.load: VolumeScale loaded with initial volume=%s", self.value)
         
     def _move_button_vertical(self, event=None) -> None:
-        logger.debug(f"VolumeScale._move_button_vertical: Volume scale moved with event={event}")
+        logger.debug("VolumeScale._move_button_vertical: Volume scale moved with event=%s", event)
         super()._move_button_vertical(event)
         
         if self._volume_update_job:
-            self.after_cancel(self._volume_update_job)
-            logger.debug(f"VolumeScale._move_button_vertical: Volume update job canceled")
+            self._scheduler.cancel(self._volume_update_job)
+            logger.debug("VolumeScale._move_button_vertical: Volume update job canceled")
         
-        self._volume_update_job = self.after(200, self._update_volume)
-        logger.debug(f"VolumeScale._move_button_vertical: Scheduled volume update in 200ms")
+        self._volume_update_job = self._scheduler.call_later(200, self._update_volume)
+        logger.debug("VolumeScale._move_button_vertical: Scheduled volume update in 200ms")
 
     def _update_volume(self):
         self.spotify.set_volume(self.value)
         self._volume_update_job = None
-        logger.debug(f"VolumeScale._update_volume: Volume updated to {self.value}")
+        logger.debug("VolumeScale._update_volume: Volume updated to %s", self.value)
@@ -0,0 +1,109 @@
+# Copyright 2026 Sagi Tsafrir
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import time
+from tkinter import Button, Misc
+from typing import Callable, Union
+
+from logger import logger
+
+BACKGROUND = "background"
+TEXT = "text"
+SCALE = "scale"
+ICON = "icon"
+ROLES = (BACKGROUND, TEXT, SCALE, ICON)
+
+ThemeSetter = Callable[[str], None]
+
+def _default_setter(widget: Misc, role: str) -> ThemeSetter:
+    """The setter a role uses when the widget doesn't provide one."""
+    if role == BACKGROUND:
+        if isinstance(widget, Button):
+            return lambda color: widget.configure(bg=color, activebackground=color)
+        return lambda color: widget.configure(bg=color)
+    if role == TEXT:
+        return lambda color: widget.configure(fg=color)
+    raise ValueError(f"The {role} role has no default setter, pass one.")
+
+class ThemeRegistry():
+    def __init__(self, master: Misc) -> None:
+        """Keeps the widgets of a window by the theme role they take part in.
+
+            Widgets register once at construction, so applying a theme is a single pass over flat lists
+            instead of walking the widget tree. The roles are `background` and `text`, which get the background
+            and text colors, and `scale` and `icon`, which get the text color.
+
+            Args:
+                master (Misc): The window the registry belongs to.
+        """
+        self.master = master
+        self.__setters: dict[str, dict[Misc, ThemeSetter]] = {role: {} for role in ROLES}
+        self.background: Union[str, None] = None
+        self.text: Union[str, None] = None
+
+        master._theme_registry = self
+
+    @classmethod
+    def of(cls, widget: Misc) -> "ThemeRegistry":
+        """Returns the theme registry of the widgets' window, creating one if needed."""
+        window = widget.winfo_toplevel()
+        registry = getattr(window, "_theme_registry", None)
+        if registry is None:
+            registry = cls(window)
+        return registry
+
+    def register(self, widget: Misc, role: str, setter: Union[ThemeSetter, None] = None) -> None:
+        """Registers the widget for a role. It's unregistered automatically when destroyed.
+
+        Args:
+            widget (Misc): The widget.
+            role (str): One of `background`, `text`, `scale` or `icon`.
+            setter (Callable, optional): Applies a color to the widget. `background` and `text` default to
+                configuring `bg` and `fg`.
+        """
+        if role not in ROLES:
+            raise ValueError(f"Invalid theme role '{role}'.")
+        self.__setters[role][widget] = setter or _default_setter(widget, role)
+        if widget is not self.master:
+            widget.bind("<Destroy>", lambda e: self.unregister(widget) if e.widget is widget else None, add="+")
+
+    def unregister(self, widget: Misc) -> None:
+        for setters in self.__setters.values():
+            setters.pop(widget, None)
+
+    def apply(self, background: Union[str, None] = None, text: Union[str, None] = None) -> float:
+        """Applies the colors to every registered widget. Roles whose color isn't given are left as they are.
+
+        Returns:
+            float: How long applying took, in milliseconds.
+        """
+        start = time.perf_counter()
+        colors = {BACKGROUND: background, TEXT: text, SCALE: text, ICON: text}
+        count = 0
+        for role, color in colors.items():
+            if color is None:
+                continue
+            for setter in self.__setters[role].values():
+                setter(color)
+            count += len(self.__setters[role])
+
+        if background is not None:
+            self.background = background
+        if text is not None:
+            self.text = text
+
+        elapsed = (time.perf_counter() - start) * 1000
+        logger.debug(f"ThemeRegistry.apply: Applied the theme to {count} widget roles in {elapsed:.2f}ms.")
+        return elapsed